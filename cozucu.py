@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Bulmaca Çözücü
+OyunMotoru hareket kurallarıyla itme bulmacalarını çözer:
+BFS (en az hareket) ve A* (en az itme)
+"""
+
+import heapq
+import random
+import sys
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from game_lab import GECILEBILIR, ITILEBILIR, ITME_ALANI, TOPLANABILIR
+from kilitlenme import SONSUZ, KilitlenmeAnalizi
+from oyun_motoru import OyunMotoru
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# Hücre türleri (iç ızgara)
+_DUVAR = 0
+_ZEMIN = 1        # Oyuncu girer, nesne itilebilir
+_TOPLANABILIR = 2  # Oyuncu girer (toplar), toplanınca zemin olur
+
+
+class CozumSonucu(NamedTuple):
+    """Çözücü sonucu ve arama istatistikleri"""
+    cozuldu: Optional[bool]   # None: limit aşıldı, karar verilemedi
+    hamleler: str             # OyunMotoru.adimlar ile oynatılabilir WASD dizisi
+    hamle_sayisi: int
+    itme_sayisi: int
+    genisletilen: int         # Genişletilen düğüm sayısı
+    uretilen: int             # Üretilen (kuyruğa giren) düğüm sayısı
+    sure: float               # Saniye
+    dugum_hizi: float         # Genişletilen düğüm / saniye
+    tt_kayit: int             # Transpozisyon tablosundaki kayıt sayısı
+    tt_tahliye: int           # Kapasite dolduğu için atılan kayıt sayısı
+    tt_bellek: int            # Transpozisyon tablosunun yaklaşık bayt boyutu
+    tepe_sinir: int           # Arama sınırının (kuyruk/yığın) en büyük boyu
+
+
+class TranspozisyonTablosu:
+    """Zobrist özeti -> en iyi maliyet; kapasiteyle sınırlı (FIFO tahliye)
+
+    Kayıt atıldığında aynı durum yeniden üretilebilir; arama yine doğru
+    kalır, yalnızca fazladan düğüm genişletilir.
+    """
+
+    def __init__(self, kapasite: int = 2_000_000):
+        self.kapasite = kapasite
+        self._tablo: Dict[int, int] = {}
+        self.tahliye = 0
+
+    def kaydet(self, ozet: int, maliyet: int) -> bool:
+        """Durum yeni ya da daha ucuza bulunduysa kaydet ve True döndür"""
+        tablo = self._tablo
+        eski = tablo.get(ozet)
+        if eski is not None and eski <= maliyet:
+            return False
+        if eski is None and len(tablo) >= self.kapasite:
+            del tablo[next(iter(tablo))]
+            self.tahliye += 1
+        tablo[ozet] = maliyet
+        return True
+
+    def __len__(self) -> int:
+        return len(self._tablo)
+
+    def bellek(self) -> int:
+        """Tablonun yaklaşık bayt boyutu (sözlük + anahtar/değer nesneleri)"""
+        return sys.getsizeof(self._tablo) + len(self._tablo) * 2 * 32
+
+
+class BulmacaCozucu:
+    """Bir OyunMotoru'nun güncel durumundan başlayarak bulmacayı çözer
+
+    Durum: oyuncu hücresi + sıralı itilebilir nesne hücreleri (+ toplanan
+    öğelerin bit maskesi). Hücreler, kenarlarına duvar eklenmiş ızgarada
+    düz indekslerle tutulur.
+    """
+
+    def __init__(self, motor: OyunMotoru, tt_kapasite: int = 2_000_000,
+                 tohum: int = 0x5EED):
+        self.motor = motor
+        self.tt_kapasite = tt_kapasite
+        self._izgara_olustur()
+        self._zobrist_olustur(tohum)
+        # Ölü kareler / donma kilitlenmeleri (aynı kenarlı ızgara düzeni)
+        self.kilit = KilitlenmeAnalizi.motordan(motor)
+        self._itme_mesafeleri = self.kilit.itme_mesafeleri
+        # Tek hedefte oyuncu kendisi örtebildiği için kilitlenme olmaz
+        self._kilit_budama = len(self.hedefler) > 1
+
+    # ------------------------------------------------------------------
+    # Hazırlık
+    # ------------------------------------------------------------------
+
+    def _izgara_olustur(self):
+        """Motor haritasından durağan ızgarayı ve başlangıç durumunu çıkar"""
+        harita = self.motor.harita
+        bayraklar = self.motor._bayraklar
+        self._baslangic_haritasi = [list(satir) for satir in harita]
+        yukseklik = len(harita)
+        genislik = max((len(satir) for satir in harita), default=0)
+        self.genislik = genislik + 2
+        self.yukseklik = yukseklik + 2
+        g = self.genislik
+
+        self.hucreler = [_DUVAR] * (self.genislik * self.yukseklik)
+        self.toplanabilir_biti: Dict[int, int] = {}
+        kutular = []
+        for y, satir in enumerate(harita):
+            for x, karakter in enumerate(satir):
+                i = (y + 1) * g + (x + 1)
+                bayrak = bayraklar.get(karakter, 0)
+                if bayrak & ITILEBILIR:
+                    kutular.append(i)
+                    self.hucreler[i] = _ZEMIN
+                elif bayrak & TOPLANABILIR:
+                    self.toplanabilir_biti[i] = len(self.toplanabilir_biti)
+                    self.hucreler[i] = _TOPLANABILIR
+                elif bayrak & (GECILEBILIR | ITME_ALANI):
+                    self.hucreler[i] = _ZEMIN
+
+        oyuncu = (self.motor.oyuncu_y + 1) * g + (self.motor.oyuncu_x + 1)
+        self.hucreler[oyuncu] = _ZEMIN
+        self.hedefler = frozenset((y + 1) * g + (x + 1)
+                                  for x, y in self.motor.hedef_konumlari())
+        self.baslangic = (oyuncu, tuple(sorted(kutular)), 0)
+
+        # Yönler: (indeks farkı, komut harfi)
+        self.yonler = ((-g, "W"), (-1, "A"), (g, "S"), (1, "D"))
+
+    def _zobrist_olustur(self, tohum: int):
+        """Hücre/öğe başına 64 bitlik rastgele Zobrist anahtarları"""
+        rng = random.Random(tohum)
+        n = len(self.hucreler)
+        self._z_oyuncu = [rng.getrandbits(64) for _ in range(n)]
+        self._z_kutu = [rng.getrandbits(64) for _ in range(n)]
+        self._z_toplanan = [rng.getrandbits(64) for _ in range(len(self.toplanabilir_biti))]
+
+    def ozet(self, oyuncu: int, kutular: Tuple[int, ...], toplanan: int) -> int:
+        """Bir durumun Zobrist özeti"""
+        h = self._z_oyuncu[oyuncu]
+        for k in kutular:
+            h ^= self._z_kutu[k]
+        bit = 0
+        while toplanan >> bit:
+            if toplanan >> bit & 1:
+                h ^= self._z_toplanan[bit]
+            bit += 1
+        return h
+
+    @staticmethod
+    def durum_kodla(oyuncu: int, kutular: Tuple[int, ...], toplanan: int = 0) -> bytes:
+        """Durumun kompakt ikili kodlaması (oyuncu + sıralı kutular + maske)"""
+        from array import array
+        return array("I", (oyuncu, toplanan, *sorted(kutular))).tobytes()
+
+    def _kutu_girebilir(self, i: int, toplanan: int) -> bool:
+        """İtilen nesne bu hücreye girebilir mi? (diğer nesneler hariç)"""
+        tur = self.hucreler[i]
+        if tur == _ZEMIN:
+            return True
+        if tur == _TOPLANABILIR:
+            return bool(toplanan >> self.toplanabilir_biti[i] & 1)
+        return False
+
+    def _sezgisel(self, kutular: Tuple[int, ...]) -> float:
+        """Kabul edilebilir alt sınır: en yakın (hedef-1) nesnenin itme mesafeleri
+
+        Oyuncu bir hedefi kendisi örtebilir; kalan her hedef ayrı bir nesne
+        ister. Yeterli sayıda nesne hedefe ulaşamıyorsa SONSUZ (kilitlenme).
+        """
+        gereken = len(self.hedefler) - 1
+        if gereken <= 0:
+            return 0
+        mesafeler = sorted(self._itme_mesafeleri[k] for k in kutular)
+        if len(mesafeler) < gereken:
+            return SONSUZ
+        return sum(mesafeler[:gereken])
+
+    def _kilitlendi_mi(self, itilen: int, kutular: Tuple[int, ...]) -> bool:
+        """Son itme durumu kazanılamaz yaptı mı? (ölü kare / donma budaması)"""
+        if not self._kilit_budama:
+            return False
+        kilit = self.kilit
+        if not kilit.olu[itilen] and not kilit.donmus_mu(itilen, kutular):
+            return False
+        return kilit.kilitli_mi(kutular)
+
+    def _kazanildi_mi(self, oyuncu: int, kutular: Tuple[int, ...]) -> bool:
+        """Tüm hedefler oyuncu veya nesnelerle örtülü mü?"""
+        for h in self.hedefler:
+            if h != oyuncu and h not in kutular:
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # BFS: en az hareket
+    # ------------------------------------------------------------------
+
+    def bfs_coz(self, max_dugum: int = 1_000_000,
+                sure_limiti: Optional[float] = None) -> CozumSonucu:
+        """Hareket sayısı en az olan çözümü genişlik öncelikli arama ile bul"""
+        baslangic_zamani = time.perf_counter()
+        tt = TranspozisyonTablosu(self.tt_kapasite)
+        hucreler = self.hucreler
+        bitler = self.toplanabilir_biti
+        z_oyuncu, z_kutu, z_toplanan = self._z_oyuncu, self._z_kutu, self._z_toplanan
+        yonler = self.yonler
+
+        oyuncu, kutular, toplanan = self.baslangic
+        ozet = self.ozet(oyuncu, kutular, toplanan)
+        tt.kaydet(ozet, 0)
+        # Düğüm: (oyuncu, kutular, toplanan, özet, derinlik, yol)
+        # yol: (önceki_yol, harf) bağlı listesi; düğümler yolu paylaşır
+        kuyruk = deque([(oyuncu, kutular, toplanan, ozet, 0, None)])
+        genisletilen = 0
+        uretilen = 1
+        tepe = 1
+        cozum = None
+        karar = False
+
+        if self._kazanildi_mi(oyuncu, kutular):
+            cozum = (None, 0)
+            karar = True
+
+        while kuyruk and cozum is None:
+            if genisletilen >= max_dugum:
+                break
+            if sure_limiti is not None and not genisletilen & 1023 and \
+                    time.perf_counter() - baslangic_zamani > sure_limiti:
+                break
+            oyuncu, kutular, toplanan, ozet, derinlik, yol = kuyruk.popleft()
+            genisletilen += 1
+
+            for d, harf in yonler:
+                yeni = oyuncu + d
+                tur = hucreler[yeni]
+                if tur == _DUVAR:
+                    continue
+                yeni_kutular = kutular
+                yeni_toplanan = toplanan
+                yeni_ozet = ozet ^ z_oyuncu[oyuncu] ^ z_oyuncu[yeni]
+                if yeni in kutular:
+                    arka = yeni + d
+                    if arka in kutular or not self._kutu_girebilir(arka, toplanan):
+                        continue
+                    yeni_kutular = tuple(sorted(arka if k == yeni else k for k in kutular))
+                    if self._kilitlendi_mi(arka, yeni_kutular):
+                        continue
+                    yeni_ozet ^= z_kutu[yeni] ^ z_kutu[arka]
+                elif tur == _TOPLANABILIR:
+                    bit = bitler[yeni]
+                    if not toplanan >> bit & 1:
+                        yeni_toplanan = toplanan | (1 << bit)
+                        yeni_ozet ^= z_toplanan[bit]
+
+                if not tt.kaydet(yeni_ozet, derinlik + 1):
+                    continue
+                yeni_yol = (yol, harf)
+                uretilen += 1
+                if self._kazanildi_mi(yeni, yeni_kutular):
+                    cozum = (yeni_yol, derinlik + 1)
+                    karar = True
+                    break
+                kuyruk.append((yeni, yeni_kutular, yeni_toplanan, yeni_ozet,
+                               derinlik + 1, yeni_yol))
+            if len(kuyruk) > tepe:
+                tepe = len(kuyruk)
+
+        if cozum is None and not kuyruk:
+            karar = True  # Tüm durum uzayı tarandı: çözüm yok
+        hamleler = self._yolu_coz(cozum[0]) if cozum else ""
+        return self._sonuc(cozum is not None if karar else None, hamleler,
+                           genisletilen, uretilen, baslangic_zamani, tt, tepe)
+
+    # ------------------------------------------------------------------
+    # A*: en az itme
+    # ------------------------------------------------------------------
+
+    def _bolge(self, oyuncu: int, kutular: Tuple[int, ...], toplanan: int):
+        """İtmeden ulaşılabilen hücreler; yoldaki öğeler toplanır"""
+        hucreler = self.hucreler
+        bitler = self.toplanabilir_biti
+        gorulen = {oyuncu}
+        yigin = [oyuncu]
+        while yigin:
+            i = yigin.pop()
+            for d, _ in self.yonler:
+                j = i + d
+                if j in gorulen or hucreler[j] == _DUVAR or j in kutular:
+                    continue
+                gorulen.add(j)
+                yigin.append(j)
+                if hucreler[j] == _TOPLANABILIR:
+                    toplanan |= 1 << bitler[j]
+        return gorulen, toplanan
+
+    def astar_coz(self, max_dugum: int = 1_000_000,
+                  sure_limiti: Optional[float] = None) -> CozumSonucu:
+        """İtme sayısı en az olan çözümü A* ile bul"""
+        baslangic_zamani = time.perf_counter()
+        tt = TranspozisyonTablosu(self.tt_kapasite)
+        z_kutu, z_oyuncu, z_toplanan = self._z_kutu, self._z_oyuncu, self._z_toplanan
+        yonler = self.yonler
+
+        oyuncu, kutular, toplanan = self.baslangic
+        h0 = self._sezgisel(kutular)
+        # Düğüm: (f, sıra, g, oyuncu, kutular, toplanan, yol)
+        # yol: (önceki_yol, (oyuncunun durduğu hücre, itme yönü))
+        acik = [(h0, 0, 0, oyuncu, kutular, toplanan, None)] if h0 != SONSUZ else []
+        sira = 1
+        genisletilen = 0
+        uretilen = len(acik)
+        tepe = len(acik)
+        cozum = None
+
+        while acik:
+            if genisletilen >= max_dugum:
+                break
+            if sure_limiti is not None and not genisletilen & 1023 and \
+                    time.perf_counter() - baslangic_zamani > sure_limiti:
+                break
+            _, _, g, oyuncu, kutular, toplanan, yol = heapq.heappop(acik)
+            bolge, toplanan = self._bolge(oyuncu, kutular, toplanan)
+            normal = min(bolge)
+            ozet = z_oyuncu[normal]
+            for k in kutular:
+                ozet ^= z_kutu[k]
+            for bit in range(len(z_toplanan)):
+                if toplanan >> bit & 1:
+                    ozet ^= z_toplanan[bit]
+            if not tt.kaydet(ozet, g):
+                continue
+            genisletilen += 1
+
+            acik_kalan = [h for h in self.hedefler if h not in kutular]
+            if not acik_kalan or (len(acik_kalan) == 1 and acik_kalan[0] in bolge):
+                cozum = (yol,)
+                break
+
+            for i in bolge:
+                for d, _ in yonler:
+                    kutu = i + d
+                    if kutu not in kutular:
+                        continue
+                    arka = kutu + d
+                    if arka in kutular or not self._kutu_girebilir(arka, toplanan):
+                        continue
+                    yeni_kutular = tuple(sorted(arka if k == kutu else k for k in kutular))
+                    if self._kilitlendi_mi(arka, yeni_kutular):
+                        continue
+                    h = self._sezgisel(yeni_kutular)
+                    if h == SONSUZ:
+                        continue
+                    heapq.heappush(acik, (g + 1 + h, sira, g + 1, kutu, yeni_kutular,
+                                          toplanan, (yol, (i, d))))
+                    sira += 1
+                    uretilen += 1
+            if len(acik) > tepe:
+                tepe = len(acik)
+
+        karar = cozum is not None or not acik
+        hamleler = self._itme_yolunu_coz(cozum[0]) if cozum is not None else ""
+        return self._sonuc(cozum is not None if karar else None, hamleler,
+                           genisletilen, uretilen, baslangic_zamani, tt, tepe)
+
+    # ------------------------------------------------------------------
+    # Yol çıkarma
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _yolu_coz(yol) -> str:
+        """Bağlı liste yolu harf dizisine çevir"""
+        harfler = []
+        while yol is not None:
+            yol, harf = yol
+            harfler.append(harf)
+        return "".join(reversed(harfler))
+
+    def _yuru(self, baslangic: int, hedef: int, kutular: Tuple[int, ...]) -> str:
+        """Nesnelere dokunmadan baslangic -> hedef en kısa yürüme yolu"""
+        if baslangic == hedef:
+            return ""
+        onceki = {baslangic: None}
+        kuyruk = deque([baslangic])
+        while kuyruk:
+            i = kuyruk.popleft()
+            for d, harf in self.yonler:
+                j = i + d
+                if j in onceki or self.hucreler[j] == _DUVAR or j in kutular:
+                    continue
+                onceki[j] = (i, harf)
+                if j == hedef:
+                    harfler = []
+                    while onceki[j] is not None:
+                        j, harf = onceki[j]
+                        harfler.append(harf)
+                    return "".join(reversed(harfler))
+                kuyruk.append(j)
+        raise ValueError("Yürüme yolu bulunamadı")
+
+    def _ogeleri_topla(self, oyuncu: int, kutular: Tuple[int, ...], toplanan: int):
+        """Bölgedeki toplanmamış tüm öğeleri sırayla topla (A* varsayımıyla aynı)"""
+        harfler = []
+        bolge, _ = self._bolge(oyuncu, kutular, toplanan)
+        for i in sorted(bolge):
+            bit = self.toplanabilir_biti.get(i)
+            if bit is None or toplanan >> bit & 1:
+                continue
+            harfler.append(self._yuru(oyuncu, i, kutular))
+            oyuncu = i
+            toplanan |= 1 << bit
+        return "".join(harfler), oyuncu, toplanan
+
+    def _itme_yolunu_coz(self, yol) -> str:
+        """İtme dizisini başlangıçtan yeniden oynatıp tam WASD dizisine çevir"""
+        itmeler = []
+        while yol is not None:
+            yol, itme = yol
+            itmeler.append(itme)
+        itmeler.reverse()
+
+        harf_bul = {d: harf for d, harf in self.yonler}
+        oyuncu, kutular, toplanan = self.baslangic
+        parcalar = []
+        for durulan, d in itmeler:
+            if self.toplanabilir_biti:
+                harfler, oyuncu, toplanan = self._ogeleri_topla(oyuncu, kutular, toplanan)
+                parcalar.append(harfler)
+            parcalar.append(self._yuru(oyuncu, durulan, kutular))
+            parcalar.append(harf_bul[d])
+            kutu = durulan + d
+            kutular = tuple(sorted(kutu + d if k == kutu else k for k in kutular))
+            oyuncu = kutu
+
+        acik_kalan = [h for h in self.hedefler if h not in kutular]
+        if acik_kalan:
+            parcalar.append(self._yuru(oyuncu, acik_kalan[0], kutular))
+        return "".join(parcalar)
+
+    def _sonuc(self, cozuldu, hamleler, genisletilen, uretilen,
+               baslangic_zamani, tt, tepe) -> CozumSonucu:
+        """İstatistiklerle birlikte sonuç kaydı oluştur"""
+        sure = time.perf_counter() - baslangic_zamani
+        itme = 0
+        if hamleler:
+            motor = OyunMotoru(self._baslangic_haritasi, self.motor.karakter_sistemi,
+                               hedefler=self.motor.hedef_konumlari())
+            motor.adimlar(hamleler)
+            itme = motor.itme_sayisi
+        return CozumSonucu(
+            cozuldu=cozuldu,
+            hamleler=hamleler,
+            hamle_sayisi=len(hamleler),
+            itme_sayisi=itme,
+            genisletilen=genisletilen,
+            uretilen=uretilen,
+            sure=sure,
+            dugum_hizi=genisletilen / sure if sure > 0 else 0.0,
+            tt_kayit=len(tt),
+            tt_tahliye=tt.tahliye,
+            tt_bellek=tt.bellek(),
+            tepe_sinir=tepe,
+        )
+
+
+def coz(harita: List[List[str]], karakter_sistemi=None, yontem: str = "bfs",
+        hedefler=None, **limitler) -> CozumSonucu:
+    """Kısayol: haritayı 'bfs' (en az hareket) veya 'astar' (en az itme) ile çöz"""
+    cozucu = BulmacaCozucu(OyunMotoru(harita, karakter_sistemi, hedefler=hedefler))
+    if yontem == "astar":
+        return cozucu.astar_coz(**limitler)
+    return cozucu.bfs_coz(**limitler)
+
+
+def main():
+    """Örnek haritaları çöz ve istatistikleri göster"""
+    import ornek_haritalar
+    from game_lab import paylasilan_sistem
+
+    print("🧩 Unicode Game Lab - Bulmaca Çözücü\n")
+    lab = paylasilan_sistem()
+
+    for n in range(1, 7):
+        harita = getattr(ornek_haritalar, f"ornek_harita_{n}")
+        print(f"🗺️  Harita {n}")
+        for yontem in ("bfs", "astar"):
+            sonuc = coz(harita, lab, yontem)
+            durum = {True: "✅ Çözülebilir", False: "❌ Çözümsüz", None: "⏱️  Limit aşıldı"}
+            print(f"   {yontem:5} {durum[sonuc.cozuldu]} | hareket: {sonuc.hamle_sayisi} "
+                  f"| itme: {sonuc.itme_sayisi} | düğüm: {sonuc.genisletilen} "
+                  f"({sonuc.dugum_hizi:,.0f}/sn) | TT: {sonuc.tt_kayit} kayıt, "
+                  f"~{sonuc.tt_bellek // 1024} KB")
+        print()
+
+
+if __name__ == "__main__":
+    main()
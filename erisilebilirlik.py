@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Erişilebilirlik İndeksi
+Oyuncunun hiçbir şey itmeden yürüyebildiği hücreleri bağlantılı bölgelere
+ayırır; "bu iki hücre birbirine ulaşabilir mi?" sorusu O(1) cevaplanır.
+Hücreler değiştikçe (itme, geri alma) yalnızca etkilenen bölgeler
+güncellenir.
+"""
+
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+from game_lab import GECILEBILIR, OYUNCU
+
+# Oyuncunun durabileceği hücreler: geçilebilirler ve oyuncunun kendi hücresi
+YURUNEBILIR = GECILEBILIR | OYUNCU
+
+
+class ErisimIndeksi:
+    """Yürünebilir hücrelerin etiketli bağlantılı bileşenleri
+
+    Hücreler kenarlarına duvar eklenmiş ızgarada (y + 1) * genislik + (x + 1)
+    düz indeksleriyle tutulur (KilitlenmeAnalizi ile aynı düzen). etiket[i]
+    0 ise hücre kapalıdır; aynı pozitif etiketi taşıyan hücreler birbirine
+    yürünerek ulaşılabilir.
+
+    Güncellemeler:
+      - Açılan hücre komşu bölgeleri birleştirir; küçük bölgeler büyüğün
+        etiketine geçer.
+      - Kapanan hücrenin komşularından eş zamanlı aramalar başlatılır.
+        Aramalar buluşursa bölge bölünmemiştir; biri tükenirse tükenen
+        parça yeni etiket alır. Maliyet, ayrılan küçük parçanın boyutuyla
+        sınırlıdır.
+    """
+
+    def __init__(self, harita, bayraklar: Dict[str, int]):
+        self.genislik = max((len(satir) for satir in harita), default=0) + 2
+        self.yukseklik = len(harita) + 2
+        g = self.genislik
+        self._bayraklar = bayraklar
+        self.yonler = (-g, -1, g, 1)
+
+        acik = bytearray(self.genislik * self.yukseklik)
+        for y, satir in enumerate(harita):
+            taban = (y + 1) * g + 1
+            for x, karakter in enumerate(satir):
+                if bayraklar.get(karakter, 0) & YURUNEBILIR:
+                    acik[taban + x] = 1
+
+        self.etiket: List[int] = [0] * len(acik)
+        self.boyutlar: Dict[int, int] = {}  # Etiket -> hücre sayısı
+        self._sonraki_etiket = 1
+        for i in range(len(acik)):
+            if acik[i] and not self.etiket[i]:
+                self._doldur(i, acik)
+
+    @classmethod
+    def motordan(cls, motor) -> "ErisimIndeksi":
+        """Bir OyunMotoru'nun güncel haritasından indeks oluştur"""
+        return cls(motor.harita, motor._bayraklar)
+
+    def indeks(self, x: int, y: int) -> int:
+        """Harita koordinatını ızgara indeksine çevir"""
+        return (y + 1) * self.genislik + (x + 1)
+
+    def _yeni_etiket(self) -> int:
+        etiket = self._sonraki_etiket
+        self._sonraki_etiket += 1
+        return etiket
+
+    def _doldur(self, baslangic: int, acik: bytearray):
+        """İlk kurulum: baslangic'ın bileşenini yeni bir etiketle doldur"""
+        etiket = self.etiket
+        yeni = self._yeni_etiket()
+        etiket[baslangic] = yeni
+        kuyruk = [baslangic]
+        for i in kuyruk:
+            for d in self.yonler:
+                j = i + d
+                if acik[j] and not etiket[j]:
+                    etiket[j] = yeni
+                    kuyruk.append(j)
+        self.boyutlar[yeni] = len(kuyruk)
+
+    def _yeniden_etiketle(self, baslangic: int, eski: int, yeni: int) -> int:
+        """baslangic'tan eski etiketli bağlı hücreleri yeni etikete geçir"""
+        etiket = self.etiket
+        etiket[baslangic] = yeni
+        kuyruk = [baslangic]
+        for i in kuyruk:
+            for d in self.yonler:
+                j = i + d
+                if etiket[j] == eski:
+                    etiket[j] = yeni
+                    kuyruk.append(j)
+        return len(kuyruk)
+
+    # ------------------------------------------------------------------
+    # Artımlı güncelleme
+    # ------------------------------------------------------------------
+
+    def hucre_degisti(self, x: int, y: int, karakter: str):
+        """(x, y)'ye karakter yazıldı: yürünebilirlik değiştiyse indeksi güncelle"""
+        i = self.indeks(x, y)
+        yurunebilir = bool(self._bayraklar.get(karakter, 0) & YURUNEBILIR)
+        if yurunebilir and not self.etiket[i]:
+            self._ac(i)
+        elif not yurunebilir and self.etiket[i]:
+            self._kapat(i)
+
+    def _ac(self, i: int):
+        """Hücre yürünebilir oldu: komşu bölgeleri en büyüğünde birleştir"""
+        etiket = self.etiket
+        komsular = {etiket[i + d] for d in self.yonler} - {0}
+        if not komsular:
+            yeni = self._yeni_etiket()
+            etiket[i] = yeni
+            self.boyutlar[yeni] = 1
+            return
+        buyuk = max(komsular, key=self.boyutlar.__getitem__)
+        etiket[i] = buyuk
+        self.boyutlar[buyuk] += 1
+        for kucuk in komsular - {buyuk}:
+            boyut = self.boyutlar.pop(kucuk)
+            for d in self.yonler:
+                if etiket[i + d] == kucuk:
+                    self._yeniden_etiketle(i + d, kucuk, buyuk)
+                    break
+            self.boyutlar[buyuk] += boyut
+
+    def _kapat(self, i: int):
+        """Hücre kapandı: bölge bölündüyse ayrılan parçalara yeni etiket ver"""
+        etiket = self.etiket
+        eski = etiket[i]
+        etiket[i] = 0
+        self.boyutlar[eski] -= 1
+        if not self.boyutlar[eski]:
+            del self.boyutlar[eski]
+            return
+        baslangiclar = [i + d for d in self.yonler if etiket[i + d] == eski]
+        if len(baslangiclar) < 2:
+            return
+
+        # Her komşudan bir arama; buluşan aramalar aynı gruba birleşir
+        n = len(baslangiclar)
+        grup = list(range(n))
+
+        def kok(a: int) -> int:
+            while grup[a] != a:
+                grup[a] = grup[grup[a]]
+                a = grup[a]
+            return a
+
+        ziyaret: Dict[int, int] = {}
+        kuyruklar = []
+        for arama, bas in enumerate(baslangiclar):
+            if bas in ziyaret:
+                grup[kok(arama)] = kok(ziyaret[bas])
+                kuyruklar.append(deque())
+            else:
+                ziyaret[bas] = arama
+                kuyruklar.append(deque([bas]))
+
+        # Tek aktif grup kalınca dur: diğer gruplar kendi parçalarını tüketmiştir
+        while True:
+            aktif = {kok(a) for a in range(n) if kuyruklar[a]}
+            if len(aktif) <= 1:
+                break
+            for arama in range(n):
+                kuyruk = kuyruklar[arama]
+                if not kuyruk:
+                    continue
+                h = kuyruk.popleft()
+                for d in self.yonler:
+                    j = h + d
+                    if etiket[j] != eski:
+                        continue
+                    diger = ziyaret.get(j)
+                    if diger is None:
+                        ziyaret[j] = arama
+                        kuyruk.append(j)
+                    elif kok(diger) != kok(arama):
+                        grup[kok(diger)] = kok(arama)
+
+        ayrilanlar = {kok(a) for a in range(n)} - aktif
+        if not aktif:
+            # Tüm aramalar aynı anda tükendi: biri eski etiketi korur
+            aktif = {ayrilanlar.pop()}
+        for kok_arama in ayrilanlar:
+            hucreler = [h for h, arama in ziyaret.items() if kok(arama) == kok_arama]
+            yeni = self._yeni_etiket()
+            for h in hucreler:
+                etiket[h] = yeni
+            self.boyutlar[yeni] = len(hucreler)
+            self.boyutlar[eski] -= len(hucreler)
+
+    # ------------------------------------------------------------------
+    # Sorgular (harita koordinatlarıyla)
+    # ------------------------------------------------------------------
+
+    def bolge(self, x: int, y: int) -> int:
+        """Hücrenin bölge etiketi (kapalı ya da harita dışıysa 0)"""
+        if not (0 <= x < self.genislik - 2 and 0 <= y < self.yukseklik - 2):
+            return 0
+        return self.etiket[self.indeks(x, y)]
+
+    def ulasilabilir_mi(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """(x1, y1)'den (x2, y2)'ye hiçbir şey itmeden yürünebilir mi? (O(1))"""
+        bolge = self.bolge(x1, y1)
+        return bolge != 0 and bolge == self.bolge(x2, y2)
+
+    def bolge_boyutu(self, x: int, y: int) -> int:
+        """Hücrenin bulunduğu bölgedeki hücre sayısı (O(1))"""
+        return self.boyutlar.get(self.bolge(x, y), 0)
+
+    def bolge_sayisi(self) -> int:
+        """Yürünebilir bölge sayısı"""
+        return len(self.boyutlar)
+
+    def bolge_hucreleri(self, x: int, y: int) -> Set[Tuple[int, int]]:
+        """Hücrenin bölgesindeki tüm (x, y) konumları"""
+        bolge = self.bolge(x, y)
+        if not bolge:
+            return set()
+        g = self.genislik
+        return {(i % g - 1, i // g - 1) for i, e in enumerate(self.etiket) if e == bolge}
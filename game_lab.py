@@ -5,10 +5,19 @@ Unicode Game Lab - Karakter Anlam Sistemi
 Python ve JSON kullanarak karakter tabanlı oyun öğelerini yönetir
 """
 
+import hashlib
+import itertools
 import json
 import os
+import pickle
 import sys
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy yoksa harita analizi saf Python ile yapılır
+    np = None
 
 # Windows konsolunda UTF-8 desteği için
 if sys.platform == 'win32':
@@ -19,29 +28,85 @@ if sys.platform == 'win32':
         pass  # Eski Python versiyonları için
 
 
+# Karakter özellik bayrakları (bit maskeleri)
+# Motor "buraya basabilir miyim?" sorusunu tek bir AND ile cevaplar
+GECILEBILIR = 1 << 0   # Oyuncu üzerine basabilir
+ITILEBILIR = 1 << 1    # Oyuncu tarafından itilebilir
+HEDEF = 1 << 2         # Hedef hücresi
+OYUNCU = 1 << 3        # Oyuncu karakteri
+TEHLIKE = 1 << 4       # Zarar veren öğe (diken, tuzak, lav, asit)
+TOPLANABILIR = 1 << 5  # Üzerine basınca toplanan öğe (anahtar, enerji)
+ITME_ALANI = 1 << 6    # İtilen nesne bu hücreye girebilir
+
+# Özellik adından bayrak maskesine dönüşüm tablosu
+OZELLIK_BAYRAKLARI = {
+    "Boş": GECILEBILIR | ITME_ALANI,
+    "Su": GECILEBILIR | ITME_ALANI,
+    "Hedef": GECILEBILIR | ITME_ALANI | HEDEF,
+    "Anahtar": GECILEBILIR | TOPLANABILIR,
+    "Enerji": GECILEBILIR | TOPLANABILIR,
+    "İtilebilir": ITILEBILIR,
+    "Yönlü İtilebilir": ITILEBILIR,
+    "Oyuncu": OYUNCU,
+    "Diken": TEHLIKE,
+    "Tuzak": TEHLIKE,
+    "Lav": TEHLIKE,
+    "Asit": TEHLIKE,
+}
+
+# Derlenmiş tablo önbelleğinin biçim sürümü (tablo yapısı değişince artırılır)
+ONBELLEK_SURUMU = 1
+
+
+def _json_yolu(json_dosya: str) -> str:
+    """Göreceli yolları script'in bulunduğu dizine göre çöz"""
+    if os.path.isabs(json_dosya):
+        return json_dosya
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, json_dosya)
+
+
+def onbellek_yolu(json_path: str) -> str:
+    """JSON dosyasının yanındaki derlenmiş önbellek dosyasının yolu"""
+    return os.path.splitext(json_path)[0] + ".onbellek"
+
+
 class KarakterAnlamSistemi:
     """Karakter anlamlarını JSON'dan okuyup yöneten sınıf"""
     
-    def __init__(self, json_dosya: str = "karakter_anlamlari.json"):
-        """JSON dosyasından karakter anlamlarını yükle"""
+    def __init__(self, json_dosya: str = "karakter_anlamlari.json", onbellek: bool = True):
+        """JSON dosyasından karakter anlamlarını yükle
+
+        onbellek=False ise derlenmiş önbellek ne okunur ne yazılır.
+        """
         self.json_dosya = json_dosya
         self.karakter_veritabani = {}
         self.kategori_veritabani = {}
-        self._json_yukle()
-    
-    def _json_yukle(self):
-        """JSON dosyasını yükle ve veritabanlarını oluştur"""
-        # JSON dosyasının tam yolunu bul
-        if not os.path.isabs(self.json_dosya):
-            # Göreceli yol ise, script'in bulunduğu dizinde ara
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(script_dir, self.json_dosya)
-        else:
-            json_path = self.json_dosya
+        # Derlenmiş tablolar: karakter -> karo ID, karo ID -> karakter / bayrak
+        self.karakter_idleri: Dict[str, int] = {}
+        self.id_karakterleri: List[str] = []
+        self.bayrak_tablosu: List[int] = []
+        self.bayrak_haritasi: Dict[str, int] = {}
+        # Karakter veritabanı her değiştiğinde artar (önbellek geçersizleme)
+        self.surum = 0
+        # Vektörel analiz tabloları: (surum, ID sayısı, özellik adları, ID -> özellik, ID -> bayrak)
+        self._analiz_tablolari = None
         
+        json_path = _json_yolu(json_dosya)
+        if onbellek and self._onbellekten_yukle(json_path):
+            print(f"✅ {len(self.karakter_veritabani)} karakter yüklendi!")
+        elif self._json_yukle(json_path):
+            self._tablolari_derle()
+            if onbellek:
+                self._onbellege_yaz(json_path)
+        else:
+            self._tablolari_derle()
+    
+    def _json_yukle(self, json_path: str) -> bool:
+        """JSON dosyasını yükle ve veritabanlarını oluştur (başarılıysa True)"""
         if not os.path.exists(json_path):
             print(f"⚠️  Uyarı: {json_path} dosyası bulunamadı!")
-            return
+            return False
         
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
@@ -75,11 +140,104 @@ class KarakterAnlamSistemi:
                             }
             
             print(f"✅ {len(self.karakter_veritabani)} karakter yüklendi!")
+            return True
             
         except json.JSONDecodeError as e:
             print(f"❌ JSON hatası: {e}")
         except Exception as e:
             print(f"❌ Hata: {e}")
+        return False
+    
+    # Önbellekteki tablolar (bu sırayla saklanır)
+    _ONBELLEK_ALANLARI = ("kategori_veritabani", "karakter_veritabani", "karakter_idleri",
+                          "id_karakterleri", "bayrak_tablosu", "bayrak_haritasi")
+    
+    def _onbellekten_yukle(self, json_path: str) -> bool:
+        """Güncel bir önbellek varsa tüm tabloları oradan al (JSON ayrıştırılmaz)
+        
+        Önbellek, JSON'ın mtime ve boyutu aynıysa doğrudan geçerlidir; farklıysa
+        (örn. git checkout sonrası) içerik özeti karşılaştırılır ve özet aynıysa
+        önbellek yeni zaman damgasıyla yeniden yazılır.
+        """
+        try:
+            durum = os.stat(json_path)
+            with open(onbellek_yolu(json_path), 'rb') as f:
+                surum, mtime, boyut, ozet, tablolar = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError,
+                AttributeError, ImportError):
+            return False
+        if surum != ONBELLEK_SURUMU or len(tablolar) != len(self._ONBELLEK_ALANLARI):
+            return False
+        
+        if (mtime, boyut) != (durum.st_mtime_ns, durum.st_size):
+            try:
+                with open(json_path, 'rb') as f:
+                    if hashlib.sha256(f.read()).hexdigest() != ozet:
+                        return False
+            except OSError:
+                return False
+            self._onbellege_yaz(json_path, ozet, tablolar)
+        
+        for alan, deger in zip(self._ONBELLEK_ALANLARI, tablolar):
+            setattr(self, alan, deger)
+        return True
+    
+    def _onbellege_yaz(self, json_path: str, ozet: Optional[str] = None,
+                       tablolar: Optional[tuple] = None):
+        """Derlenmiş tabloları JSON'ın yanına yaz (yazılamazsa sessizce geç)"""
+        hedef = onbellek_yolu(json_path)
+        gecici = f"{hedef}.{os.getpid()}.tmp"
+        try:
+            with open(json_path, 'rb') as f:
+                icerik = f.read()
+            durum = os.stat(json_path)
+            if ozet is None:
+                ozet = hashlib.sha256(icerik).hexdigest()
+            if tablolar is None:
+                tablolar = tuple(getattr(self, alan) for alan in self._ONBELLEK_ALANLARI)
+            with open(gecici, 'wb') as f:
+                pickle.dump((ONBELLEK_SURUMU, durum.st_mtime_ns, durum.st_size, ozet, tablolar),
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(gecici, hedef)  # Yarım yazılmış önbellek okunmasın
+        except OSError:
+            try:
+                os.remove(gecici)
+            except OSError:
+                pass
+    
+    def _tablolari_derle(self):
+        """Karakter veritabanını yoğun karo ID ve bayrak tablolarına derle"""
+        self.karakter_idleri = {}
+        self.id_karakterleri = []
+        self.bayrak_tablosu = []
+        self.bayrak_haritasi = {}
+        # ID 0 her zaman boş alandır; bilinmeyen karakterler sonradan eklenir
+        self.karakter_id(" ")
+        for karakter in self.karakter_veritabani:
+            self.karakter_id(karakter)
+    
+    def _bayrak_hesapla(self, karakter: str) -> int:
+        """Bir karakterin bayrak maskesini veritabanından hesapla"""
+        bilgi = self.karakter_veritabani.get(karakter)
+        if not bilgi:
+            return 0
+        return OZELLIK_BAYRAKLARI.get(bilgi.get("ozellik", ""), 0)
+    
+    def karakter_id(self, karakter: str) -> int:
+        """Karakterin karo ID'sini döndür (yeni karakterlere ID atanır)"""
+        karo_id = self.karakter_idleri.get(karakter)
+        if karo_id is None:
+            karo_id = len(self.id_karakterleri)
+            bayrak = self._bayrak_hesapla(karakter)
+            self.karakter_idleri[karakter] = karo_id
+            self.id_karakterleri.append(karakter)
+            self.bayrak_tablosu.append(bayrak)
+            self.bayrak_haritasi[karakter] = bayrak
+        return karo_id
+    
+    def karakter_bayraklari(self, karakter: str) -> int:
+        """Karakterin bayrak maskesini döndür (bilinmeyen karakter = 0)"""
+        return self.bayrak_haritasi.get(karakter, 0)
     
     def karakter_bul(self, karakter: str) -> Optional[Dict]:
         """Bir karakterin özelliklerini döndür"""
@@ -118,15 +276,147 @@ class KarakterAnlamSistemi:
             "aciklama": aciklama,
             **ekstra
         }
+        # Derlenmiş tabloları güncelle
+        bayrak = self._bayrak_hesapla(karakter)
+        karo_id = self.karakter_id(karakter)
+        self.bayrak_tablosu[karo_id] = bayrak
+        self.bayrak_haritasi[karakter] = bayrak
+        self.surum += 1
+    
+    def harita_analiz_et(self, harita) -> Dict:
+        """Bir harita üzerindeki tüm karakterleri analiz et
+        
+        NumPy varsa ve harita dikdörtgense harita bir kez karo ID dizisine
+        çevrilip sayımlar vektörel yapılır; aksi halde hücre hücre gezilir.
+        Sonuç: toplam_karakter, karakter_tipleri (özellik -> adet),
+        oyuncu_konum (son oyuncu hücresi), hedef_konumlari (satır sırasıyla).
+        """
+        if np is not None:
+            idler = self.harita_kodla(harita)
+            if idler is not None:
+                return self._vektorel_analiz(idler[np.newaxis])[0]
+        return self._hucre_hucre_analiz(harita)
+    
+    def haritalari_analiz_et(self, haritalar: Sequence) -> List[Dict]:
+        """Aynı boyuttaki haritaları tek çağrıda analiz et
+        
+        NumPy varsa haritalar (adet, yükseklik, genişlik) boyutlu tek bir ID
+        dizisine yığılır ve tüm sayımlar birlikte yapılır. Boyutlar farklıysa
+        ya da NumPy yoksa her harita ayrı analiz edilir.
+        """
+        if np is not None and haritalar:
+            idler = [self.harita_kodla(harita) for harita in haritalar]
+            if all(dizi is not None and dizi.shape == idler[0].shape for dizi in idler):
+                return self._vektorel_analiz(np.stack(idler))
+        return [self.harita_analiz_et(harita) for harita in haritalar]
+    
+    def harita_kodla(self, harita):
+        """Haritayı (yükseklik, genişlik) boyutlu bir karo ID dizisine çevir
+        
+        Bu sisteme ait KompaktHarita'nın tamponu kopyalanmadan kullanılır;
+        başka bir sistemle kurulmuş olanın ID'leri o sistemin karakterleri
+        üzerinden çevrilir. Sistemde olmayan karakterler kayda eklenmez;
+        sayılmayan ID'yi (len(id_karakterleri)) alırlar. NumPy yoksa ya da
+        satır uzunlukları farklıysa None döner.
+        """
+        if np is None:
+            return None
+        bilinmeyen = len(self.id_karakterleri)
+        veri = getattr(harita, "veri", None)
+        if veri is not None and hasattr(harita, "adim"):  # KompaktHarita
+            dizi = np.frombuffer(veri, dtype=np.uint8 if veri.typecode == "B" else np.uint16)
+            dizi = dizi.reshape(harita.yukseklik, harita.adim)[:, :harita.genislik]
+            if harita.karakter_sistemi is self:
+                return dizi
+            ceviri = np.array([self.karakter_idleri.get(karakter, bilinmeyen)
+                               for karakter in harita.karakter_sistemi.id_karakterleri],
+                              dtype=np.uint32)
+            return ceviri[dizi]
+        
+        satirlar = harita if isinstance(harita, list) else [list(satir) for satir in harita]
+        genislik = len(satirlar[0]) if satirlar else 0
+        if any(len(satir) != genislik for satir in satirlar):
+            return None
+        hucreler = itertools.chain.from_iterable
+        try:
+            dizi = np.fromiter(map(self.karakter_idleri.__getitem__, hucreler(satirlar)),
+                               dtype=np.uint32, count=len(satirlar) * genislik)
+        except KeyError:
+            # Bilinmeyen karakterler sayılmayan ID'ye düşer (kayıt değişmez)
+            idler = self.karakter_idleri
+            dizi = np.fromiter((idler.get(karakter, bilinmeyen)
+                                for karakter in hucreler(satirlar)),
+                               dtype=np.uint32, count=len(satirlar) * genislik)
+        return dizi.reshape(len(satirlar), genislik)
     
-    def harita_analiz_et(self, harita: List[List[str]]) -> Dict:
-        """Bir harita üzerindeki tüm karakterleri analiz et"""
+    def _tablolari_al(self):
+        """Karo ID -> özellik indeksi / bayrak tablolarını (gerekirse) oluştur"""
+        tablolar = self._analiz_tablolari
+        if tablolar is None or tablolar[:2] != (self.surum, len(self.id_karakterleri)):
+            ozellikler: List[str] = []
+            ozellik_indeksi: Dict[str, int] = {}
+            karo_ozellikleri = []
+            for karakter in self.id_karakterleri:
+                bilgi = self.karakter_veritabani.get(karakter)
+                if bilgi is None:
+                    karo_ozellikleri.append(-1)  # Veritabanında yok: sayılmaz
+                    continue
+                ozellik = bilgi["ozellik"]
+                if ozellik not in ozellik_indeksi:
+                    ozellik_indeksi[ozellik] = len(ozellikler)
+                    ozellikler.append(ozellik)
+                karo_ozellikleri.append(ozellik_indeksi[ozellik])
+            karo_ozellikleri.append(-1)  # harita_kodla'nın bilinmeyen karakter ID'si
+            # Sayılmayanlar son kovaya (len(ozellikler)) düşer
+            karo_ozellikleri = np.array([i if i >= 0 else len(ozellikler)
+                                         for i in karo_ozellikleri], dtype=np.intp)
+            tablolar = self._analiz_tablolari = (
+                self.surum, len(self.id_karakterleri), ozellikler, karo_ozellikleri,
+                np.array(self.bayrak_tablosu + [0], dtype=np.int64))
+        return tablolar[2:]
+    
+    def _vektorel_analiz(self, idler) -> List[Dict]:
+        """(adet, yükseklik, genişlik) ID dizisindeki her haritayı analiz et"""
+        ozellikler, karo_ozellikleri, bayraklar = self._tablolari_al()
+        adet, yukseklik, genislik = idler.shape
+        kova = len(ozellikler) + 1
+        
+        ozellik_dizisi = karo_ozellikleri[idler]
+        # Harita başına ayrı kovalar: harita n'nin sayımları [n*kova, (n+1)*kova)
+        kaydirma = (np.arange(adet, dtype=np.intp) * kova)[:, np.newaxis, np.newaxis]
+        sayimlar = np.bincount((ozellik_dizisi + kaydirma).ravel(),
+                               minlength=adet * kova).reshape(adet, kova)[:, :-1]
+        
+        oyuncu_konumlari: Dict[int, Tuple[int, int]] = {}
+        if "Oyuncu" in ozellikler:
+            for n, y, x in np.argwhere(ozellik_dizisi == ozellikler.index("Oyuncu")):
+                oyuncu_konumlari[int(n)] = (int(x), int(y))  # Son bulunan kazanır
+        hedef_konumlari: List[List[Tuple[int, int]]] = [[] for _ in range(adet)]
+        for n, y, x in np.argwhere(bayraklar[idler] & HEDEF):
+            hedef_konumlari[n].append((int(x), int(y)))
+        
+        sonuclar = []
+        for n in range(adet):
+            sonuclar.append({
+                "toplam_karakter": int(sayimlar[n].sum()),
+                "karakter_tipleri": {ozellikler[i]: int(sayi)
+                                     for i, sayi in enumerate(sayimlar[n]) if sayi},
+                "oyuncu_konum": oyuncu_konumlari.get(n),
+                "ozellikler": {},
+                "hedef_konumlari": hedef_konumlari[n],
+            })
+        return sonuclar
+    
+    def _hucre_hucre_analiz(self, harita) -> Dict:
+        """Saf Python analiz (NumPy yoksa ya da satırlar farklı uzunluktaysa)"""
         analiz = {
             "toplam_karakter": 0,
             "karakter_tipleri": {},
             "oyuncu_konum": None,
-            "ozellikler": {}
+            "ozellikler": {},
+            "hedef_konumlari": [],
         }
+        bayraklar = self.bayrak_haritasi
         
         for y, satir in enumerate(harita):
             for x, karakter in enumerate(satir):
@@ -144,6 +434,10 @@ class KarakterAnlamSistemi:
                     # Oyuncu konumu
                     if ozellik == "Oyuncu":
                         analiz["oyuncu_konum"] = (x, y)
+                    
+                    # Hedef hücreleri
+                    if bayraklar.get(karakter, 0) & HEDEF:
+                        analiz["hedef_konumlari"].append((x, y))
         
         return analiz
     
@@ -186,6 +480,28 @@ class KarakterAnlamSistemi:
         print("="*60 + "\n")
 
 
+# Süreç başına paylaşılan karakter sistemleri (JSON yolu -> sistem)
+_PAYLASILAN_SISTEMLER: Dict[str, KarakterAnlamSistemi] = {}
+_PAYLASILAN_KILIT = threading.Lock()
+
+
+def paylasilan_sistem(json_dosya: str = "karakter_anlamlari.json") -> KarakterAnlamSistemi:
+    """Süreçte tek bir kez yüklenen, paylaşılan karakter sistemini döndür
+    
+    Motor, GUI ve çözücü her seferinde JSON'ı yeniden okumak yerine bunu
+    kullanır. karakter_ekle ile yapılan değişiklikler tüm kullanıcılara
+    yansır (bkz. surum).
+    """
+    json_path = _json_yolu(json_dosya)
+    sistem = _PAYLASILAN_SISTEMLER.get(json_path)
+    if sistem is None:
+        with _PAYLASILAN_KILIT:
+            sistem = _PAYLASILAN_SISTEMLER.get(json_path)
+            if sistem is None:
+                sistem = _PAYLASILAN_SISTEMLER[json_path] = KarakterAnlamSistemi(json_path)
+    return sistem
+
+
 def main():
     """Test ve örnek kullanım"""
     print("🎮 Unicode Game Lab - Karakter Anlam Sistemi\n")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Harita Kataloğu
+ornek_haritalar.json biçimindeki paketleri bir kez tarayıp her harita için
+(isim, boyut, bayt ofseti, içerik özeti) indeksi çıkarır; haritalar yalnızca
+seçildiklerinde diskten okunur. Sıkıştırılmış .uglp paketlerinde
+(harita_paketi.py) paketin kendi dizini kullanılır.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from harita_paketi import HaritaPaketi, paket_mi
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# Yan indeks dosyasının biçim sürümü (girdi yapısı değişince artırılır)
+KATALOG_SURUMU = 1
+
+VARSAYILAN_PAKET = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "ornek_haritalar.json")
+
+# Tarayıcının ilgilendiği yapı karakterleri ve dizgi sonu
+_YAPI = re.compile(rb'[{}\[\]"]')
+_DIZGI_SONU = re.compile(rb'(?:[^"\\]|\\.)*"', re.S)
+_IKI_NOKTA = re.compile(rb'\s*:\s*')
+_TIRNAK = ord('"')
+
+
+class KatalogGirdisi(NamedTuple):
+    """Bir haritanın indeks kaydı (harita verisi içermez)"""
+    dosya: str
+    anahtar: str
+    isim: str
+    genislik: int
+    yukseklik: int
+    ofset: int      # Paket içindeki bayt ofseti
+    uzunluk: int    # Girdinin bayt uzunluğu
+    ozet: str       # Girdi baytlarının SHA-256 özeti (ilk 16 hane)
+
+
+def indeks_yolu(dosya: str) -> str:
+    """Paketin yanındaki yan indeks dosyasının yolu"""
+    return dosya + ".indeks"
+
+
+def _girdileri_tara(veri) -> Iterator[Tuple[str, int, int]]:
+    """Üst düzey JSON nesnesindeki (anahtar, ofset, uzunluk) üçlülerini üret
+
+    Yalnızca yapı karakterlerine ve dizgilere bakılır; girdilerin içeriği
+    ayrıştırılmaz. Değeri nesne olmayan anahtarlar atlanır.
+    """
+    i = 0
+    while i < len(veri) and veri[i:i + 1].isspace():
+        i += 1
+    if veri[i:i + 1] != b'{':
+        raise ValueError("Harita paketi bir JSON nesnesi olmalı")
+
+    derinlik = 0
+    anahtar = None
+    bas = None
+    while True:
+        m = _YAPI.search(veri, i)
+        if m is None:
+            return
+        karakter = veri[m.start()]
+        i = m.end()
+        if karakter == _TIRNAK:
+            son = _DIZGI_SONU.match(veri, i).end()
+            i = son
+            if derinlik != 1:
+                continue
+            # Üst düzeyde dizgiler anahtardır; değerin başına geç
+            anahtar = json.loads(veri[m.start():son].decode('utf-8'))
+            i = _IKI_NOKTA.match(veri, son).end()
+            if veri[i:i + 1] == b'{':
+                bas = i
+                derinlik += 1
+                i += 1
+            elif veri[i:i + 1] == b'"':
+                i = _DIZGI_SONU.match(veri, i + 1).end()  # Dizgi değer: atla
+        elif karakter in b'{[':
+            derinlik += 1
+        else:
+            derinlik -= 1
+            if derinlik == 1 and bas is not None:
+                yield anahtar, bas, i - bas
+                bas = None
+
+
+def _dosyayi_indeksle(dosya: str) -> List[KatalogGirdisi]:
+    """Paketi baştan sona tara; her girdiyi yalnızca boyut/isim için bir kez ayrıştır"""
+    girdiler = []
+    with open(dosya, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return girdiler
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as veri:
+            for anahtar, ofset, uzunluk in _girdileri_tara(veri):
+                ham = veri[ofset:ofset + uzunluk]
+                bilgi = json.loads(ham.decode('utf-8'))
+                harita = bilgi.get("harita") or []
+                girdiler.append(KatalogGirdisi(
+                    dosya, anahtar, bilgi.get("isim", anahtar),
+                    max((len(satir) for satir in harita), default=0), len(harita),
+                    ofset, uzunluk, hashlib.sha256(ham).hexdigest()[:16]))
+    return girdiler
+
+
+class HaritaKatalogu:
+    """Bir veya daha fazla harita paketinin tembel yüklenen kataloğu
+
+    Listeleme yalnızca indeksten yapılır; indeks paketin yanında
+    <paket>.indeks dosyasında saklanır ve paketin mtime/boyutu değişince
+    yeniden oluşturulur.
+
+    katalog = HaritaKatalogu()
+    for girdi in katalog: print(girdi.isim, girdi.genislik, girdi.yukseklik)
+    harita = katalog.harita_yukle(0)
+    """
+
+    def __init__(self, dosyalar: Iterable[str] = (VARSAYILAN_PAKET,),
+                 indeks_yaz: bool = True):
+        self.girdiler: List[KatalogGirdisi] = []
+        self._anahtarlar: Optional[Dict[str, KatalogGirdisi]] = None
+        self._paketler: Dict[str, HaritaPaketi] = {}  # .uglp dosya -> açık paket
+        for dosya in dosyalar:
+            if paket_mi(dosya):
+                paket = self._paketler[dosya] = HaritaPaketi(dosya)
+                self.girdiler.extend(
+                    KatalogGirdisi(dosya, g.anahtar, g.isim, g.genislik, g.yukseklik,
+                                   g.ofset, g.uzunluk, g.ozet) for g in paket)
+            else:
+                self.girdiler.extend(self._dosya_indeksi(dosya, indeks_yaz))
+
+    def __len__(self) -> int:
+        return len(self.girdiler)
+
+    def __iter__(self) -> Iterator[KatalogGirdisi]:
+        return iter(self.girdiler)
+
+    def __getitem__(self, sira: int) -> KatalogGirdisi:
+        return self.girdiler[sira]
+
+    @staticmethod
+    def _dosya_indeksi(dosya: str, indeks_yaz: bool) -> List[KatalogGirdisi]:
+        """Güncel yan indeksi oku; yoksa paketi tarayıp oluştur"""
+        durum = os.stat(dosya)
+        try:
+            with open(indeks_yolu(dosya), 'rb') as f:
+                surum, mtime, boyut, kayitlar = pickle.load(f)
+            if (surum, mtime, boyut) == (KATALOG_SURUMU, durum.st_mtime_ns, durum.st_size):
+                return [KatalogGirdisi(dosya, *kayit) for kayit in kayitlar]
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
+
+        girdiler = _dosyayi_indeksle(dosya)
+        if indeks_yaz:
+            hedef = indeks_yolu(dosya)
+            gecici = f"{hedef}.{os.getpid()}.tmp"
+            try:
+                with open(gecici, 'wb') as f:
+                    pickle.dump((KATALOG_SURUMU, durum.st_mtime_ns, durum.st_size,
+                                 [tuple(g)[1:] for g in girdiler]),
+                                f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(gecici, hedef)
+            except OSError:
+                try:
+                    os.remove(gecici)
+                except OSError:
+                    pass
+        return girdiler
+
+    def bul(self, anahtar: str) -> Optional[KatalogGirdisi]:
+        """Anahtarı verilen girdiyi döndür (aynı anahtar birden fazla pakette
+        varsa ilki)"""
+        if self._anahtarlar is None:
+            self._anahtarlar = {}
+            for girdi in self.girdiler:
+                self._anahtarlar.setdefault(girdi.anahtar, girdi)
+        return self._anahtarlar.get(anahtar)
+
+    def _girdi(self, secim: Union[int, str, KatalogGirdisi]) -> KatalogGirdisi:
+        if isinstance(secim, KatalogGirdisi):
+            return secim
+        if isinstance(secim, int):
+            return self.girdiler[secim]
+        girdi = self.bul(secim)
+        if girdi is None:
+            raise KeyError(secim)
+        return girdi
+
+    def bilgi_yukle(self, secim: Union[int, str, KatalogGirdisi]) -> Dict:
+        """Tek bir girdiyi (isim, harita, aciklama...) diskten oku"""
+        girdi = self._girdi(secim)
+        paket = self._paketler.get(girdi.dosya)
+        if paket is not None:
+            return paket.bilgi_yukle(girdi)
+        with open(girdi.dosya, 'rb') as f:
+            f.seek(girdi.ofset)
+            return json.loads(f.read(girdi.uzunluk).decode('utf-8'))
+
+    def harita_yukle(self, secim: Union[int, str, KatalogGirdisi]) -> List[List[str]]:
+        """Tek bir haritayı OyunMotoru'nun kabul ettiği biçimde yükle"""
+        return self.bilgi_yukle(secim)["harita"]
+
+
+def main():
+    """Kataloğu listele"""
+    dosyalar = sys.argv[1:] or [VARSAYILAN_PAKET]
+    katalog = HaritaKatalogu(dosyalar)
+    print(f"📚 {len(katalog)} harita ({len(dosyalar)} paket)\n")
+    for sira, girdi in enumerate(katalog, 1):
+        print(f"{sira:>4}. {girdi.isim} ({girdi.genislik}x{girdi.yukseklik})"
+              f"  [{girdi.anahtar}, {girdi.ozet}]")
+
+
+if __name__ == "__main__":
+    main()
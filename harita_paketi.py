@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Sıkıştırılmış Harita Paketi
+Haritaları dosya başına bir karo paletiyle, RLE veya bit paketli satırlar
+halinde saklayan ikili paket biçimi; kodlayıcı, çözücü ve dönüştürücü.
+
+Dosya düzeni (tüm tamsayılar işaretsiz LEB128 varint, aksi belirtilmedikçe):
+    başlık    : "UGLP" | sürüm (1 bayt) | dizin ofseti (8 bayt, little-endian)
+    kayıtlar  : her harita için açıklama + gizli hedefler (sayı, (x, y) çiftleri)
+                + kodlama + karo verisi
+    dizin     : palet (karakterler) + her harita için
+                (kayıt ofseti, kayıt uzunluğu, anahtar, isim, genişlik, yükseklik, özet)
+
+Kullanım:
+    python harita_paketi.py ornek_haritalar.json -o ornek_haritalar.uglp
+    python harita_paketi.py ornek_haritalar.py -o ornek_haritalar.uglp
+"""
+
+import argparse
+import hashlib
+import os
+import runpy
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+SIHIRLI = b"UGLP"
+PAKET_SURUMU = 2  # 2: kayıtlar gizli hedefleri ("hedefler") içerir
+_BASLIK = struct.Struct("<4sBQ")
+
+# Karo verisi kodlamaları
+KODLAMA_RLE = 0   # (tekrar sayısı, palet indeksi) çiftleri, satır-öncelikli
+KODLAMA_BIT = 1   # Palet indeksleri sabit bit genişliğinde, sıkıca paketli
+
+
+# ----------------------------------------------------------------------
+# Varint yardımcıları
+# ----------------------------------------------------------------------
+
+def _varint_yaz(tampon: bytearray, sayi: int):
+    while sayi >= 0x80:
+        tampon.append((sayi & 0x7F) | 0x80)
+        sayi >>= 7
+    tampon.append(sayi)
+
+
+def _varint_oku(veri, i: int) -> Tuple[int, int]:
+    """(sayı, sonraki indeks)"""
+    sonuc = 0
+    kaydir = 0
+    while True:
+        bayt = veri[i]
+        i += 1
+        sonuc |= (bayt & 0x7F) << kaydir
+        if bayt < 0x80:
+            return sonuc, i
+        kaydir += 7
+
+
+def _metin_yaz(tampon: bytearray, metin: str):
+    ham = metin.encode('utf-8')
+    _varint_yaz(tampon, len(ham))
+    tampon += ham
+
+
+def _metin_oku(veri, i: int) -> Tuple[str, int]:
+    uzunluk, i = _varint_oku(veri, i)
+    return bytes(veri[i:i + uzunluk]).decode('utf-8'), i + uzunluk
+
+
+# ----------------------------------------------------------------------
+# Karo verisi kodlama / çözme
+# ----------------------------------------------------------------------
+
+def _rle_kodla(indeksler: List[int]) -> bytearray:
+    tampon = bytearray()
+    i = 0
+    n = len(indeksler)
+    while i < n:
+        deger = indeksler[i]
+        j = i + 1
+        while j < n and indeksler[j] == deger:
+            j += 1
+        _varint_yaz(tampon, j - i)
+        _varint_yaz(tampon, deger)
+        i = j
+    return tampon
+
+
+def _bit_kodla(indeksler: List[int], bit: int) -> bytearray:
+    tampon = bytearray()
+    biriken = 0
+    dolu = 0
+    for deger in indeksler:
+        biriken |= deger << dolu
+        dolu += bit
+        while dolu >= 8:
+            tampon.append(biriken & 0xFF)
+            biriken >>= 8
+            dolu -= 8
+    if dolu:
+        tampon.append(biriken)
+    return tampon
+
+
+def _karolari_coz(veri, i: int, son: int, hucre: int, palet: List[str]) -> List[str]:
+    """Kayıttaki karo verisini satır-öncelikli düz karakter listesine çöz
+
+    Bozuk veri ValueError (kısa kesilmiş varint'ler IndexError) verir; sayımlar
+    harita boyutunu aşamaz.
+    """
+    kodlama = veri[i]
+    i += 1
+    if kodlama == KODLAMA_RLE:
+        karolar: List[str] = []
+        while i < son:
+            tekrar, i = _varint_oku(veri, i)
+            deger, i = _varint_oku(veri, i)
+            if deger >= len(palet) or len(karolar) + tekrar > hucre:
+                raise ValueError("RLE verisi harita boyutuyla uyuşmuyor")
+            karolar += [palet[deger]] * tekrar
+        if len(karolar) != hucre:
+            raise ValueError("RLE verisi harita boyutuyla uyuşmuyor")
+        return karolar
+    if kodlama == KODLAMA_BIT:
+        bit = veri[i]
+        if not 1 <= bit <= max(1, len(palet) - 1).bit_length():
+            raise ValueError(f"Geçersiz bit genişliği: {bit}")
+        if (son - i - 1) * 8 // bit - hucre >= 8:  # Dolgu en fazla 7 bittir
+            raise ValueError("Bit paketli veri harita boyutuyla uyuşmuyor")
+        maske = (1 << bit) - 1
+        karolar = []
+        biriken = 0
+        dolu = 0
+        for bayt in veri[i + 1:son]:
+            biriken |= bayt << dolu
+            dolu += 8
+            while dolu >= bit:
+                karolar.append(biriken & maske)
+                biriken >>= bit
+                dolu -= bit
+        del karolar[hucre:]  # Son bayttaki dolgu bitleri
+        if len(karolar) != hucre or max(karolar, default=0) >= len(palet):
+            raise ValueError("Bit paketli veri harita boyutuyla uyuşmuyor")
+        return [palet[deger] for deger in karolar]
+    raise ValueError(f"Bilinmeyen karo kodlaması: {kodlama}")
+
+
+# ----------------------------------------------------------------------
+# Yazma
+# ----------------------------------------------------------------------
+
+class PaketGirdisi(NamedTuple):
+    """Paket dizinindeki bir haritanın kaydı (harita verisi içermez)"""
+    ofset: int
+    uzunluk: int
+    anahtar: str
+    isim: str
+    genislik: int
+    yukseklik: int
+    ozet: str       # Kayıt baytlarının SHA-256 özeti (ilk 16 hane)
+
+
+class PaketYazici:
+    """Haritaları sırayla pakete yazan bağlam yöneticisi
+
+    Palet yazarken büyür ve dizinle birlikte dosyanın sonuna yazılır;
+    böylece paket tek geçişte, haritaları bellekte biriktirmeden oluşur.
+    Paket önce geçici dosyaya yazılır ve yalnızca blok hatasız biterse
+    os.replace ile yerine konur; hata olursa eski paket olduğu gibi kalır.
+
+    with PaketYazici("paket.uglp") as yazici:
+        yazici.ekle("harita_1", harita, isim="Basit Örnek")
+    """
+
+    def __init__(self, dosya: str):
+        self.dosya = dosya
+        self._gecici = f"{dosya}.{os.getpid()}.tmp"
+        self._f = None
+        self.palet: List[str] = []
+        self._palet_indeksi: Dict[str, int] = {}
+        self.girdiler: List[PaketGirdisi] = []
+
+    def __enter__(self) -> "PaketYazici":
+        self._f = open(self._gecici, 'wb')
+        self._f.write(_BASLIK.pack(SIHIRLI, PAKET_SURUMU, 0))
+        return self
+
+    def __exit__(self, hata_tipi, *hata):
+        tamam = False
+        try:
+            if hata_tipi is None:
+                self._dizini_yaz()
+                self._f.close()
+                os.replace(self._gecici, self.dosya)  # Yarım paket okunmasın
+                tamam = True
+        finally:
+            self._f.close()
+            self._f = None
+            if not tamam:
+                try:
+                    os.remove(self._gecici)
+                except OSError:
+                    pass
+
+    def ekle(self, anahtar: str, harita: List[List[str]], isim: Optional[str] = None,
+             aciklama: str = "", hedefler: Optional[Iterable[Tuple[int, int]]] = None):
+        """Bir haritayı (dikdörtgen liste listesi) pakete ekle
+
+        hedefler, haritada görünmeyen (kutu ya da oyuncu altındaki) hedef
+        konumlarıdır (JSON girdilerindeki "hedefler" alanı).
+        """
+        yukseklik = len(harita)
+        genislik = len(harita[0]) if yukseklik else 0
+        if any(len(satir) != genislik for satir in harita):
+            raise ValueError(f"{anahtar}: tüm satırlar aynı uzunlukta olmalı")
+
+        indeksler = []
+        palet_indeksi = self._palet_indeksi
+        for satir in harita:
+            for karakter in satir:
+                deger = palet_indeksi.get(karakter)
+                if deger is None:
+                    deger = palet_indeksi[karakter] = len(self.palet)
+                    self.palet.append(karakter)
+                indeksler.append(deger)
+
+        # Haritaya göre daha küçük olan kodlamayı seç
+        rle = _rle_kodla(indeksler)
+        bit = max(1, max(indeksler, default=0).bit_length())
+        if len(rle) <= (len(indeksler) * bit + 7) // 8 + 1:
+            karo_verisi = bytes([KODLAMA_RLE]) + rle
+        else:
+            karo_verisi = bytes([KODLAMA_BIT, bit]) + _bit_kodla(indeksler, bit)
+
+        kayit = bytearray()
+        _metin_yaz(kayit, aciklama)
+        hedefler = list(hedefler or ())
+        _varint_yaz(kayit, len(hedefler))
+        for x, y in hedefler:
+            _varint_yaz(kayit, x)
+            _varint_yaz(kayit, y)
+        kayit += karo_verisi
+        ofset = self._f.tell()
+        self._f.write(kayit)
+        self.girdiler.append(PaketGirdisi(
+            ofset, len(kayit), anahtar, isim if isim is not None else anahtar,
+            genislik, yukseklik, hashlib.sha256(kayit).hexdigest()[:16]))
+
+    def _dizini_yaz(self):
+        dizin_ofseti = self._f.tell()
+        tampon = bytearray()
+        _varint_yaz(tampon, len(self.palet))
+        for karakter in self.palet:
+            _metin_yaz(tampon, karakter)
+        _varint_yaz(tampon, len(self.girdiler))
+        for girdi in self.girdiler:
+            _varint_yaz(tampon, girdi.ofset)
+            _varint_yaz(tampon, girdi.uzunluk)
+            _metin_yaz(tampon, girdi.anahtar)
+            _metin_yaz(tampon, girdi.isim)
+            _varint_yaz(tampon, girdi.genislik)
+            _varint_yaz(tampon, girdi.yukseklik)
+            tampon += bytes.fromhex(girdi.ozet)
+        self._f.write(tampon)
+        self._f.seek(0)
+        self._f.write(_BASLIK.pack(SIHIRLI, PAKET_SURUMU, dizin_ofseti))
+
+
+# ----------------------------------------------------------------------
+# Okuma
+# ----------------------------------------------------------------------
+
+def paket_mi(dosya: str) -> bool:
+    """Dosya bu biçimde bir harita paketi mi? (sihirli baytlara bakar)"""
+    try:
+        with open(dosya, 'rb') as f:
+            return f.read(len(SIHIRLI)) == SIHIRLI
+    except OSError:
+        return False
+
+
+class HaritaPaketi:
+    """Paketin dizinini açılışta okur, haritaları istendikçe çözer
+
+    paket = HaritaPaketi("ornek_haritalar.uglp")
+    harita = paket.harita_yukle(0)
+    """
+
+    def __init__(self, dosya: str):
+        self.dosya = dosya
+        with open(dosya, 'rb') as f:
+            baslik = f.read(_BASLIK.size)
+            if len(baslik) < _BASLIK.size:
+                raise ValueError(f"{dosya}: harita paketi değil")
+            sihirli, surum, dizin_ofseti = _BASLIK.unpack(baslik)
+            if sihirli != SIHIRLI:
+                raise ValueError(f"{dosya}: harita paketi değil")
+            if surum not in (1, PAKET_SURUMU):
+                raise ValueError(f"{dosya}: desteklenmeyen paket sürümü {surum}")
+            self.surum = surum
+            boyut = f.seek(0, os.SEEK_END)
+            if not _BASLIK.size <= dizin_ofseti < boyut:
+                raise ValueError(f"{dosya}: harita paketi bozuk")
+            f.seek(dizin_ofseti)
+            veri = f.read()
+        try:
+            self._dizini_oku(veri, dizin_ofseti)
+        except (IndexError, UnicodeDecodeError):
+            raise ValueError(f"{dosya}: harita paketi bozuk") from None
+
+    def _dizini_oku(self, veri: bytes, dizin_ofseti: int):
+        """Paleti ve girdileri dizinden oku; kayıtlar dizinden önce bitmeli"""
+        i = 0
+        adet, i = _varint_oku(veri, i)
+        self.palet: List[str] = []
+        for _ in range(adet):
+            karakter, i = _metin_oku(veri, i)
+            self.palet.append(karakter)
+
+        adet, i = _varint_oku(veri, i)
+        self.girdiler: List[PaketGirdisi] = []
+        for _ in range(adet):
+            ofset, i = _varint_oku(veri, i)
+            uzunluk, i = _varint_oku(veri, i)
+            anahtar, i = _metin_oku(veri, i)
+            isim, i = _metin_oku(veri, i)
+            genislik, i = _varint_oku(veri, i)
+            yukseklik, i = _varint_oku(veri, i)
+            ozet = veri[i:i + 8].hex()
+            i += 8
+            if len(ozet) != 16 or not _BASLIK.size <= ofset <= dizin_ofseti - uzunluk:
+                raise ValueError(f"{self.dosya}: harita paketi bozuk ({anahtar})")
+            self.girdiler.append(PaketGirdisi(ofset, uzunluk, anahtar, isim,
+                                              genislik, yukseklik, ozet))
+
+    def __len__(self) -> int:
+        return len(self.girdiler)
+
+    def __iter__(self) -> Iterator[PaketGirdisi]:
+        return iter(self.girdiler)
+
+    def bilgi_yukle(self, girdi) -> Dict:
+        """Bir haritayı ornek_haritalar.json girdisi biçiminde çöz"""
+        if isinstance(girdi, int):
+            girdi = self.girdiler[girdi]
+        with open(self.dosya, 'rb') as f:
+            f.seek(girdi.ofset)
+            kayit = f.read(girdi.uzunluk)
+        genislik, yukseklik = girdi.genislik, girdi.yukseklik
+        hedefler = []
+        try:
+            aciklama, i = _metin_oku(kayit, 0)
+            if self.surum >= 2:  # Sürüm 1 kayıtlarında gizli hedef yoktur
+                adet, i = _varint_oku(kayit, i)
+                for _ in range(adet):
+                    x, i = _varint_oku(kayit, i)
+                    y, i = _varint_oku(kayit, i)
+                    hedefler.append([x, y])
+            karolar = _karolari_coz(kayit, i, len(kayit), genislik * yukseklik, self.palet)
+        except (IndexError, UnicodeDecodeError):
+            raise ValueError(f"{self.dosya}: harita paketi bozuk ({girdi.anahtar})") from None
+        harita = [karolar[y * genislik:(y + 1) * genislik] for y in range(yukseklik)]
+        bilgi = {
+            "isim": girdi.isim,
+            "boyut": {"genislik": genislik, "yukseklik": yukseklik},
+            "harita": harita,
+            "aciklama": aciklama,
+        }
+        if hedefler:
+            bilgi["hedefler"] = hedefler
+        return bilgi
+
+    def harita_yukle(self, girdi) -> List[List[str]]:
+        """Bir haritayı OyunMotoru'nun kabul ettiği biçimde çöz"""
+        return self.bilgi_yukle(girdi)["harita"]
+
+    def haritalar(self) -> Iterator[Tuple[str, str, List[List[str]]]]:
+        """Tüm haritaları sırayla (anahtar, isim, harita) olarak üret"""
+        for girdi in self.girdiler:
+            yield girdi.anahtar, girdi.isim, self.harita_yukle(girdi)
+
+
+# ----------------------------------------------------------------------
+# Dönüştürücü
+# ----------------------------------------------------------------------
+
+def kaynak_haritalari(dosya: str) -> Iterator[Tuple[str, Dict]]:
+    """JSON paketinden ya da ornek_haritalar.py düzenindeki modülden
+    (anahtar, {"isim", "harita", "aciklama"}) çiftleri üret"""
+    if dosya.endswith(".py"):
+        modul = runpy.run_path(dosya)
+        for ad, deger in modul.items():
+            if ad.startswith("ornek_harita_") and isinstance(deger, list):
+                yield ad, {"isim": ad, "harita": deger}
+        return
+
+    from harita_katalogu import HaritaKatalogu
+    katalog = HaritaKatalogu([dosya], indeks_yaz=False)
+    for girdi in katalog:
+        yield girdi.anahtar, katalog.bilgi_yukle(girdi)
+
+
+def paketle(kaynaklar: Iterable[str], cikti: str) -> List[PaketGirdisi]:
+    """Kaynak dosyalardaki tüm haritaları tek bir pakete dönüştür"""
+    with PaketYazici(cikti) as yazici:
+        for kaynak in kaynaklar:
+            for anahtar, bilgi in kaynak_haritalari(kaynak):
+                yazici.ekle(anahtar, bilgi["harita"], bilgi.get("isim", anahtar),
+                            bilgi.get("aciklama", ""), bilgi.get("hedefler"))
+    return yazici.girdiler
+
+
+def main():
+    """Komut satırı giriş noktası"""
+    ayristirici = argparse.ArgumentParser(
+        description="JSON / Python harita dosyalarını sıkıştırılmış pakete dönüştür")
+    ayristirici.add_argument("kaynaklar", nargs="+",
+                             help="ornek_haritalar.json veya ornek_haritalar.py düzeninde dosyalar")
+    ayristirici.add_argument("-o", "--cikti", required=True, help="Çıktı paket dosyası (.uglp)")
+    args = ayristirici.parse_args()
+
+    girdiler = paketle(args.kaynaklar, args.cikti)
+    kaynak_boyutu = sum(os.path.getsize(k) for k in args.kaynaklar)
+    paket_boyutu = os.path.getsize(args.cikti)
+    print(f"📦 {len(girdiler)} harita paketlendi: {kaynak_boyutu:,} → {paket_boyutu:,} bayt "
+          f"(%{100 * paket_boyutu / max(1, kaynak_boyutu):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Kilitlenme Analizi
+İtilebilir nesneler için ölü kareleri ve donma (freeze) kilitlenmelerini
+harita başına bir kez önceden hesaplar
+"""
+
+from collections import deque
+from typing import Iterable, List, Set, Tuple
+
+from game_lab import GECILEBILIR, ITILEBILIR, ITME_ALANI, OYUNCU
+
+SONSUZ = float("inf")
+
+
+class KilitlenmeAnalizi:
+    """Bir haritanın durağan geometrisinden kilitlenme tabloları
+
+    Hücreler, kenarlarına duvar eklenmiş ızgarada (y + 1) * genislik + (x + 1)
+    düz indeksleriyle tutulur (BulmacaCozucu ile aynı düzen). Toplanabilir
+    öğeler toplanmış varsayılır; böylece ölü kare kümesi iyimserdir ve
+    kurtarılabilir bir kareyi asla ölü saymaz.
+    """
+
+    def __init__(self, harita, bayraklar, hedefler: Iterable[Tuple[int, int]]):
+        yukseklik = len(harita)
+        self.genislik = max((len(satir) for satir in harita), default=0) + 2
+        self.yukseklik = yukseklik + 2
+        g = self.genislik
+
+        # acik[i]: duvar değil (oyuncu girebilir / nesne itilebilir)
+        self.acik = bytearray(self.genislik * self.yukseklik)
+        for y, satir in enumerate(harita):
+            for x, karakter in enumerate(satir):
+                if bayraklar.get(karakter, 0) & (GECILEBILIR | ITME_ALANI | ITILEBILIR | OYUNCU):
+                    self.acik[(y + 1) * g + (x + 1)] = 1
+        self.hedefler = frozenset((y + 1) * g + (x + 1) for x, y in hedefler)
+        self.yonler = (-g, -1, g, 1)
+
+        self.itme_mesafeleri = self._itme_mesafelerini_hesapla()
+        # olu[i]: nesne buradan hiçbir hedefe itilemez
+        self.olu = bytearray(1 if self.acik[i] and self.itme_mesafeleri[i] == SONSUZ else 0
+                             for i in range(len(self.acik)))
+
+    @classmethod
+    def motordan(cls, motor) -> "KilitlenmeAnalizi":
+        """Bir OyunMotoru'nun haritası ve hedef indeksinden analiz oluştur"""
+        return cls(motor.harita, motor._bayraklar, motor.hedef_konumlari())
+
+    def indeks(self, x: int, y: int) -> int:
+        """Harita koordinatını ızgara indeksine çevir"""
+        return (y + 1) * self.genislik + (x + 1)
+
+    def _itme_mesafelerini_hesapla(self) -> List[float]:
+        """Her hücreden en yakın hedefe en az itme sayısı (diğer nesneler yok sayılır)
+
+        Hedeflerden geriye doğru "çekme" BFS'i: nesne i-d'den i'ye, oyuncu
+        i-2d hücresinde durarak itebilir.
+        """
+        acik = self.acik
+        mesafe = [SONSUZ] * len(acik)
+        kuyruk = deque()
+        for h in self.hedefler:
+            mesafe[h] = 0
+            kuyruk.append(h)
+        while kuyruk:
+            i = kuyruk.popleft()
+            for d in self.yonler:
+                onceki = i - d
+                oyuncu = i - 2 * d
+                if 0 <= oyuncu < len(acik) and acik[onceki] and acik[oyuncu] \
+                        and mesafe[onceki] == SONSUZ:
+                    mesafe[onceki] = mesafe[i] + 1
+                    kuyruk.append(onceki)
+        return mesafe
+
+    # ------------------------------------------------------------------
+    # Sorgular (ızgara indeksleriyle)
+    # ------------------------------------------------------------------
+
+    def donmus_mu(self, i: int, kutular, _ziyaret: frozenset = frozenset()) -> bool:
+        """i'deki nesne hem yatay hem dikey eksende itilemez durumda mı?
+
+        Bir eksen; bir yanda duvar, iki yanda ölü kare ya da bir yanda
+        kendisi donmuş başka bir nesne varsa kilitlidir. Özyinelemede
+        incelenen nesneler duvar sayılır.
+        """
+        ziyaret = _ziyaret | {i}
+        for d in (1, self.genislik):
+            a, b = i - d, i + d
+            if not self.acik[a] or not self.acik[b]:
+                continue
+            if self.olu[a] and self.olu[b]:
+                continue
+            engelli = False
+            for komsu in (a, b):
+                if komsu in ziyaret or (komsu in kutular and
+                                        self.donmus_mu(komsu, kutular, ziyaret)):
+                    engelli = True
+                    break
+            if not engelli:
+                return False
+        return True
+
+    def kilitli_mi(self, kutular) -> bool:
+        """Bu nesne dizilimiyle oyun artık kazanılamaz mı?
+
+        Kazanmak için tüm hedefler aynı anda oyuncu veya nesnelerle örtülü
+        olmalı. Ölü karedeki ya da hedef dışında donmuş nesneler işe
+        yaramaz; hedefte donmuş nesneler o hedefi kalıcı olarak örter.
+        Kalan hedefler, kullanılabilir nesneler + oyuncudan fazlaysa kilitlidir.
+        """
+        kalici_ortulu = 0
+        kullanilamaz = 0
+        for k in kutular:
+            if k in self.hedefler:
+                if self.donmus_mu(k, kutular):
+                    kalici_ortulu += 1
+            elif self.olu[k] or self.donmus_mu(k, kutular):
+                kullanilamaz += 1
+        gereken = len(self.hedefler) - kalici_ortulu
+        kullanilabilir = len(kutular) - kullanilamaz - kalici_ortulu
+        return gereken > kullanilabilir + 1
+
+    # ------------------------------------------------------------------
+    # Harita koordinatlarıyla kısayollar
+    # ------------------------------------------------------------------
+
+    def olu_kare_mi(self, x: int, y: int) -> bool:
+        """(x, y)'ye itilen nesne bir daha hiçbir hedefe ulaşamaz mı?"""
+        return bool(self.olu[self.indeks(x, y)])
+
+    def olu_kareler(self) -> Set[Tuple[int, int]]:
+        """Tüm ölü karelerin (x, y) konumları"""
+        g = self.genislik
+        return {(i % g - 1, i // g - 1) for i, olu in enumerate(self.olu) if olu}
+
+
+class KilitTakibi:
+    """Nesne dizilimini artımlı izleyen kilitlenme denetimi
+
+    Nesne kümesi ve işe yaramaz (hedef dışında ölü karede ya da donmuş)
+    nesneler tutulur. Bir nesnenin donma durumu yalnızca bitişik nesnelere
+    (zincirleme) bağlı olduğundan, değişiklikten sonra yalnızca değişen
+    hücrelere dokunan nesne kümeleri yeniden sınıflandırılır; itme başına
+    maliyet harita boyutundan bağımsızdır.
+
+    Karar KilitlenmeAnalizi.kilitli_mi ile aynıdır: hedefte donmuş nesneler
+    hem gereken hem kullanılabilir sayımından düştüğü için yalnızca işe
+    yaramaz nesne sayısı önemlidir.
+    """
+
+    def __init__(self, analiz: KilitlenmeAnalizi, harita, bayraklar):
+        self.analiz = analiz
+        self.bayraklar = bayraklar
+        self.kutular: Set[int] = {analiz.indeks(x, y)
+                                  for y, satir in enumerate(harita)
+                                  for x, karakter in enumerate(satir)
+                                  if bayraklar.get(karakter, 0) & ITILEBILIR}
+        self.kullanilamaz: Set[int] = {k for k in self.kutular if self._kullanilamaz_mi(k)}
+        self._kirli: Set[int] = set()  # Son sorgudan beri nesne girip çıkan hücreler
+
+    @classmethod
+    def motordan(cls, motor) -> "KilitTakibi":
+        """Bir OyunMotoru'nun analizi ve güncel haritasından takip oluştur"""
+        return cls(motor.kilitlenme_analizi(), motor.harita, motor._bayraklar)
+
+    def _kullanilamaz_mi(self, k: int) -> bool:
+        analiz = self.analiz
+        return k not in analiz.hedefler and bool(analiz.olu[k] or
+                                                 analiz.donmus_mu(k, self.kutular))
+
+    def hucre_degisti(self, x: int, y: int, karakter: str):
+        """(x, y) hücresine karakter yazıldı: nesne kümesini güncelle (O(1))"""
+        i = self.analiz.indeks(x, y)
+        if self.bayraklar.get(karakter, 0) & ITILEBILIR:
+            if i in self.kutular:
+                return
+            self.kutular.add(i)
+        elif i in self.kutular:
+            self.kutular.discard(i)
+            self.kullanilamaz.discard(i)
+        else:
+            return
+        self._kirli.add(i)
+
+    def _yenile(self):
+        """Değişen hücrelere bitişik nesne kümelerini yeniden sınıflandır"""
+        kutular = self.kutular
+        yonler = self.analiz.yonler
+        etkilenen: Set[int] = set()
+        for i in self._kirli:
+            for baslangic in (i, *(i + d for d in yonler)):
+                if baslangic not in kutular or baslangic in etkilenen:
+                    continue
+                etkilenen.add(baslangic)
+                kuyruk = deque([baslangic])
+                while kuyruk:
+                    k = kuyruk.popleft()
+                    for d in yonler:
+                        komsu = k + d
+                        if komsu in kutular and komsu not in etkilenen:
+                            etkilenen.add(komsu)
+                            kuyruk.append(komsu)
+        self._kirli.clear()
+        for k in etkilenen:
+            if self._kullanilamaz_mi(k):
+                self.kullanilamaz.add(k)
+            else:
+                self.kullanilamaz.discard(k)
+
+    def kilitli_mi(self) -> bool:
+        """Güncel nesne dizilimiyle oyun artık kazanılamaz mı?"""
+        if self._kirli:
+            self._yenile()
+        return len(self.kullanilamaz) > len(self.kutular) - len(self.analiz.hedefler) + 1
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Kıyaslama Takımı
+Duvar / itilebilir / hedef yoğunlukları denetlenen sentetik haritalar üretip
+(10x10'dan 4096x4096'ya) motorun sıcak yollarını ölçer ve sonuçları
+commit'ler arasında karşılaştırılabilecek bir JSON dosyasına yazar.
+
+Ölçümler:
+    karakter_db_json     karakter_anlamlari.json'ı ayrıştırıp derleme (önbellek yazılmaz)
+    karakter_db_onbellek derlenmiş önbellekten yükleme
+    motor_kurulumu       OyunMotoru(harita)
+    oyuncu_konum_bul     OyunMotoru._oyuncu_konum_bul (oyuncu haritanın ortasında)
+    rastgele_yuruyus     adimlar() ile rastgele WASD dizisi (adım/sn)
+
+Haritayı değiştiren ölçümler her tekrarda, süreye katılmadan kurulan yeni
+bir motorla başlar; böylece her tekrar aynı durumdan ölçülür.
+    catal_ve_adim        OyunMotoru.catal() + tek adım (çatal/sn; satırlar paylaşılır)
+    harita_analiz_et     KarakterAnlamSistemi.harita_analiz_et (NumPy varsa vektörel)
+    metin_cizimi         TerminalCizici.metin_olustur (ekransız, tüm harita)
+    kare_farki           TerminalCizici.kare_olustur ile bir hareket sonrası fark karesi
+
+Kullanım:
+    python kiyaslama.py -o kiyaslama.json
+    python kiyaslama.py --boyutlar 10 64 256 --karsilastir onceki.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import game_lab
+from game_lab import KarakterAnlamSistemi, paylasilan_sistem
+from oyun_motoru import MOTOR_SURUMU, OyunMotoru
+from terminal_cizici import TerminalCizici
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# Sonuç dosyasının biçim sürümü
+KIYASLAMA_SURUMU = 2
+
+VARSAYILAN_BOYUTLAR = (10, 32, 128, 512, 1024, 2048, 4096)
+VARSAYILAN_ADIM = 100_000
+# catal_ve_adim ölçümündeki çatal sayısı
+CATAL_SAYISI = 1_000
+
+# Bu kadar hücreden büyük haritalarda her ölçüm bir kez yapılır
+_BUYUK_HARITA = 1_000_000
+
+
+def sentetik_harita(genislik: int, yukseklik: int, duvar: float = 0.15,
+                    itilebilir: float = 0.03, hedef: float = 0.03,
+                    tohum: int = 0) -> List[List[str]]:
+    """Kenarları duvarla çevrili, iç hücreleri verilen yoğunluklarla rastgele
+    dolu bir harita üret; oyuncu tam ortadadır
+
+    Aynı parametreler ve tohum her zaman aynı haritayı verir.
+    """
+    if duvar + itilebilir + hedef > 1:
+        raise ValueError("Yoğunlukların toplamı 1'i geçemez")
+    rastgele = random.Random(tohum)
+    karakterler = ("#", "🟥", "O", " ")
+    birikimli = (duvar, duvar + itilebilir, duvar + itilebilir + hedef, 1.0)
+    ic = max(0, genislik - 2)
+
+    harita = [["#"] * genislik]
+    for _ in range(max(0, yukseklik - 2)):
+        satir = ["#"]
+        satir.extend(rastgele.choices(karakterler, cum_weights=birikimli, k=ic))
+        satir.append("#")
+        harita.append(satir[:genislik])
+    if yukseklik > 1:
+        harita.append(["#"] * genislik)
+    harita[yukseklik // 2][genislik // 2] = "P"
+    return harita
+
+
+def _olc(islev: Callable[..., object], tekrar: int,
+         hazirla: Optional[Callable[[], object]] = None) -> float:
+    """islev'i tekrar kez çalıştır, en kısa süreyi (saniye) döndür
+
+    hazirla verilirse her tekrardan önce süreye katılmadan çağrılır ve
+    sonucu islev'e argüman olarak geçirilir.
+    """
+    en_kisa = float("inf")
+    for _ in range(tekrar):
+        argumanlar = () if hazirla is None else (hazirla(),)
+        baslangic = time.perf_counter()
+        islev(*argumanlar)
+        en_kisa = min(en_kisa, time.perf_counter() - baslangic)
+    return en_kisa
+
+
+def _kayit(olcum: str, sure: float, tekrar: int, genislik: int = 0, yukseklik: int = 0,
+           islem: Optional[int] = None) -> Dict:
+    kayit = {"olcum": olcum, "genislik": genislik, "yukseklik": yukseklik,
+             "sure": sure, "tekrar": tekrar}
+    if islem is not None:
+        kayit["islem"] = islem
+        kayit["saniyede"] = islem / sure if sure > 0 else None
+    return kayit
+
+
+def karakter_db_olc(tekrar: int) -> List[Dict]:
+    """Karakter veritabanını JSON'dan ve önbellekten yükleme süreleri
+
+    JSON ölçümü yalnızca ayrıştırma ve tablo derlemesidir; önbellek yazımı
+    (SHA-256 + pickle) süreye katılmaz. Depodaki önbelleğe dokunmamak için
+    JSON geçici bir dizine kopyalanır.
+    """
+    kaynak = os.path.join(os.path.dirname(os.path.abspath(__file__)), "karakter_anlamlari.json")
+    dizin = tempfile.mkdtemp(prefix="kiyaslama_")
+    try:
+        kopya = os.path.join(dizin, os.path.basename(kaynak))
+        shutil.copy2(kaynak, kopya)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            json_suresi = _olc(lambda: KarakterAnlamSistemi(kopya, onbellek=False), tekrar)
+            KarakterAnlamSistemi(kopya)  # Önbelleği yaz
+            onbellek_suresi = _olc(lambda: KarakterAnlamSistemi(kopya), tekrar)
+    finally:
+        shutil.rmtree(dizin, ignore_errors=True)
+    return [_kayit("karakter_db_json", json_suresi, tekrar),
+            _kayit("karakter_db_onbellek", onbellek_suresi, tekrar)]
+
+
+def harita_olc(genislik: int, yukseklik: int, karakter_sistemi: KarakterAnlamSistemi,
+               adim_sayisi: int = VARSAYILAN_ADIM, tekrar: int = 3,
+               yogunluklar: Optional[Dict[str, float]] = None, tohum: int = 0) -> List[Dict]:
+    """Bir harita boyutu için tüm harita ölçümlerini yap"""
+    harita = sentetik_harita(genislik, yukseklik, tohum=tohum, **(yogunluklar or {}))
+    if genislik * yukseklik > _BUYUK_HARITA:
+        tekrar = 1
+    ks = karakter_sistemi
+    sonuclar = []
+
+    def kaydet(olcum: str, sure: float, islem: Optional[int] = None):
+        sonuclar.append(_kayit(olcum, sure, tekrar, genislik, yukseklik, islem))
+
+    def yeni_motor() -> OyunMotoru:
+        return OyunMotoru(harita, ks)
+
+    kaydet("motor_kurulumu", _olc(yeni_motor, tekrar))
+    # Yalnızca okuyan ölçümler bu (hiç değiştirilmeyen) motoru paylaşır
+    motor = yeni_motor()
+    kaydet("oyuncu_konum_bul", _olc(motor._oyuncu_konum_bul, tekrar))
+
+    rastgele = random.Random(tohum)
+    yol = "".join(rastgele.choice("WASD") for _ in range(adim_sayisi))
+    kaydet("rastgele_yuruyus",
+           _olc(lambda m: m.adimlar(yol, kazaninca_dur=False), tekrar, yeni_motor),
+           adim_sayisi)
+
+    def catal_ve_adim(m: OyunMotoru):
+        for komut in yol[:CATAL_SAYISI]:
+            m.catal().adim(komut)
+
+    kaydet("catal_ve_adim", _olc(catal_ve_adim, tekrar, yeni_motor),
+           min(CATAL_SAYISI, len(yol)))
+
+    kaydet("harita_analiz_et", _olc(lambda: ks.harita_analiz_et(motor.harita), tekrar))
+
+    cizici = TerminalCizici(ks, cikti=io.StringIO())
+    kaydet("metin_cizimi", _olc(lambda: cizici.metin_olustur(motor.harita), tekrar))
+
+    def fark_hazirla() -> OyunMotoru:
+        m = yeni_motor()
+        cizici.sifirla()
+        cizici.kare_olustur(m.harita)
+        m.adimlar(yol[:1], kazaninca_dur=False)
+        return m
+
+    kaydet("kare_farki", _olc(lambda m: cizici.kare_olustur(m.harita), tekrar, fark_hazirla))
+    return sonuclar
+
+
+def _git_surumu() -> Optional[str]:
+    """Çalışılan commit (git yoksa None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def kiyasla(boyutlar: Sequence[int] = VARSAYILAN_BOYUTLAR, adim_sayisi: int = VARSAYILAN_ADIM,
+            tekrar: int = 3, yogunluklar: Optional[Dict[str, float]] = None,
+            tohum: int = 0, ilerleme: bool = True) -> Dict:
+    """Tüm ölçümleri çalıştır ve JSON'a yazılabilir rapor döndür"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ks = paylasilan_sistem()
+    rapor = {
+        "surum": KIYASLAMA_SURUMU,
+        "zaman": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_surumu(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": getattr(game_lab.np, "__version__", None),
+        "motor_surumu": MOTOR_SURUMU,
+        "ayarlar": {"adim_sayisi": adim_sayisi, "tekrar": tekrar, "tohum": tohum,
+                    "yogunluklar": yogunluklar or {}},
+        "sonuclar": karakter_db_olc(tekrar),
+    }
+    for boyut in boyutlar:
+        if ilerleme:
+            print(f"⏱️  {boyut}x{boyut}...", file=sys.stderr)
+        rapor["sonuclar"].extend(
+            harita_olc(boyut, boyut, ks, adim_sayisi, tekrar, yogunluklar, tohum))
+    return rapor
+
+
+def _anahtar(kayit: Dict):
+    return kayit["olcum"], kayit["genislik"], kayit["yukseklik"]
+
+
+def rapor_yazdir(rapor: Dict, onceki: Optional[Dict] = None):
+    """Sonuçları tablo olarak yazdır; önceki rapor verilirse oranı da göster"""
+    eski = {_anahtar(k): k for k in onceki["sonuclar"]} if onceki else {}
+    print(f"\n📊 Kıyaslama ({rapor['commit'] or '?'}, Python {rapor['python']})")
+    if onceki:
+        print(f"   Karşılaştırılan: {onceki.get('commit') or '?'} ({onceki.get('zaman')})")
+    print("=" * 72)
+    for kayit in rapor["sonuclar"]:
+        boyut = f"{kayit['genislik']}x{kayit['yukseklik']}" if kayit["genislik"] else "-"
+        satir = f"{kayit['olcum']:<22}{boyut:>11}{kayit['sure'] * 1000:>12.3f} ms"
+        if kayit.get("saniyede"):
+            satir += f"{kayit['saniyede']:>14,.0f}/sn"
+        onceki_kayit = eski.get(_anahtar(kayit))
+        if onceki_kayit and kayit["sure"] > 0:
+            satir += f"   x{onceki_kayit['sure'] / kayit['sure']:.2f}"
+        print(satir)
+
+
+def main():
+    """Komut satırı giriş noktası"""
+    ayristirici = argparse.ArgumentParser(description="Motor kıyaslama takımı")
+    ayristirici.add_argument("--boyutlar", type=int, nargs="+", default=list(VARSAYILAN_BOYUTLAR),
+                             help="Kare harita kenar uzunlukları")
+    ayristirici.add_argument("--adim", type=int, default=VARSAYILAN_ADIM,
+                             help="Rastgele yürüyüşteki adım sayısı")
+    ayristirici.add_argument("--tekrar", type=int, default=3,
+                             help="Ölçüm tekrarı (en kısa süre alınır)")
+    ayristirici.add_argument("--duvar", type=float, default=0.15)
+    ayristirici.add_argument("--itilebilir", type=float, default=0.03)
+    ayristirici.add_argument("--hedef", type=float, default=0.03)
+    ayristirici.add_argument("--tohum", type=int, default=0)
+    ayristirici.add_argument("-o", "--cikti", help="Sonuçların yazılacağı JSON dosyası")
+    ayristirici.add_argument("--karsilastir", help="Oranların hesaplanacağı önceki JSON sonucu")
+    args = ayristirici.parse_args()
+
+    yogunluklar = {"duvar": args.duvar, "itilebilir": args.itilebilir, "hedef": args.hedef}
+    rapor = kiyasla(args.boyutlar, args.adim, max(1, args.tekrar), yogunluklar, args.tohum)
+
+    onceki = None
+    if args.karsilastir:
+        with open(args.karsilastir, 'r', encoding='utf-8') as f:
+            onceki = json.load(f)
+    rapor_yazdir(rapor, onceki)
+
+    if args.cikti:
+        with open(args.cikti, 'w', encoding='utf-8') as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Sonuçlar yazıldı: {args.cikti}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Ham Klavye Girişi
+Enter beklemeden tuş okuyan, ANSI ok tuşu dizilerini çözen ve basılı
+tutulan tuşların tekrarlarını tek bir komut grubunda toplayan giriş katmanı
+"""
+
+import codecs
+import os
+import sys
+from typing import List, Optional
+
+try:
+    import select
+    import termios
+    import tty
+except ImportError:  # Windows: ham mod desteklenmiyor, input() kullanılır
+    termios = None
+
+# ANSI kaçış dizisi -> komut (normal ve uygulama imleç modu)
+KACIS_DIZILERI = {
+    "\x1b[A": "W", "\x1b[B": "S", "\x1b[C": "D", "\x1b[D": "A",
+    "\x1bOA": "W", "\x1bOB": "S", "\x1bOC": "D", "\x1bOD": "A",
+}
+
+# Tek karakter -> komut
+TUS_KOMUTLARI = {
+    "w": "W", "a": "A", "s": "S", "d": "D", "q": "Q",
+    "g": "G", "y": "Y",  # Geri al / yinele
+    "i": "I",  # İpucu
+    "8": "8", "2": "2", "4": "4", "6": "6",
+    "\x03": "Q", "\x04": "Q",  # Ctrl-C / Ctrl-D
+}
+
+# Kaçış dizisinin geri kalanı için en fazla bekleme (saniye)
+_KACIS_BEKLEME = 0.02
+
+
+def ham_mod_destekleniyor(giris=None) -> bool:
+    """Bu giriş akışı ham (cbreak) moda alınabilir mi?"""
+    giris = giris or sys.stdin
+    if termios is None:
+        return False
+    try:
+        return giris.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class HamKlavye:
+    """stdin'i cbreak moduna alan bağlam yöneticisi
+
+    with HamKlavye() as klavye:
+        komutlar = klavye.komutlari_oku()   # örn. ["D", "D", "D", "S"]
+    """
+
+    def __init__(self, giris=None):
+        self.giris = giris or sys.stdin
+        self._fd = self.giris.fileno()
+        self._eski_ayarlar = None
+        self._cozucu = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._tampon = ""
+
+    def __enter__(self) -> "HamKlavye":
+        self._eski_ayarlar = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *hata):
+        if self._eski_ayarlar is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._eski_ayarlar)
+            self._eski_ayarlar = None
+
+    def _hazir_mi(self, zaman_asimi: Optional[float]) -> bool:
+        hazir, _, _ = select.select([self._fd], [], [], zaman_asimi)
+        return bool(hazir)
+
+    def _oku(self):
+        """Bekleyen tüm baytları tampona al"""
+        while True:
+            veri = os.read(self._fd, 1024)
+            if not veri:
+                self._tampon += "\x04"  # EOF
+                return
+            self._tampon += self._cozucu.decode(veri)
+            if not self._hazir_mi(0):
+                return
+
+    @staticmethod
+    def _kacis_sonu(tampon: str, i: int) -> Optional[int]:
+        """tampon[i]'deki ESC ile başlayan dizinin bitiş indeksi (eksikse None)
+
+        CSI (ESC [ ... son bayt) ve SS3 (ESC O x) dizileri tanınır; diğer
+        ESC + karakter çiftleri iki karakterlik dizi sayılır.
+        """
+        if i + 1 >= len(tampon):
+            return None
+        tur = tampon[i + 1]
+        if tur == "O":
+            return i + 3 if i + 2 < len(tampon) else None
+        if tur != "[":
+            return i + 2
+        j = i + 2
+        while j < len(tampon):
+            if "@" <= tampon[j] <= "~":
+                return j + 1
+            j += 1
+        return None
+
+    def komutlari_oku(self, zaman_asimi: Optional[float] = None) -> List[str]:
+        """En az bir tuş gelene kadar bekle, o ana kadar birikenlerin hepsini döndür
+
+        Basılı tutulan bir tuşun otomatik tekrarları tek listede gelir;
+        çağıran bunları tek karede uygulayıp bir kez çizebilir.
+        zaman_asimi dolarsa boş liste döner.
+        """
+        if not self._tampon and not self._hazir_mi(zaman_asimi):
+            return []
+        self._oku()
+
+        komutlar = []
+        tampon = self._tampon
+        i = 0
+        while i < len(tampon):
+            karakter = tampon[i]
+            if karakter == "\x1b":
+                son = self._kacis_sonu(tampon, i)
+                if son is None and self._hazir_mi(_KACIS_BEKLEME):
+                    # Dizinin geri kalanı yolda: oku ve yeniden dene
+                    self._tampon = tampon[i:]
+                    self._oku()
+                    tampon = self._tampon
+                    i = 0
+                    continue
+                if son is None:
+                    i += 1  # Yalnız ESC yok sayılır
+                    continue
+                komut = KACIS_DIZILERI.get(tampon[i:son])
+                if komut:
+                    komutlar.append(komut)
+                i = son  # Tanınmayan diziler (örn. Ctrl+ok) tümüyle atlanır
+                continue
+            komut = TUS_KOMUTLARI.get(karakter.lower())
+            if komut:
+                komutlar.append(komut)
+            i += 1
+        self._tampon = ""
+        return komutlar
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Kompakt Harita
+Haritayı düz bir karo ID dizisinde (array) saklayan bellek dostu arka uç
+"""
+
+from array import array
+from typing import Iterator, List, Optional
+from game_lab import KarakterAnlamSistemi
+
+
+class KompaktSatir:
+    """Kompakt haritanın bir satırına liste benzeri görünüm"""
+
+    __slots__ = ("_harita", "_baslangic")
+
+    def __init__(self, harita: "KompaktHarita", y: int):
+        self._harita = harita
+        self._baslangic = y * harita.adim
+
+    def __len__(self) -> int:
+        return self._harita.genislik
+
+    def _indeks(self, x: int) -> int:
+        genislik = self._harita.genislik
+        if x < 0:
+            x += genislik
+        if x < 0 or x >= genislik:
+            raise IndexError("satır indeksi aralık dışında")
+        return self._baslangic + x
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(len(self)))]
+        harita = self._harita
+        return harita.id_karakterleri[harita.veri[self._indeks(x)]]
+
+    def __setitem__(self, x: int, karakter: str):
+        harita = self._harita
+        harita._id_koy(self._indeks(x), harita.karakter_sistemi.karakter_id(karakter))
+
+    def __iter__(self) -> Iterator[str]:
+        harita = self._harita
+        karakterler = harita.id_karakterleri
+        veri = harita.veri
+        for i in range(self._baslangic, self._baslangic + harita.genislik):
+            yield karakterler[veri[i]]
+
+    def __eq__(self, diger) -> bool:
+        return list(self) == list(diger)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class KompaktHarita:
+    """Haritayı satır adımlı (stride) düz bir karo ID dizisinde saklar
+
+    Karo ID'leri karakter sisteminin derlenmiş tablosundan gelir. ID sayısı
+    256'yı geçmedikçe hücre başına 1 bayt ('B'), geçerse 2 bayt ('H') kullanılır.
+    """
+
+    def __init__(self, genislik: int, yukseklik: int,
+                 karakter_sistemi: KarakterAnlamSistemi,
+                 adim: Optional[int] = None, veri: Optional[array] = None):
+        """Boş (ID 0 = ' ') ya da verilen ID dizisiyle harita oluştur"""
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.adim = adim if adim is not None else genislik
+        if self.adim < genislik:
+            raise ValueError("Satır adımı genişlikten küçük olamaz")
+        self.karakter_sistemi = karakter_sistemi
+        self.id_karakterleri = karakter_sistemi.id_karakterleri
+
+        if veri is None:
+            tip = "B" if len(self.id_karakterleri) <= 256 else "H"
+            veri = array(tip, bytes(self.adim * yukseklik * array(tip).itemsize))
+        elif len(veri) != self.adim * yukseklik:
+            raise ValueError("Veri boyutu harita boyutuyla uyuşmuyor")
+        self.veri = veri
+
+    @classmethod
+    def listeden(cls, harita: List[List[str]],
+                 karakter_sistemi: KarakterAnlamSistemi,
+                 adim: Optional[int] = None) -> "KompaktHarita":
+        """Liste-listesi haritadan kompakt harita oluştur"""
+        yukseklik = len(harita)
+        genislik = len(harita[0]) if yukseklik > 0 else 0
+        if any(len(satir) != genislik for satir in harita):
+            raise ValueError("Kompakt harita için tüm satırlar aynı uzunlukta olmalı")
+
+        kompakt = cls(genislik, yukseklik, karakter_sistemi, adim)
+        karakter_id = karakter_sistemi.karakter_id
+        idler = [[karakter_id(karakter) for karakter in satir] for satir in harita]
+        if len(kompakt.id_karakterleri) > 256 and kompakt.veri.typecode == "B":
+            kompakt.veri = array("H", kompakt.veri)
+
+        veri = kompakt.veri
+        for y, satir in enumerate(idler):
+            baslangic = y * kompakt.adim
+            veri[baslangic:baslangic + genislik] = array(veri.typecode, satir)
+        return kompakt
+
+    def listeye(self) -> List[List[str]]:
+        """Liste-listesi haritaya geri dönüştür"""
+        return [list(satir) for satir in self]
+
+    def kopyala(self) -> "KompaktHarita":
+        """Haritanın bağımsız kopyası (tek tampon kopyası)"""
+        return KompaktHarita(self.genislik, self.yukseklik, self.karakter_sistemi,
+                             self.adim, array(self.veri.typecode, self.veri))
+
+    def id_al(self, x: int, y: int) -> int:
+        """Bir hücrenin karo ID'sini döndür"""
+        return self.veri[y * self.adim + x]
+
+    def id_yaz(self, x: int, y: int, karo_id: int):
+        """Bir hücreye karo ID'si yaz"""
+        self._id_koy(y * self.adim + x, karo_id)
+
+    def _id_koy(self, indeks: int, karo_id: int):
+        """Düz indekse ID yaz; 1 baytlık dizi yetmezse 2 bayta yükselt"""
+        if karo_id > 255 and self.veri.typecode == "B":
+            self.veri = array("H", self.veri)
+        self.veri[indeks] = karo_id
+
+    def bellek_boyutu(self) -> int:
+        """Hücre verisinin bayt cinsinden boyutu"""
+        return len(self.veri) * self.veri.itemsize
+
+    def __len__(self) -> int:
+        return self.yukseklik
+
+    def __getitem__(self, y: int) -> KompaktSatir:
+        if y < 0:
+            y += self.yukseklik
+        if y < 0 or y >= self.yukseklik:
+            raise IndexError("harita indeksi aralık dışında")
+        return KompaktSatir(self, y)
+
+    def __iter__(self) -> Iterator[KompaktSatir]:
+        for y in range(self.yukseklik):
+            yield KompaktSatir(self, y)
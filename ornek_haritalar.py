@@ -114,8 +114,8 @@ def harita_yazdir(harita, baslik="HARİTA"):
 def harita_bilgisi_goster(harita, lab_sistemi=None):
     """Haritanın bilgilerini göster"""
     if lab_sistemi is None:
-        from game_lab import KarakterAnlamSistemi
-        lab_sistemi = KarakterAnlamSistemi()
+        from game_lab import paylasilan_sistem
+        lab_sistemi = paylasilan_sistem()
     
     analiz = lab_sistemi.harita_analiz_et(harita)
     
@@ -136,8 +136,8 @@ def main():
     print("🎮 UNICODE GAME LAB - ÖRNEK HARİTALAR\n")
     
     # Lab sistemi
-    from game_lab import KarakterAnlamSistemi
-    lab = KarakterAnlamSistemi()
+    from game_lab import paylasilan_sistem
+    lab = paylasilan_sistem()
     
     # Harita 1: Basit örnek
     harita_yazdir(ornek_harita_1, "HARİTA 1: BASİT ÖRNEK")
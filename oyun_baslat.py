@@ -5,29 +5,49 @@ Unicode Game Lab - Oyun Başlatıcı
 Hızlı oyun başlatma scripti
 """
 
+import os
 import sys
-from ornek_haritalar import (
-    ornek_harita_1, ornek_harita_2, ornek_harita_3,
-    ornek_harita_4, ornek_harita_5, ornek_harita_6
-)
+import time
+from harita_katalogu import HaritaKatalogu
 from oyun_motoru import OyunMotoru
+from tekrar import kayda_basla, kaydi_bitir, tekrar_yaz
 
-def harita_sec():
-    """Kullanıcıdan harita seçimi al"""
+# Menüde bir sayfada gösterilen harita sayısı
+SAYFA_BOYUTU = 10
+
+# Oturum kayıtlarının (.uglr) yazıldığı dizin
+KAYIT_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kayitlar")
+
+def oturumu_kaydet(motor: OyunMotoru, anahtar: str):
+    """Oturumun hareket kaydını KAYIT_DIZINI'ne yaz (hareket yoksa yazma)"""
+    tekrar = kaydi_bitir(motor, anahtar)
+    if not tekrar.hareket_sayisi:
+        return
+    dosya = os.path.join(KAYIT_DIZINI, f"{anahtar}_{time.strftime('%Y%m%d-%H%M%S')}.uglr")
+    try:
+        os.makedirs(KAYIT_DIZINI, exist_ok=True)
+        tekrar_yaz(tekrar, dosya)
+        print(f"💾 Oturum kaydedildi: {dosya}")
+    except OSError as hata:
+        print(f"⚠️  Oturum kaydedilemedi: {hata}")
+
+def harita_sec(katalog: HaritaKatalogu, sayfa: int = 0):
+    """Kullanıcıdan harita seçimi al (katalog indeksinden, sayfa sayfa)"""
+    sayfa_sayisi = max(1, (len(katalog) + SAYFA_BOYUTU - 1) // SAYFA_BOYUTU)
     print("🎮 UNICODE GAME LAB - OYUN BAŞLAT")
     print("=" * 60)
     print("\nLütfen bir harita seçin:\n")
-    print("1. Basit Örnek (10x10) - Başlangıç için ideal")
-    print("2. Labirent (15x15) - Karmaşık yapı")
-    print("3. Tuzaklar ve Zorluklar (12x12) - Dikenler ve su")
-    print("4. Yönlü İtilebilir Nesneler (11x11)")
-    print("5. Anahtar ve Kapı (13x9)")
-    print("6. Karmaşık (14x14) - Enerji + Tuzaklar")
+    bas = sayfa * SAYFA_BOYUTU
+    for sira in range(bas, min(bas + SAYFA_BOYUTU, len(katalog))):
+        girdi = katalog[sira]
+        print(f"{sira + 1}. {girdi.isim} ({girdi.genislik}x{girdi.yukseklik})")
+    if sayfa_sayisi > 1:
+        print(f"\n   Sayfa {sayfa + 1}/{sayfa_sayisi}  (+ sonraki, - önceki)")
     print("0. Çıkış")
     print("\n" + "=" * 60)
     
     try:
-        secim = input("\nSeçiminiz (1-6, 0=Çıkış): ").strip()
+        secim = input(f"\nSeçiminiz (1-{len(katalog)}, 0=Çıkış): ").strip()
         return secim
     except (EOFError, KeyboardInterrupt):
         return "0"
@@ -42,24 +62,27 @@ def main():
         except:
             pass
     
-    haritalar = {
-        "1": ("Basit Örnek", ornek_harita_1),
-        "2": ("Labirent", ornek_harita_2),
-        "3": ("Tuzaklar ve Zorluklar", ornek_harita_3),
-        "4": ("Yönlü İtilebilir Nesneler", ornek_harita_4),
-        "5": ("Anahtar ve Kapı", ornek_harita_5),
-        "6": ("Karmaşık", ornek_harita_6),
-    }
+    # Paketlerde yalnızca indeks okunur; harita seçilince yüklenir
+    katalog = HaritaKatalogu(sys.argv[1:]) if len(sys.argv) > 1 else HaritaKatalogu()
+    sayfa = 0
     
     while True:
-        secim = harita_sec()
+        secim = harita_sec(katalog, sayfa)
         
         if secim == "0":
             print("\n👋 Görüşmek üzere!")
             break
         
-        if secim in haritalar:
-            isim, harita = haritalar[secim]
+        if secim in ("+", "-"):
+            son_sayfa = max(0, (len(katalog) - 1) // SAYFA_BOYUTU)
+            sayfa = min(son_sayfa, sayfa + 1) if secim == "+" else max(0, sayfa - 1)
+            continue
+        
+        if secim.isdigit() and 1 <= int(secim) <= len(katalog):
+            girdi = katalog[int(secim) - 1]
+            isim = girdi.isim
+            bilgi = katalog.bilgi_yukle(girdi)
+            harita = bilgi["harita"]
             
             print(f"\n📋 Seçilen harita: {isim}")
             print("\nKontroller:")
@@ -67,13 +90,18 @@ def main():
             print("  S / ↓ : Aşağı")
             print("  A / ← : Sol")
             print("  D / → : Sağ")
+            print("  G     : Geri al")
+            print("  Y     : Yinele")
+            print("  I     : İpucu (en yakın hedefe yol)")
             print("  Q     : Oyundan çık")
             
             input("\n🎮 Oyunu başlatmak için Enter'a basın...")
             
             # Oyun motorunu başlat
-            motor = OyunMotoru(harita)
+            motor = OyunMotoru(harita, hedefler=bilgi.get("hedefler"))
+            kayda_basla(motor)
             motor.oyunu_baslat()
+            oturumu_kaydet(motor, girdi.anahtar)
             
             # Oyun bittikten sonra tekrar oynamak ister misiniz?
             print("\n" + "=" * 60)
@@ -85,7 +113,7 @@ def main():
             except (EOFError, KeyboardInterrupt):
                 break
         else:
-            print("\n❌ Geçersiz seçim! Lütfen 1-6 arası bir sayı girin.\n")
+            print(f"\n❌ Geçersiz seçim! Lütfen 1-{len(katalog)} arası bir sayı girin.\n")
             input("Devam etmek için Enter'a basın...")
 
 if __name__ == "__main__":
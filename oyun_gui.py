@@ -8,15 +8,54 @@ Tkinter ile görsel oyun arayüzü
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
-from typing import List, Tuple, Optional
-from game_lab import KarakterAnlamSistemi
-from oyun_motoru import OyunMotoru
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from game_lab import paylasilan_sistem
+from oyun_motoru import IPUCU_KOMUTU, OyunMotoru
+from yol_bulucu import SONSUZ
+
+# Karakterden emoji'ye dönüşüm haritası
+EMOJI_HARITASI = {
+    "P": "🧑",  # Oyuncu
+    "p": "🧑",  # Oyuncu (küçük harf)
+    "O": "⭐",  # Hedef
+    "o": "⭐",  # Hedef (küçük harf)
+    "#": "⬛",  # Blok
+    "■": "⬛",  # Blok
+    "□": "⬜",  # Blok (açık)
+    "~": "💧",  # Su
+    "K": "🔑",  # Anahtar
+    "k": "🔑",  # Anahtar (küçük harf)
+    "D": "🚪",  # Kapı
+    "d": "🚪",  # Kapı (küçük harf)
+    "X": "💀",  # Tuzak
+    "x": "💀",  # Tuzak (küçük harf)
+    "<": "▶️",  # Diken
+    ">": "◀️",  # Diken
+    "▲": "⬆️",  # Diken yukarı
+    "△": "⬆️",  # Diken yukarı
+    "▷": "➡️",  # Diken sağ
+    "▼": "⬇️",  # Diken aşağı
+    "◁": "⬅️",  # Diken sol
+    "|": "▮",   # Duvar dikey
+    "-": "▬",   # Duvar yatay
+    "=": "▬",   # Duvar kalın
+}
+_EMOJI_METINLERI = frozenset(EMOJI_HARITASI.values())
+
+
+class HucreStili(NamedTuple):
+    """Bir karonun değişmez çizim stili"""
+    renk: str
+    metin: str
+    font: tuple
+    metin_rengi: str
 
 
 class OyunGUI:
     """Grafik arayüzlü oyun motoru"""
     
-    def __init__(self, root: tk.Tk, harita: List[List[str]], harita_adi: str = "Harita"):
+    def __init__(self, root: tk.Tk, harita: List[List[str]], harita_adi: str = "Harita",
+                 hedefler: Optional[List[Tuple[int, int]]] = None):
         self.root = root
         self.root.title(f"🎮 Unicode Game Lab - {harita_adi}")
         self.root.geometry("800x700")
@@ -24,8 +63,14 @@ class OyunGUI:
         
         # Harita ve motor
         self.harita = [satir[:] for satir in harita]
-        self.karakter_sistemi = KarakterAnlamSistemi()
-        self.motor = OyunMotoru(self.harita, self.karakter_sistemi)
+        self.hedefler = hedefler  # Haritada görünmeyen ek hedefler (XSB'den)
+        self.karakter_sistemi = paylasilan_sistem()
+        self.motor = self._motor_olustur()
+        # Görünür (x, y) -> (dikdörtgen ID, metin ID); yalnızca görüş alanı
+        # (+ kenar payı) içindeki hücrelerin öğesi vardır
+        self._hucre_ogeleri: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # Görüş alanından çıkan hücrelerin gizlenmiş, yeniden kullanılacak öğeleri
+        self._oge_havuzu: List[Tuple[int, int]] = []
         
         # Renk şeması (neon mavi tema)
         self.colors = {
@@ -39,12 +84,19 @@ class OyunGUI:
             "target": "#ffff00",
             "water": "#0080ff",
             "box": "#ff6b00",
-            "wall": "#333333"
+            "wall": "#333333",
+            "hint": "#ff4fd8"
         }
+        # Karakter başına çizim stilleri (tema ve karakter sistemine bağlı)
+        self._stil_onbellegini_kur()
         
         # Hücre boyutu
         self.cell_size = 40
         self.padding = 10
+        # Görüş alanı dışında önceden hazırlanan hücre sayısı
+        self.gorus_payi = 2
+        # En yakın hedefe giden yol çizilsin mi? (I tuşu)
+        self.ipucu_goster = False
         
         # Arayüz oluştur
         self._arayuz_olustur()
@@ -73,7 +125,7 @@ class OyunGUI:
         # Bilgi etiketleri
         info_text = tk.Label(
             info_frame,
-            text="W/A/S/D veya ↑↓←→ ile hareket | Q: Çıkış",
+            text="W/A/S/D veya ↑↓←→ ile hareket | G: Geri al | Y: Yinele | I: İpucu | Q: Çıkış",
             font=("Arial", 10),
             fg=self.colors["text_soft"],
             bg=self.colors["bg_light"]
@@ -96,8 +148,9 @@ class OyunGUI:
             xscrollcommand=scrollbar_x.set
         )
         
-        scrollbar_y.config(command=self.canvas.yview)
-        scrollbar_x.config(command=self.canvas.xview)
+        scrollbar_y.config(command=self._kaydir_y)
+        scrollbar_x.config(command=self._kaydir_x)
+        self.canvas.bind("<Configure>", lambda event: self._gorunumu_guncelle())
         
         scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
@@ -166,15 +219,9 @@ class OyunGUI:
         )
         exit_btn.pack(side=tk.RIGHT, padx=5)
     
-    def _karakter_rengi(self, karakter: str) -> str:
-        """Karaktere göre renk döndür"""
-        bilgi = self.karakter_sistemi.karakter_bul(karakter)
-        if not bilgi:
-            return "#ffffff"
-        
-        ozellik = bilgi.get("ozellik", "")
-        
-        renk_haritasi = {
+    def _renk_haritasini_kur(self):
+        """Özellik -> dolgu rengi tablosunu temadan bir kez kur"""
+        self._renk_haritasi = {
             "Oyuncu": self.colors["player"],
             "Hedef": self.colors["target"],
             "Blok": self.colors["block"],
@@ -190,12 +237,84 @@ class OyunGUI:
             "Enerji": "#00ffff",
             "Boş": self.colors["bg"]
         }
+    
+    def _karakter_rengi(self, karakter: str) -> str:
+        """Karaktere göre renk döndür"""
+        bilgi = self.karakter_sistemi.karakter_bul(karakter)
+        if not bilgi:
+            return "#ffffff"
+        return self._renk_haritasi.get(bilgi.get("ozellik", ""), "#ffffff")
+    
+    def _motor_olustur(self) -> OyunMotoru:
+        """Orijinal haritadan değişen hücreleri raporlayan bir motor kur"""
+        motor = OyunMotoru(self.harita, self.karakter_sistemi, hedefler=self.hedefler)
+        motor.degisen_hucreler = []
+        return motor
+    
+    def _stil_onbellegini_kur(self):
+        """Bilinen tüm karakterlerin çizim stillerini bir kez çöz
+        
+        Tema (self.colors) değiştiğinde yeniden çağrılmalıdır; karakter
+        sistemine karakter_ekle ile yeni karakter eklenmesi ise sürüm
+        numarasından anlaşılır ve önbellek kendiliğinden yenilenir.
+        """
+        self._renk_haritasini_kur()
+        self._stil_surumu = self.karakter_sistemi.surum
+        self._stil_onbellegi: Dict[str, HucreStili] = {}
+        for karakter in self.karakter_sistemi.id_karakterleri:
+            self._stil_onbellegi[karakter] = self._stil_hesapla(karakter)
+    
+    def _hucre_stili(self, karakter: str) -> HucreStili:
+        """Bir karakter için önbellekteki (dolgu, metin, font, metin rengi) kaydı"""
+        if self._stil_surumu != self.karakter_sistemi.surum:
+            self._stil_onbellegini_kur()
+        stil = self._stil_onbellegi.get(karakter)
+        if stil is None:
+            stil = self._stil_onbellegi[karakter] = self._stil_hesapla(karakter)
+        return stil
+    
+    def _stil_hesapla(self, karakter: str) -> HucreStili:
+        """Bir karakterin çizim stilini karakter sistemi ve temadan hesapla"""
+        renk = self._karakter_rengi(karakter)
+        if not karakter or karakter == " ":
+            return HucreStili(renk, "", ("Arial", 16, "bold"), self.colors["text"])
+        
+        # Emoji haritasında varsa kullan, yoksa orijinal karakter
+        text = EMOJI_HARITASI.get(karakter, karakter)
+        
+        # Text renk (emoji'ler için uygun renkler)
+        bilgi = self.karakter_sistemi.karakter_bul(karakter)
+        if karakter in ["P", "p"]:
+            text_color = "#ffffff"  # Oyuncu emoji için beyaz
+        elif karakter in ["O", "o"]:
+            text_color = "#ffff00"  # Hedef emoji için sarı
+        elif karakter == "~":
+            text_color = "#00bfff"  # Su emoji için mavi
+        elif bilgi and bilgi.get("ozellik") in ["İtilebilir", "Yönlü İtilebilir"]:
+            text_color = "#ffffff"  # İtilebilir nesneler için beyaz
+        elif karakter in EMOJI_HARITASI:
+            text_color = "#ffffff"  # Diğer emoji'ler için beyaz
+        else:
+            text_color = self.colors["text"] if renk == self.colors["bg"] else "#ffffff"
         
-        return renk_haritasi.get(ozellik, "#ffffff")
+        # Emoji'ler için daha büyük font, normal karakterler için standart
+        if text in _EMOJI_METINLERI:
+            font_adi = ("Segoe UI Emoji", 24)
+        else:
+            font_adi = ("Arial", 16, "bold")
+        
+        return HucreStili(renk, text, font_adi, text_color)
     
     def _haritayi_ciz(self):
-        """Haritayı canvas üzerine çiz"""
+        """Haritayı canvas üzerine baştan kur (ilk açılış ve yeniden başlatma)
+        
+        Kaydırma bölgesi tüm haritayı kapsar, ancak öğeler yalnızca görünen
+        hücreler için oluşturulur; hareketlerden sonra _hucreleri_guncelle
+        sadece değişen hücreleri düzenler.
+        """
         self.canvas.delete("all")
+        self._hucre_ogeleri = {}
+        self._oge_havuzu = []
         
         if not self.motor.harita:
             return
@@ -209,109 +328,187 @@ class OyunGUI:
         
         self.canvas.config(scrollregion=(0, 0, canvas_width, canvas_height))
         
-        # Her hücreyi çiz
-        for y, satir in enumerate(self.motor.harita):
-            for x, karakter in enumerate(satir):
-                x1 = x * self.cell_size + self.padding
-                y1 = y * self.cell_size + self.padding
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                
-                # Arka plan
-                renk = self._karakter_rengi(karakter)
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=renk,
-                    outline=self.colors["border"],
-                    width=1,
-                    tags=f"cell_{x}_{y}"
-                )
-                
-                # Karakteri göster (emoji veya metin)
-                if karakter and karakter != " ":
-                    # Karakterden emoji'ye dönüşüm haritası
-                    emoji_haritasi = {
-                        "P": "🧑",  # Oyuncu
-                        "p": "🧑",  # Oyuncu (küçük harf)
-                        "O": "⭐",  # Hedef
-                        "o": "⭐",  # Hedef (küçük harf)
-                        "#": "⬛",  # Blok
-                        "■": "⬛",  # Blok
-                        "□": "⬜",  # Blok (açık)
-                        "~": "💧",  # Su
-                        "K": "🔑",  # Anahtar
-                        "k": "🔑",  # Anahtar (küçük harf)
-                        "D": "🚪",  # Kapı
-                        "d": "🚪",  # Kapı (küçük harf)
-                        "X": "💀",  # Tuzak
-                        "x": "💀",  # Tuzak (küçük harf)
-                        "<": "▶️",  # Diken
-                        ">": "◀️",  # Diken
-                        "▲": "⬆️",  # Diken yukarı
-                        "△": "⬆️",  # Diken yukarı
-                        "▷": "➡️",  # Diken sağ
-                        "▼": "⬇️",  # Diken aşağı
-                        "◁": "⬅️",  # Diken sol
-                        "|": "▮",   # Duvar dikey
-                        "-": "▬",   # Duvar yatay
-                        "=": "▬",   # Duvar kalın
-                    }
-                    
-                    # Emoji haritasında varsa kullan, yoksa orijinal karakter
-                    text = emoji_haritasi.get(karakter, karakter)
-                    
-                    # Text renk (emoji'ler için uygun renkler)
-                    if karakter in ["P", "p"]:
-                        text_color = "#ffffff"  # Oyuncu emoji için beyaz
-                    elif karakter in ["O", "o"]:
-                        text_color = "#ffff00"  # Hedef emoji için sarı
-                    elif karakter == "~":
-                        text_color = "#00bfff"  # Su emoji için mavi
-                    elif self.karakter_sistemi.karakter_bul(karakter) and \
-                         self.karakter_sistemi.karakter_bul(karakter).get("ozellik") in ["İtilebilir", "Yönlü İtilebilir"]:
-                        text_color = "#ffffff"  # İtilebilir nesneler için beyaz
-                    elif karakter in emoji_haritasi and karakter not in ["P", "p", "O", "o", "~"]:
-                        text_color = "#ffffff"  # Diğer emoji'ler için beyaz
-                    else:
-                        text_color = self.colors["text"] if renk == self.colors["bg"] else "#ffffff"
-                    
-                    # Emoji'ler için daha büyük font, normal karakterler için standart
-                    font_boyutu = 24 if text in emoji_haritasi.values() else 16
-                    font_adi = ("Segoe UI Emoji", font_boyutu) if text in emoji_haritasi.values() else ("Arial", font_boyutu, "bold")
-                    
-                    self.canvas.create_text(
-                        (x1 + x2) / 2,
-                        (y1 + y2) / 2,
-                        text=text,
-                        font=font_adi,
-                        fill=text_color,
-                        tags=f"text_{x}_{y}"
-                    )
-        
-        # Canvas'ı ortala ve scroll ayarla
+        # Canvas boyutları bilinsin diye bir kez güncelle, sonra oyuncuya odaklan
         self.canvas.update()
-        canvas_frame_width = self.canvas.winfo_width()
-        canvas_frame_height = self.canvas.winfo_height()
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        self._kamerayi_takip_et(ortala=True)
         
-        if canvas_width < canvas_frame_width:
-            scroll_x = (canvas_frame_width - canvas_width) / 2
-            self.canvas.xview_moveto(0)
-        else:
-            scroll_x = 0
-        
-        if canvas_height < canvas_frame_height:
-            scroll_y = (canvas_frame_height - canvas_height) / 2
-            self.canvas.yview_moveto(0)
-        else:
-            scroll_y = 0
+        self.motor.degisen_hucreler.clear()
+        self._ipucu_ciz()
         
         # Durum güncelle
         self._durum_guncelle()
     
+    def _gorunen_aralik(self) -> Tuple[int, int, int, int]:
+        """Görüş alanındaki (+ kenar payı) hücre aralığı: x0, y0, x1, y1 (dahil değil)"""
+        harita = self.motor.harita
+        rows = len(harita)
+        cols = len(harita[0]) if rows > 0 else 0
+        sol = self.canvas.canvasx(0)
+        ust = self.canvas.canvasy(0)
+        sag = sol + self.canvas.winfo_width()
+        alt = ust + self.canvas.winfo_height()
+        
+        boyut = self.cell_size
+        pay = self.gorus_payi
+        x0 = max(0, int((sol - self.padding) // boyut) - pay)
+        y0 = max(0, int((ust - self.padding) // boyut) - pay)
+        x1 = min(cols, int((sag - self.padding) // boyut) + 1 + pay)
+        y1 = min(rows, int((alt - self.padding) // boyut) + 1 + pay)
+        return x0, y0, x1, y1
+    
+    def _gorunumu_guncelle(self):
+        """Görüş alanına girip çıkan hücreler için öğeleri havuzdan dağıt/geri al"""
+        if not self.motor.harita:
+            return
+        x0, y0, x1, y1 = self._gorunen_aralik()
+        
+        # Alan dışına çıkan hücrelerin öğelerini gizleyip havuza koy
+        for konum in [k for k in self._hucre_ogeleri
+                      if not (x0 <= k[0] < x1 and y0 <= k[1] < y1)]:
+            rect_id, text_id = self._hucre_ogeleri.pop(konum)
+            self.canvas.itemconfig(rect_id, state="hidden")
+            self.canvas.itemconfig(text_id, state="hidden")
+            self._oge_havuzu.append((rect_id, text_id))
+        
+        # Alana giren hücrelere öğe ata
+        harita = self.motor.harita
+        for y in range(y0, y1):
+            satir = harita[y]
+            for x in range(x0, min(x1, len(satir))):
+                if (x, y) not in self._hucre_ogeleri:
+                    self._hucre_ogeleri[(x, y)] = self._oge_ata(x, y, satir[x])
+        # Yeni oluşturulan hücre öğeleri ipucu yolunu örtmesin
+        self.canvas.tag_raise("ipucu")
+    
+    def _oge_ata(self, x: int, y: int, karakter: str) -> Tuple[int, int]:
+        """Bir hücreye havuzdan (yoksa yeni) dikdörtgen + metin öğesi ver"""
+        x1 = x * self.cell_size + self.padding
+        y1 = y * self.cell_size + self.padding
+        x2 = x1 + self.cell_size
+        y2 = y1 + self.cell_size
+        renk, text, font_adi, text_color = self._hucre_stili(karakter)
+        
+        if self._oge_havuzu:
+            rect_id, text_id = self._oge_havuzu.pop()
+            self.canvas.coords(rect_id, x1, y1, x2, y2)
+            self.canvas.coords(text_id, (x1 + x2) / 2, (y1 + y2) / 2)
+            self.canvas.itemconfig(rect_id, fill=renk, state="normal")
+            self.canvas.itemconfig(text_id, text=text, font=font_adi,
+                                   fill=text_color, state="normal")
+            return rect_id, text_id
+        
+        rect_id = self.canvas.create_rectangle(
+            x1, y1, x2, y2,
+            fill=renk,
+            outline=self.colors["border"],
+            width=1
+        )
+        text_id = self.canvas.create_text(
+            (x1 + x2) / 2,
+            (y1 + y2) / 2,
+            text=text,
+            font=font_adi,
+            fill=text_color
+        )
+        return rect_id, text_id
+    
+    def _kaydir_x(self, *args):
+        """Yatay kaydırma çubuğu: kaydır ve görüş alanını güncelle"""
+        self.canvas.xview(*args)
+        self._gorunumu_guncelle()
+    
+    def _kaydir_y(self, *args):
+        """Dikey kaydırma çubuğu: kaydır ve görüş alanını güncelle"""
+        self.canvas.yview(*args)
+        self._gorunumu_guncelle()
+    
+    def _kamerayi_takip_et(self, ortala: bool = False):
+        """Oyuncu görüş alanının kenarına yaklaştıysa kamerayı ona ortala"""
+        harita = self.motor.harita
+        rows = len(harita)
+        cols = len(harita[0]) if rows > 0 else 0
+        toplam_genislik = cols * self.cell_size + 2 * self.padding
+        toplam_yukseklik = rows * self.cell_size + 2 * self.padding
+        gorunen_genislik = self.canvas.winfo_width()
+        gorunen_yukseklik = self.canvas.winfo_height()
+        
+        oyuncu_x = self.motor.oyuncu_x * self.cell_size + self.padding + self.cell_size / 2
+        oyuncu_y = self.motor.oyuncu_y * self.cell_size + self.padding + self.cell_size / 2
+        sol = self.canvas.canvasx(0)
+        ust = self.canvas.canvasy(0)
+        kenar = 2 * self.cell_size
+        
+        if toplam_genislik > gorunen_genislik and (
+                ortala or not (sol + kenar <= oyuncu_x <= sol + gorunen_genislik - kenar)):
+            hedef = min(max(0, oyuncu_x - gorunen_genislik / 2),
+                        toplam_genislik - gorunen_genislik)
+            self.canvas.xview_moveto(hedef / toplam_genislik)
+        if toplam_yukseklik > gorunen_yukseklik and (
+                ortala or not (ust + kenar <= oyuncu_y <= ust + gorunen_yukseklik - kenar)):
+            hedef = min(max(0, oyuncu_y - gorunen_yukseklik / 2),
+                        toplam_yukseklik - gorunen_yukseklik)
+            self.canvas.yview_moveto(hedef / toplam_yukseklik)
+        
+        self._gorunumu_guncelle()
+    
+    def _hucreleri_guncelle(self, hucreler):
+        """Yalnızca verilen hücrelerin öğelerini itemconfig ile güncelle
+        
+        Görüş alanı dışındaki hücrelerin öğesi yoktur; alana girdiklerinde
+        güncel halleriyle çizilirler.
+        """
+        harita = self.motor.harita
+        for x, y in set(hucreler):
+            ogeler = self._hucre_ogeleri.get((x, y))
+            if ogeler is None:
+                continue
+            renk, text, font_adi, text_color = self._hucre_stili(harita[y][x])
+            self.canvas.itemconfig(ogeler[0], fill=renk)
+            self.canvas.itemconfig(ogeler[1], text=text, font=font_adi, fill=text_color)
+    
+    def _ipucu_ciz(self):
+        """İpucu açıksa en yakın hedefe giden yolu hücre ortalarına noktalarla çiz
+        
+        Mesafe alanı motorun yol bulucusunda önbelleklenir; her hareket
+        yalnızca yolu izleyip noktaları yeniden yerleştirir.
+        """
+        self.canvas.delete("ipucu")
+        if not self.ipucu_goster:
+            return
+        boyut = self.cell_size
+        yaricap = boyut / 8
+        for x, y in self.motor.ipucu().yol[:-1]:  # Hedef hücresi görünür kalır
+            orta_x = x * boyut + self.padding + boyut / 2
+            orta_y = y * boyut + self.padding + boyut / 2
+            self.canvas.create_oval(
+                orta_x - yaricap, orta_y - yaricap, orta_x + yaricap, orta_y + yaricap,
+                fill=self.colors["hint"], outline="", tags="ipucu"
+            )
+    
+    def _ipucu_metni(self) -> str:
+        """Durum satırı için ipucu metni (ipucu kapalıysa boş)"""
+        if not self.ipucu_goster:
+            return ""
+        ipucu = self.motor.ipucu()
+        if ipucu.komut is not None:
+            return f" | 💡 İpucu: {ipucu.komut} ({ipucu.mesafe:g})"
+        if ipucu.mesafe == SONSUZ:
+            return " | 💡 İpucu: hedefe itmeden ulaşılamıyor"
+        return ""
+    
     def _durum_guncelle(self):
         """Durum bilgisini güncelle"""
         hareket = self.motor.hareket_sayisi
-        self.status_label.config(text=f"Hareket: {hareket}")
+        if self.motor.kilitlenme_var_mi():
+            self.status_label.config(
+                text=f"Hareket: {hareket} | ⚠️ Kilitlenme: hedefler artık örtülemez",
+                fg="#ff3333"
+            )
+        else:
+            self.status_label.config(text=f"Hareket: {hareket}{self._ipucu_metni()}",
+                                     fg=self.colors["text"])
         
         # Hedefe ulaşıldı mı kontrol
         if self.motor._hedefe_ulasildi_mi():
@@ -333,6 +530,10 @@ class OyunGUI:
             "s": "S",
             "d": "D",
             "q": "Q",
+            "g": "G",  # Geri al
+            "z": "G",
+            "y": "Y",  # Yinele
+            "i": IPUCU_KOMUTU,  # İpucu göster / gizle
             "Up": "W",
             "Down": "S",
             "Left": "A",
@@ -346,16 +547,25 @@ class OyunGUI:
                 self.root.quit()
             return
         
+        if komut == IPUCU_KOMUTU:
+            self.ipucu_goster = not self.ipucu_goster
+            self._ipucu_ciz()
+            self._durum_guncelle()
+            return
+        
         if komut:
-            self.motor._komut_islem(komut)
-            self._haritayi_ciz()
+            sonuc = self.motor.adim(komut)
+            if sonuc.hareket_etti:
+                self._hucreleri_guncelle(self.motor.degisen_hucreler)
+                self.motor.degisen_hucreler.clear()
+                self._kamerayi_takip_et()
+                self._ipucu_ciz()
+                self._durum_guncelle()
     
     def _yeniden_baslat(self):
         """Oyunu yeniden başlat"""
-        from copy import deepcopy
-        # Orijinal haritayı yeniden yükle
-        orijinal_harita = [[karakter for karakter in satir] for satir in self.harita]
-        self.motor = OyunMotoru(orijinal_harita, self.karakter_sistemi)
+        # Orijinal haritayı yeniden yükle (motor kendi kopyasını alır)
+        self.motor = self._motor_olustur()
         self._haritayi_ciz()
     
     def _anasayfaya_don(self):
@@ -368,10 +578,7 @@ class OyunGUI:
 
 def main():
     """Ana fonksiyon - GUI ile oyun başlat"""
-    from ornek_haritalar import (
-        ornek_harita_1, ornek_harita_2, ornek_harita_3,
-        ornek_harita_4, ornek_harita_5, ornek_harita_6
-    )
+    from harita_katalogu import HaritaKatalogu
     
     # Windows UTF-8 desteği
     if sys.platform == 'win32':
@@ -400,41 +607,63 @@ def main():
             bg="#020617"
         ).pack(pady=20)
         
-        haritalar = [
-            ("Basit Örnek", ornek_harita_1),
-            ("Labirent", ornek_harita_2),
-            ("Tuzaklar ve Zorluklar", ornek_harita_3),
-            ("Yönlü İtilebilir Nesneler", ornek_harita_4),
-            ("Anahtar ve Kapı", ornek_harita_5),
-            ("Karmaşık", ornek_harita_6),
-        ]
+        # Yalnızca indeks okunur; harita seçildiğinde diskten yüklenir
+        katalog = HaritaKatalogu()
         
-        def harita_baslat(isim, harita):
+        liste_cercevesi = tk.Frame(menu_window, bg="#020617")
+        liste_cercevesi.pack(fill=tk.BOTH, expand=True, padx=20)
+        kaydirma = tk.Scrollbar(liste_cercevesi)
+        liste = tk.Listbox(
+            liste_cercevesi,
+            font=("Arial", 11),
+            bg="#1a1a2e",
+            fg="#1ec8ff",
+            selectbackground="#2a2a3e",
+            selectforeground="#6be7ff",
+            activestyle="none",
+            yscrollcommand=kaydirma.set
+        )
+        kaydirma.config(command=liste.yview)
+        kaydirma.pack(side=tk.RIGHT, fill=tk.Y)
+        liste.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        liste.insert(tk.END, *(f"{girdi.isim} ({girdi.genislik}x{girdi.yukseklik})"
+                               for girdi in katalog))
+        if len(katalog):
+            liste.selection_set(0)
+        
+        def harita_baslat(event=None):
+            secili = liste.curselection()
+            if not secili:
+                return
+            girdi = katalog[secili[0]]
+            bilgi = katalog.bilgi_yukle(girdi)
             menu_window.destroy()
             root.destroy()  # Menü penceresini kapat
             
             # Yeni pencere ile oyunu başlat
             game_root = tk.Tk()
-            app = OyunGUI(game_root, harita, isim)
+            app = OyunGUI(game_root, bilgi["harita"], girdi.isim, bilgi.get("hedefler"))
             game_root.mainloop()
         
-        for isim, harita in haritalar:
-            btn = tk.Button(
-                menu_window,
-                text=isim,
-                command=lambda i=isim, h=harita: harita_baslat(i, h),
-                font=("Arial", 11),
-                bg="#1a1a2e",
-                fg="#1ec8ff",
-                activebackground="#2a2a3e",
-                activeforeground="#6be7ff",
-                relief=tk.RAISED,
-                bd=2,
-                cursor="hand2",
-                width=30,
-                height=2
-            )
-            btn.pack(pady=5)
+        liste.bind("<Double-Button-1>", harita_baslat)
+        liste.bind("<Return>", harita_baslat)
+        liste.focus_set()
+        
+        tk.Button(
+            menu_window,
+            text="▶️ Başlat",
+            command=harita_baslat,
+            font=("Arial", 11),
+            bg="#1a1a2e",
+            fg="#1ec8ff",
+            activebackground="#2a2a3e",
+            activeforeground="#6be7ff",
+            relief=tk.RAISED,
+            bd=2,
+            cursor="hand2",
+            width=30,
+            height=2
+        ).pack(pady=(15, 0))
         
         tk.Button(
             menu_window,
@@ -5,10 +5,21 @@ Unicode Game Lab - Oyun Motoru
 Oynanabilir terminal tabanlı oyun motoru
 """
 
+import copy
 import os
 import sys
-from typing import List, Tuple, Optional
-from game_lab import KarakterAnlamSistemi
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Optional, Union
+from game_lab import (
+    KarakterAnlamSistemi, paylasilan_sistem, GECILEBILIR, ITILEBILIR, HEDEF, OYUNCU, ITME_ALANI
+)
+from erisilebilirlik import ErisimIndeksi
+from kilitlenme import KilitlenmeAnalizi, KilitTakibi
+from klavye import HamKlavye, ham_mod_destekleniyor
+from kompakt_harita import KompaktHarita
+from parcali_harita import ParcaliHarita
+from terminal_cizici import TerminalCizici
+from yol_bulucu import SONSUZ, VARSAYILAN_HEDEF, HedefTanimi, Ipucu, YolBulucu, paylasilan_yol_bulucu
 
 # Windows konsolunda UTF-8 desteği için
 if sys.platform == 'win32':
@@ -19,23 +30,146 @@ if sys.platform == 'win32':
         pass
 
 
+# Hareket kurallarının sürümü: aynı kayıt farklı sonuç verecek her kural
+# değişikliğinde artırılır (tekrar.py kayıtları bu sürümle damgalanır)
+MOTOR_SURUMU = 2  # 2: "~" artık geçilebilir Su (eskiden Asit olarak çözülüyordu)
+
+# Parçalı (açık dünya) haritalarda oyuncu çevresinde çizilen pencere
+GORUS_ALANI = (40, 20)
+
+# Haritada görünmeyen hedefler boşaldığında yazılan karakter
+HEDEF_KARAKTERI = "O"
+
+# Geri alma günlüğünde tutulan en fazla hareket (kayıt başına ~100 bayt)
+GUNLUK_SINIRI = 100_000
+
+# Geri alma / yineleme komutları
+GERI_AL_KOMUTU = "G"
+YINELE_KOMUTU = "Y"
+
+# İpucu (en yakın hedefe yol) gösterimini açıp kapatan komut
+IPUCU_KOMUTU = "I"
+
+# İpucu açıkken terminalde yol hücrelerine çizilen karakter
+YOL_KARAKTERI = "·"
+
+# Komut -> (dx, dy) yön tablosu
+HAREKET_HARITASI = {
+    "W": (0, -1),  # Yukarı
+    "S": (0, 1),   # Aşağı
+    "A": (-1, 0),  # Sol
+    "D": (1, 0),   # Sağ
+    "↑": (0, -1),
+    "↓": (0, 1),
+    "←": (-1, 0),
+    "→": (1, 0),
+    "8": (0, -1),  # Numpad
+    "2": (0, 1),
+    "4": (-1, 0),
+    "6": (1, 0),
+}
+
+
+class AdimSonucu(NamedTuple):
+    """Başsız (headless) adım API'sinin sonuç kaydı"""
+    hareket_etti: bool    # Oyuncu yer değiştirdi mi?
+    itildi: bool          # Bir nesne itildi mi?
+    kazanildi: bool       # Tüm hedefler örtülü mü?
+    hareket_sayisi: int   # Toplam başarılı hareket sayısı
+
+
+class AnlikDurum(NamedTuple):
+    """anlik_durum() ile alınan, geri_yukle() ile dönülen motor durumu
+    
+    Liste haritalarda satırlar motorla paylaşılır (motor yazacağı satırı
+    önce kopyalar); kompakt haritalarda tamponun bir kopyası tutulur.
+    """
+    harita: Union[Tuple[List[str], ...], KompaktHarita]
+    oyuncu_x: int
+    oyuncu_y: int
+    acik_hedefler: Set[Tuple[int, int]]  # Paylaşılır; kimse yerinde değiştirmez
+    hareket_sayisi: int
+    itme_sayisi: int
+    icerik_ozeti: Optional[int]
+
+
 class OyunMotoru:
     """Terminal tabanlı oyun motoru"""
     
-    def __init__(self, harita: List[List[str]], karakter_sistemi: Optional[KarakterAnlamSistemi] = None):
-        """Oyun motorunu başlat"""
-        self.harita = [satir[:] for satir in harita]  # Kopyala
-        self.karakter_sistemi = karakter_sistemi or KarakterAnlamSistemi()
+    def __init__(self, harita: Union[List[List[str]], KompaktHarita, ParcaliHarita],
+                 karakter_sistemi: Optional[KarakterAnlamSistemi] = None,
+                 kompakt: bool = False,
+                 hedefler: Optional[Iterable[Tuple[int, int]]] = None,
+                 gunluk_siniri: int = GUNLUK_SINIRI):
+        """Oyun motorunu başlat
+        
+        kompakt=True ise harita düz bir karo ID dizisinde (KompaktHarita)
+        saklanır; self.harita yine harita[y][x] biçiminde okunabilir.
+        hedefler, haritada görünmeyen (başlangıçta üzerinde oyuncu veya
+        itilebilir nesne duran) ek hedef konumlarıdır; boşaldıklarında
+        HEDEF_KARAKTERI ile gösterilirler.
+        ParcaliHarita kopyalanmaz; motor diskteki dünyayı doğrudan değiştirir
+        (kaydetmek çağırana aittir).
+        gunluk_siniri, geri alınabilecek en fazla hareket sayısıdır (0 ise
+        günlük tutulmaz); sınır aşılınca en eski hareketler unutulur.
+        """
+        self.karakter_sistemi = karakter_sistemi or paylasilan_sistem()
+        # Parçalı haritada oyuncu yeni bir parçaya geçerken komşular önyüklenir
+        self._yakini_yukle = None
+        if isinstance(harita, ParcaliHarita):
+            self.harita = harita
+            self._yakini_yukle = harita.yakini_yukle
+        elif isinstance(harita, KompaktHarita):
+            self.harita = harita.kopyala()  # Tek tampon kopyası
+        elif kompakt:
+            self.harita = KompaktHarita.listeden(harita, self.karakter_sistemi)
+        else:
+            self.harita = [satir[:] for satir in harita]  # Kopyala
+        # Yazma öncesi kopyalanmış (bu motora ait) satırlar; None ise tüm
+        # satırlar bu motorundur. Çatal ve anlık durum satırları paylaşır.
+        self._sahip_satirlar: Optional[Set[int]] = None
+        # Açık hedef kümesi başka bir motor ya da anlık durumla paylaşılıyor mu?
+        self._hedefler_paylasiliyor = False
+        # Karakter -> bayrak maskesi (sıcak yollarda tek sözlük erişimi)
+        self._bayraklar = self.karakter_sistemi.bayrak_haritasi
         self.oyuncu_x, self.oyuncu_y = self._oyuncu_konum_bul()
+        if self._yakini_yukle is not None:
+            self._yakini_yukle(self.oyuncu_x, self.oyuncu_y)
+        self._hedef_indeksi_olustur(hedefler or ())
         self.hareket_sayisi = 0
+        self.itme_sayisi = 0
+        # İtilebilir nesneler her yer değiştirdiğinde artar (önbellek anahtarı)
+        self.yapi_surumu = 0
+        self._kilit_analizi: Optional[KilitlenmeAnalizi] = None
+        # Nesne kümesi / kilitlenme takibi: ilk sorguda kurulur, sonra _hucre_yaz ile güncellenir
+        self._kilit_takibi: Optional[KilitTakibi] = None
+        # Erişilebilirlik indeksi: ilk sorguda kurulur, sonra _hucre_yaz ile güncellenir
+        self._erisim: Optional[ErisimIndeksi] = None
+        # İçerik özeti: ilk icerik_ozeti() çağrısında kurulur, sonra _hucre_yaz ile güncellenir
+        self._icerik_ozeti: Optional[int] = None
+        # Terminalde en yakın hedefe ipucu ve yol gösterilsin mi? (I tuşu)
+        self.ipucu_goster = False
+        # Değişen hücre kaydı: bir liste atanırsa her yazılan (x, y) eklenir
+        # (arayüzler yalnızca bu hücreleri günceller; None = kayıt yok)
+        self.degisen_hucreler: Optional[List[Tuple[int, int]]] = None
+        # Geri alma günlüğü: hareket başına (dx, dy, eski oyuncu hücresi,
+        # eski hedef hücresi, itme hücresinin eski değeri ya da None)
+        self._gunluk: Optional[deque] = deque(maxlen=gunluk_siniri) if gunluk_siniri > 0 else None
+        # Geri alınmış, yinelenebilecek hareketlerin yönleri (yeni hareket siler)
+        self._yinelenecekler: List[Tuple[int, int]] = []
+        # Hareket kaydı: ekle(dx, dy) / geri_al() sunan bir nesne atanırsa
+        # her başarılı hareket ona bildirilir (bkz. tekrar.HareketKaydi)
+        self.hareket_kaydi = None
         self.oyun_devam = True
         
     def _oyuncu_konum_bul(self) -> Tuple[int, int]:
         """Oyuncunun konumunu bul"""
+        if isinstance(self.harita, ParcaliHarita):
+            return self.harita.oyuncu or (1, 1)  # Dünya indeksinden, taramadan
+        bayraklar = self._bayraklar
         for y, satir in enumerate(self.harita):
             for x, karakter in enumerate(satir):
-                bilgi = self.karakter_sistemi.karakter_bul(karakter)
-                if bilgi and bilgi.get("ozellik") == "Oyuncu":
+                if bayraklar.get(karakter, 0) & OYUNCU:
                     return x, y
         return 1, 1  # Varsayılan
     
@@ -43,47 +177,78 @@ class OyunMotoru:
         """Ekranı temizle (cross-platform)"""
         os.system('cls' if os.name == 'nt' else 'clear')
     
+    def _ust_bilgi_satirlari(self) -> List[str]:
+        """Harita üstündeki bilgi satırları"""
+        return [
+            "=" * 60,
+            "🎮 UNICODE GAME LAB",
+            "=" * 60,
+            f"Hareket: {self.hareket_sayisi} | WASD veya ↑↓←→ ile hareket edin | G: Geri al, Y: Yinele, I: İpucu",
+            "=" * 60,
+        ]
+    
+    def _alt_bilgi_satirlari(self) -> List[str]:
+        """Harita altındaki bilgi satırları"""
+        satirlar = ["=" * 60]
+        if self.kilitlenme_var_mi():
+            satirlar.append("⚠️  Kilitlenme: nesneler artık tüm hedefleri örtemez (Q ile çıkın)")
+        ipucu = self._gorunen_ipucu()
+        if ipucu is not None:
+            if ipucu.komut is not None:
+                satirlar.append(f"💡 İpucu: {ipucu.komut} (en yakın hedefe yol maliyeti {ipucu.mesafe:g})")
+            elif ipucu.mesafe == SONSUZ:
+                satirlar.append("💡 İpucu: açık hedeflere bir şey itmeden ulaşılamıyor")
+        return satirlar
+    
+    def _gorunen_ipucu(self) -> Optional[Ipucu]:
+        """İpucu açıksa en yakın açık hedefe ipucu (parçalı haritalarda yok)"""
+        if not self.ipucu_goster or self._yakini_yukle is not None:
+            return None
+        return self.ipucu()
+    
+    def _gorunen_harita(self):
+        """Çizilecek harita: parçalı dünyada oyuncu çevresindeki pencere"""
+        if not isinstance(self.harita, ParcaliHarita):
+            return self._yol_isaretle(self.harita)
+        genislik, yukseklik = GORUS_ALANI
+        x0 = min(max(0, self.oyuncu_x - genislik // 2), max(0, self.harita.genislik - genislik))
+        y0 = min(max(0, self.oyuncu_y - yukseklik // 2), max(0, self.harita.yukseklik - yukseklik))
+        return self.harita.pencere(x0, y0, genislik, yukseklik)
+    
+    def _yol_isaretle(self, harita):
+        """İpucu açıksa yol hücreleri işaretlenmiş harita (yalnızca yol satırları kopyalanır)"""
+        ipucu = self._gorunen_ipucu()
+        if ipucu is None or len(ipucu.yol) < 2:
+            return harita
+        isaretli = list(harita)
+        kopyalananlar = set()
+        for x, y in ipucu.yol[:-1]:  # Hedef hücresi görünür kalır
+            if y not in kopyalananlar:
+                isaretli[y] = list(isaretli[y])
+                kopyalananlar.add(y)
+            isaretli[y][x] = YOL_KARAKTERI
+        return isaretli
+    
     def _harita_goster(self):
         """Haritayı ekrana yazdır"""
-        print("=" * 60)
-        print("🎮 UNICODE GAME LAB")
-        print("=" * 60)
-        print(f"Hareket: {self.hareket_sayisi} | WASD veya ↑↓←→ ile hareket edin")
-        print("=" * 60)
+        for metin in self._ust_bilgi_satirlari():
+            print(metin)
         print()
         
-        for satir in self.harita:
+        for satir in self._gorunen_harita():
             print(" ".join(satir))
         
         print()
-        print("=" * 60)
+        for metin in self._alt_bilgi_satirlari():
+            print(metin)
     
     def _karakter_kontrol(self, x: int, y: int) -> bool:
         """Belirli bir konumda oyuncu geçebilir mi?"""
         if y < 0 or y >= len(self.harita) or x < 0 or x >= len(self.harita[y]):
             return False
         
-        karakter = self.harita[y][x]
-        bilgi = self.karakter_sistemi.karakter_bul(karakter)
-        
-        if not bilgi:
-            return True  # Bilinmeyen karakter = boş
-        
-        ozellik = bilgi.get("ozellik", "")
-        
-        # Geçilebilir karakterler
-        if ozellik in ["Boş", "Su", "Hedef", "Anahtar", "Enerji"]:
-            return True
-        
-        # Geçilemez karakterler
-        if ozellik in ["Blok", "Duvar", "Diken", "Tuzak", "Kapı"]:
-            return False
-        
-        # İtilebilir nesneler için kontrol
-        if ozellik in ["İtilebilir", "Yönlü İtilebilir"]:
-            return False  # İtilebilir, geçilemez ama itilebilir
-        
-        return True
+        # Geçilebilir: Boş, Su, Hedef, Anahtar, Enerji (bkz. OZELLIK_BAYRAKLARI)
+        return bool(self._bayraklar.get(self.harita[y][x], 0) & GECILEBILIR)
     
     def _itilebilir_mi(self, x: int, y: int) -> Tuple[bool, Optional[str]]:
         """Belirli bir konumdaki nesne itilebilir mi?"""
@@ -91,45 +256,259 @@ class OyunMotoru:
             return False, None
         
         karakter = self.harita[y][x]
-        bilgi = self.karakter_sistemi.karakter_bul(karakter)
         
-        if not bilgi:
-            return False, None
+        # İtilebilir ve Yönlü İtilebilir
+        # (yön kontrolü gerekirse buraya eklenebilir)
+        if self._bayraklar.get(karakter, 0) & ITILEBILIR:
+            return True, karakter
         
-        ozellik = bilgi.get("ozellik", "")
+        return False, None
+    
+    def _hedef_indeksi_olustur(self, gizli_hedefler: Iterable[Tuple[int, int]] = ()):
+        """Hedef hücrelerini bir kez tara ve açık hedefleri izlemeye başla"""
+        bayraklar = self._bayraklar
+        # (x, y) -> hedef karakteri (O, o, ⭐, ✨); hücre boşalınca geri yazılır
+        self._hedefler: Dict[Tuple[int, int], str] = {}
+        if isinstance(self.harita, ParcaliHarita):
+            # Dünya indeksindeki hedefler; örtülü olanlar gizli hedef gibi işlenir
+            gizli_hedefler = list(gizli_hedefler)
+            for x, y in self.harita.hedefler:
+                karakter = self.harita.karakter(x, y)
+                if bayraklar.get(karakter, 0) & HEDEF:
+                    self._hedefler[(x, y)] = karakter
+                else:
+                    gizli_hedefler.append((x, y))
+        else:
+            for y, satir in enumerate(self.harita):
+                for x, karakter in enumerate(satir):
+                    if bayraklar.get(karakter, 0) & HEDEF:
+                        self._hedefler[(x, y)] = karakter
+        # Üzerinde oyuncu ya da itilebilir nesne olmayan hedefler
+        self._acik_hedefler: Set[Tuple[int, int]] = set(self._hedefler)
         
-        if ozellik == "İtilebilir":
-            return True, karakter
+        # Harita dışından verilen, başlangıçta örtülü olabilen hedefler
+        for x, y in gizli_hedefler:
+            if (x, y) in self._hedefler:
+                continue
+            if not (0 <= y < len(self.harita) and 0 <= x < len(self.harita[y])):
+                raise ValueError(f"Hedef harita dışında: {(x, y)}")
+            self._hedefler[(x, y)] = HEDEF_KARAKTERI
+            if not bayraklar.get(self.harita[y][x], 0) & (OYUNCU | ITILEBILIR):
+                self.harita[y][x] = HEDEF_KARAKTERI
+                self._acik_hedefler.add((x, y))
+    
+    def _hucre_yaz(self, x: int, y: int, karakter: str):
+        """Hücreye yaz ve hedef indeksini güncelle"""
+        konum = (x, y)
+        if konum in self._hedefler:
+            if self._hedefler_paylasiliyor:
+                # Açık hedef kümesi bir çatal/anlık durumla paylaşılıyor: önce kopyala
+                self._acik_hedefler = set(self._acik_hedefler)
+                self._hedefler_paylasiliyor = False
+            if karakter == " " or karakter == self._hedefler[konum]:
+                # Hedef hücresi boşaldı: hedef karakterini geri koy
+                karakter = self._hedefler[konum]
+                self._acik_hedefler.add(konum)
+            else:
+                self._acik_hedefler.discard(konum)
+        if self._icerik_ozeti is not None:
+            self._icerik_ozeti ^= self._hucre_ozeti(x, y, self.harita[y][x]) ^ \
+                self._hucre_ozeti(x, y, karakter)
+        if self._sahip_satirlar is not None and y not in self._sahip_satirlar:
+            self._satiri_sahiplen(y)
+        self.harita[y][x] = karakter
+        if self._erisim is not None:
+            self._erisim.hucre_degisti(x, y, karakter)
+        if self._kilit_takibi is not None:
+            self._kilit_takibi.hucre_degisti(x, y, karakter)
+        if self.degisen_hucreler is not None:
+            self.degisen_hucreler.append(konum)
+    
+    def _satiri_sahiplen(self, y: int):
+        """Paylaşılan satırı yazmadan önce kopyala (copy-on-write)"""
+        self.harita[y] = self.harita[y][:]
+        self._sahip_satirlar.add(y)
+        if len(self._sahip_satirlar) == len(self.harita):
+            self._sahip_satirlar = None  # Artık hiçbir satır paylaşılmıyor
+    
+    def _satirlari_paylas(self):
+        """Tüm satırlar başka bir motor ya da anlık durumla paylaşılmaya başladı"""
+        if not isinstance(self.harita, KompaktHarita):
+            self._sahip_satirlar = set()
+    
+    def catal(self, gunluk: bool = False) -> "OyunMotoru":
+        """Bu durumdan devam eden bağımsız bir motor (ağaç araması için)
         
-        if ozellik == "Yönlü İtilebilir":
-            # Yön kontrolü gerekirse buraya eklenebilir
-            return True, karakter
+        Satırlar iki motor arasında paylaşılır ve ancak yazılacakları zaman
+        kopyalanır; çatallama harita boyutundan değil, sonradan dokunulan
+        satır sayısından etkilenir (yalnızca satır başvuru listesi kopyalanır).
+        Kompakt haritalarda tek tampon bir kez kopyalanır.
         
-        return False, None
+        gunluk=True ise geri alma/yineleme geçmişi de kopyalanır; aksi halde
+        çatal boş bir günlükle başlar. Erişilebilirlik indeksi ilk sorguda
+        yeniden kurulur; hareket kaydı ve değişen hücre kaydı çatala geçmez.
+        Parçalı (diskteki) haritalar çatallanamaz.
+        """
+        if self._yakini_yukle is not None:
+            raise ValueError("Parçalı haritalı motor çatallanamaz")
+        cocuk = copy.copy(self)
+        if isinstance(self.harita, KompaktHarita):
+            cocuk.harita = self.harita.kopyala()
+        else:
+            cocuk.harita = list(self.harita)
+            self._satirlari_paylas()
+            cocuk._satirlari_paylas()
+        self._hedefler_paylasiliyor = cocuk._hedefler_paylasiliyor = True
+        if self._gunluk is not None:
+            cocuk._gunluk = deque(self._gunluk if gunluk else (), maxlen=self._gunluk.maxlen)
+        cocuk._yinelenecekler = list(self._yinelenecekler) if gunluk else []
+        cocuk._erisim = None
+        cocuk._kilit_takibi = None
+        cocuk.degisen_hucreler = None
+        cocuk.hareket_kaydi = None
+        return cocuk
+    
+    def anlik_durum(self) -> AnlikDurum:
+        """Güncel durumun, satırları paylaşan anlık görüntüsü (geri_yukle ile dönülür)"""
+        if self._yakini_yukle is not None:
+            raise ValueError("Parçalı haritalı motorun anlık durumu alınamaz")
+        if isinstance(self.harita, KompaktHarita):
+            harita = self.harita.kopyala()
+        else:
+            harita = tuple(self.harita)
+            self._satirlari_paylas()
+        self._hedefler_paylasiliyor = True
+        return AnlikDurum(harita, self.oyuncu_x, self.oyuncu_y, self._acik_hedefler,
+                          self.hareket_sayisi, self.itme_sayisi, self._icerik_ozeti)
+    
+    def geri_yukle(self, durum: AnlikDurum):
+        """anlik_durum() ile alınan duruma dön
+        
+        Liste haritalarda yalnızca o zamandan beri kopyalanmış satırlar
+        karşılaştırılır; değişen hücreler erişilebilirlik indeksine,
+        kilitlenme takibine ve değişen hücre kaydına bildirilir. Geri alma/yineleme geçmişi silinir.
+        Aynı durum birden çok kez geri yüklenebilir.
+        """
+        if self.hareket_kaydi is not None:
+            raise ValueError("Hareket kaydı sürerken durum geri yüklenemez")
+        eski = self.harita
+        if isinstance(durum.harita, KompaktHarita):
+            self.harita = durum.harita.kopyala()
+            degisen_satirlar = range(len(eski))
+        else:
+            self.harita = list(durum.harita)
+            self._satirlari_paylas()
+            degisen_satirlar = [y for y in range(len(eski)) if eski[y] is not durum.harita[y]]
+        
+        if self._erisim is not None or self._kilit_takibi is not None or \
+                self.degisen_hucreler is not None:
+            for y in degisen_satirlar:
+                for x, (onceki, karakter) in enumerate(zip(eski[y], self.harita[y])):
+                    if onceki == karakter:
+                        continue
+                    if self._erisim is not None:
+                        self._erisim.hucre_degisti(x, y, karakter)
+                    if self._kilit_takibi is not None:
+                        self._kilit_takibi.hucre_degisti(x, y, karakter)
+                    if self.degisen_hucreler is not None:
+                        self.degisen_hucreler.append((x, y))
+        
+        self.oyuncu_x, self.oyuncu_y = durum.oyuncu_x, durum.oyuncu_y
+        self._acik_hedefler = durum.acik_hedefler
+        self._hedefler_paylasiliyor = True
+        self.hareket_sayisi = durum.hareket_sayisi
+        self.itme_sayisi = durum.itme_sayisi
+        self._icerik_ozeti = durum.icerik_ozeti
+        # Sürüm geri sarılmaz: yapi_surumu anahtarlı önbellekler bayatlamasın
+        self.yapi_surumu += 1
+        if self._gunluk is not None:
+            self._gunluk.clear()
+        self._yinelenecekler.clear()
+    
+    def _hucre_ozeti(self, x: int, y: int, karakter: str) -> int:
+        """Hücrenin içerik özetine katkısı (boş ve oyuncu hücreleri katkı vermez)"""
+        if karakter == " " or self._bayraklar.get(karakter, 0) & OYUNCU:
+            return 0
+        return hash((x, y, karakter))
+    
+    def icerik_ozeti(self) -> int:
+        """Harita içeriğinin oyuncunun yerinden bağımsız özeti
+        
+        Hücre katkılarının XOR'udur: ilk çağrıda bir kez hesaplanır, sonra
+        her yazmada O(1) güncellenir. İtme yapmadan boş hücrelerde yürümek
+        özeti değiştirmez; itme, toplanan öğe ve örtülen hedef değiştirir.
+        Süreç içinde önbellek anahtarı olarak kullanılır (kalıcı değildir).
+        """
+        if self._icerik_ozeti is None:
+            ozet = 0
+            for y, satir in enumerate(self.harita):
+                for x, karakter in enumerate(satir):
+                    ozet ^= self._hucre_ozeti(x, y, karakter)
+            self._icerik_ozeti = ozet
+        return self._icerik_ozeti
+    
+    def hedef_konumlari(self) -> List[Tuple[int, int]]:
+        """Haritadaki tüm hedef hücrelerinin konumları"""
+        return list(self._hedefler)
+    
+    def acik_hedef_sayisi(self) -> int:
+        """Henüz örtülmemiş (oyuncu/itilebilir nesne olmayan) hedef sayısı"""
+        return len(self._acik_hedefler)
     
     def _hedef_var_mi(self) -> bool:
         """Haritada hedef var mı?"""
-        for satir in self.harita:
-            for karakter in satir:
-                bilgi = self.karakter_sistemi.karakter_bul(karakter)
-                if bilgi and bilgi.get("ozellik") == "Hedef":
-                    return True
-        return False
+        return bool(self._hedefler)
     
     def _hedefe_ulasildi_mi(self) -> bool:
-        """Oyuncu hedefe ulaştı mı?"""
-        # Oyuncu konumunda P var, ama hedef O'nun üzerinde miyiz kontrol et
-        # Eğer haritada O kalmadıysa, oyuncu O'nun üzerinde demektir
-        o_var_mi = False
-        for satir in self.harita:
-            for karakter in satir:
-                bilgi = self.karakter_sistemi.karakter_bul(karakter)
-                if bilgi and bilgi.get("ozellik") == "Hedef" and karakter == "O":
-                    o_var_mi = True
-                    break
-            if o_var_mi:
-                break
-        return not o_var_mi  # O yoksa hedefe ulaşılmış demektir
+        """Tüm hedefler aynı anda oyuncu veya itilebilir nesnelerle örtülü mü?"""
+        return not self._acik_hedefler
+    
+    def kilitlenme_analizi(self) -> KilitlenmeAnalizi:
+        """Haritanın ölü kare / donma tabloları (ilk çağrıda bir kez hesaplanır)"""
+        if self._kilit_analizi is None:
+            self._kilit_analizi = KilitlenmeAnalizi.motordan(self)
+        return self._kilit_analizi
+    
+    def olu_kare_mi(self, x: int, y: int) -> bool:
+        """(x, y)'ye itilen nesne bir daha hiçbir hedefe ulaşamaz mı? (O(1))"""
+        return self.kilitlenme_analizi().olu_kare_mi(x, y)
+    
+    def erisim_indeksi(self) -> ErisimIndeksi:
+        """Yürünebilir bölgelerin indeksi (ilk çağrıda kurulur, itmelerle artımlı güncellenir)"""
+        if self._erisim is None:
+            self._erisim = ErisimIndeksi.motordan(self)
+        return self._erisim
+    
+    def ulasilabilir_mi(self, x: int, y: int) -> bool:
+        """Oyuncu (x, y)'ye hiçbir şey itmeden yürüyebilir mi? (O(1))"""
+        return self.erisim_indeksi().ulasilabilir_mi(self.oyuncu_x, self.oyuncu_y, x, y)
+    
+    def yol_bulucu(self) -> YolBulucu:
+        """Bu motorun karakter sistemini kullanan ortak yol bulucu"""
+        return paylasilan_yol_bulucu(self.karakter_sistemi)
+    
+    def ipucu(self, hedef: HedefTanimi = VARSAYILAN_HEDEF) -> Ipucu:
+        """Oyuncudan en yakın hedefe (ya da "Anahtar", "K", (x, y) ...) en ucuz yol
+        
+        Mesafe alanı içerik özetiyle önbelleklenir; itme olmadıkça her
+        çağrı alanı yeniden hesaplamadan yalnızca yolu izler.
+        """
+        return self.yol_bulucu().ipucu(self, hedef)
+    
+    def kilitlenme_var_mi(self) -> bool:
+        """Güncel nesne dizilimiyle oyun artık kazanılamaz mı?
+        
+        Nesne kümesi ilk çağrıda bir kez taranır, sonra _hucre_yaz ile
+        artımlı güncellenir; itmeden sonraki çağrı yalnızca itilen nesnenin
+        çevresindeki nesne kümelerini yeniden inceler, itme yoksa O(1)'dir.
+        Parçalı haritalarda analiz tüm dünyayı yükleyeceğinden yapılmaz
+        (her zaman False).
+        """
+        if self._yakini_yukle is not None:
+            return False
+        if self._kilit_takibi is None:
+            self._kilit_takibi = KilitTakibi.motordan(self)
+        return self._kilit_takibi.kilitli_mi()
     
     def _hareket_et(self, dx: int, dy: int) -> bool:
         """Oyuncuyu hareket ettir"""
@@ -141,100 +520,233 @@ class OyunMotoru:
            yeni_x < 0 or yeni_x >= len(self.harita[yeni_y]):
             return False
         
-        hedef_karakter = self.harita[yeni_y][yeni_x]
-        hedef_bilgi = self.karakter_sistemi.karakter_bul(hedef_karakter)
+        eski_hedef = self.harita[yeni_y][yeni_x]
+        hedef_bayrak = self._bayraklar.get(eski_hedef, 0)
         
-        # Boş alana hareket
-        if hedef_bilgi and hedef_bilgi.get("ozellik") in ["Boş", "Su", "Hedef", "Anahtar", "Enerji"]:
+        # Boş alana hareket (Boş, Su, Hedef, Anahtar, Enerji)
+        if hedef_bayrak & GECILEBILIR:
+            if self._gunluk is not None:
+                self._gunluge_yaz(dx, dy, eski_hedef, None)
             # Eski konumu boş yap
-            self.harita[self.oyuncu_y][self.oyuncu_x] = " "
+            self._hucre_yaz(self.oyuncu_x, self.oyuncu_y, " ")
             
-            # Yeni konuma taşı
+            # Yeni konuma taşı (hedefe ulaşınca da P göster)
             self.oyuncu_x = yeni_x
             self.oyuncu_y = yeni_y
-            # Hedefe ulaşmadıysa P koy, ulaştıysa O üzerinde P olsun
-            if hedef_bilgi.get("ozellik") != "Hedef":
-                self.harita[self.oyuncu_y][self.oyuncu_x] = "P"
-            else:
-                self.harita[self.oyuncu_y][self.oyuncu_x] = "P"  # Hedefe ulaşınca da P göster
+            self._hucre_yaz(yeni_x, yeni_y, "P")
             self.hareket_sayisi += 1
+            if self.hareket_kaydi is not None:
+                self.hareket_kaydi.ekle(dx, dy)
+            if self._yakini_yukle is not None:
+                self._yakini_yukle(yeni_x, yeni_y)
             return True
         
         # İtilebilir nesne kontrolü
-        itilebilir_mi, nesne_karakter = self._itilebilir_mi(yeni_x, yeni_y)
-        
-        if itilebilir_mi:
+        if hedef_bayrak & ITILEBILIR:
+            nesne_karakter = eski_hedef
             # İtilecek nesnenin arkasındaki konum
             itme_x = yeni_x + dx
             itme_y = yeni_y + dy
             
             # İtme konumu geçerli mi ve boş mu?
             if 0 <= itme_y < len(self.harita) and 0 <= itme_x < len(self.harita[itme_y]):
-                itme_karakter = self.harita[itme_y][itme_x]
-                itme_bilgi = self.karakter_sistemi.karakter_bul(itme_karakter)
-                
-                # İtme konumu boş veya geçilebilir mi?
-                if itme_bilgi and itme_bilgi.get("ozellik") in ["Boş", "Su", "Hedef"]:
+                eski_itme = self.harita[itme_y][itme_x]
+                # İtme konumu boş veya geçilebilir mi? (Boş, Su, Hedef)
+                if self._bayraklar.get(eski_itme, 0) & ITME_ALANI:
+                    if self._gunluk is not None:
+                        self._gunluge_yaz(dx, dy, eski_hedef, eski_itme)
                     # Nesneyi it
-                    self.harita[itme_y][itme_x] = nesne_karakter
+                    self._hucre_yaz(itme_x, itme_y, nesne_karakter)
                     # Oyuncuyu hareket ettir
-                    self.harita[self.oyuncu_y][self.oyuncu_x] = " "
+                    self._hucre_yaz(self.oyuncu_x, self.oyuncu_y, " ")
                     self.oyuncu_x = yeni_x
                     self.oyuncu_y = yeni_y
-                    self.harita[self.oyuncu_y][self.oyuncu_x] = "P"
+                    self._hucre_yaz(yeni_x, yeni_y, "P")
                     self.hareket_sayisi += 1
+                    self.itme_sayisi += 1
+                    self.yapi_surumu += 1
+                    if self.hareket_kaydi is not None:
+                        self.hareket_kaydi.ekle(dx, dy)
+                    if self._yakini_yukle is not None:
+                        self._yakini_yukle(yeni_x, yeni_y)
                     return True
         
         return False  # Hareket edilemedi
     
+    def _gunluge_yaz(self, dx: int, dy: int, eski_hedef: str, eski_itme: Optional[str]):
+        """Yapılmak üzere olan hareketi geri alma günlüğüne ekle
+        
+        Yalnızca değişecek hücrelerin eski değerleri saklanır; eski oyuncu
+        konumu yeni konumdan (dx, dy) çıkarılarak bulunur.
+        """
+        self._gunluk.append((dx, dy, self.harita[self.oyuncu_y][self.oyuncu_x],
+                             eski_hedef, eski_itme))
+        if self._yinelenecekler:
+            self._yinelenecekler.clear()  # Yeni hareket yineleme geçmişini geçersiz kılar
+    
+    def geri_al(self) -> bool:
+        """Son hareketi geri al (harita boyutundan bağımsız, O(1))
+        
+        Dokunulan en fazla üç hücre eski değerlerine döner. Geri alınacak
+        hareket yoksa False döner.
+        """
+        if not self._gunluk:
+            return False
+        dx, dy, eski_oyuncu, eski_hedef, eski_itme = self._gunluk.pop()
+        x, y = self.oyuncu_x, self.oyuncu_y
+        if eski_itme is not None:
+            self._hucre_yaz(x + dx, y + dy, eski_itme)
+            self.itme_sayisi -= 1
+            # Sürüm geri sayılmaz: önbellekler yalnızca eşitliğe bakar
+            self.yapi_surumu += 1
+        self._hucre_yaz(x, y, eski_hedef)
+        self.oyuncu_x = x - dx
+        self.oyuncu_y = y - dy
+        self._hucre_yaz(self.oyuncu_x, self.oyuncu_y, eski_oyuncu)
+        self.hareket_sayisi -= 1
+        self._yinelenecekler.append((dx, dy))
+        if self.hareket_kaydi is not None:
+            self.hareket_kaydi.geri_al()
+        if self._yakini_yukle is not None:
+            self._yakini_yukle(self.oyuncu_x, self.oyuncu_y)
+        return True
+    
+    def yinele(self) -> bool:
+        """Geri alınan son hareketi yeniden yap; yinelenecek hareket yoksa False"""
+        if not self._yinelenecekler:
+            return False
+        yinelenecekler = self._yinelenecekler
+        dx, dy = yinelenecekler.pop()
+        # Hareket, yineleme geçmişini silmesin diye geçici olarak boş listeyle yapılır
+        self._yinelenecekler = []
+        try:
+            return self._hareket_et(dx, dy)
+        finally:
+            self._yinelenecekler = yinelenecekler
+    
+    def geri_alinabilir_sayi(self) -> int:
+        """Günlükte geri alınabilecek hareket sayısı"""
+        return len(self._gunluk) if self._gunluk is not None else 0
+    
+    def yinelenebilir_sayi(self) -> int:
+        """Yinelenebilecek (geri alınmış) hareket sayısı"""
+        return len(self._yinelenecekler)
+    
     def _komut_al(self) -> str:
         """Kullanıcıdan komut al"""
         try:
-            komut = input("\nHareket (W/A/S/D veya ↑↓←→, Q=Çıkış): ").strip().upper()
+            komut = input("\nHareket (W/A/S/D veya ↑↓←→, G=Geri al, Y=Yinele, I=İpucu, Q=Çıkış): ").strip().upper()
             return komut
         except (EOFError, KeyboardInterrupt):
             return "Q"
     
     def _komut_islem(self, komut: str) -> bool:
         """Komutu işle ve hareket et"""
-        hareket_haritasi = {
-            "W": (0, -1),  # Yukarı
-            "S": (0, 1),   # Aşağı
-            "A": (-1, 0),  # Sol
-            "D": (1, 0),   # Sağ
-            "↑": (0, -1),
-            "↓": (0, 1),
-            "←": (-1, 0),
-            "→": (1, 0),
-            "8": (0, -1),  # Numpad
-            "2": (0, 1),
-            "4": (-1, 0),
-            "6": (1, 0),
-        }
-        
         if komut == "Q":
             return False  # Çıkış
         
-        if komut in hareket_haritasi:
-            dx, dy = hareket_haritasi[komut]
+        if komut in HAREKET_HARITASI:
+            dx, dy = HAREKET_HARITASI[komut]
             self._hareket_et(dx, dy)
             return True
         
+        if komut == GERI_AL_KOMUTU:
+            self.geri_al()
+        elif komut == YINELE_KOMUTU:
+            self.yinele()
+        elif komut == IPUCU_KOMUTU:
+            self.ipucu_goster = not self.ipucu_goster
+        
         return True  # Geçersiz komut ama oyun devam eder
     
-    def oyunu_baslat(self):
-        """Oyunu başlat ve döngüyü çalıştır"""
+    def adim(self, komut: str) -> AdimSonucu:
+        """Tek bir komutu G/Ç olmadan uygula ve sonucu döndür"""
+        komut = komut.upper()
+        yon = HAREKET_HARITASI.get(komut)
+        onceki_itme = self.itme_sayisi
+        if yon is not None:
+            hareket_etti = self._hareket_et(*yon)
+        elif komut == GERI_AL_KOMUTU:
+            hareket_etti = self.geri_al()
+        elif komut == YINELE_KOMUTU:
+            hareket_etti = self.yinele()
+        else:
+            return AdimSonucu(False, False, not self._acik_hedefler, self.hareket_sayisi)
+        
+        return AdimSonucu(hareket_etti, self.itme_sayisi != onceki_itme,
+                          not self._acik_hedefler, self.hareket_sayisi)
+    
+    def adimlar(self, komutlar: str, kazaninca_dur: bool = True) -> AdimSonucu:
+        """Bir komut dizisini ("WWDDS...") tek çağrıda, G/Ç olmadan uygula
+        
+        G ve Y karakterleri son hareketi geri alır / yineler; diğer yön dışı
+        karakterler yok sayılır. Sonuçta hareket_etti/itildi dizideki en az
+        bir adım için geçerliyse True olur.
+        """
+        onceki_hareket = self.hareket_sayisi
+        onceki_itme = self.itme_sayisi
+        yon_bul = HAREKET_HARITASI.get
+        hareket_et = self._hareket_et
+        
+        for komut in komutlar.upper():
+            yon = yon_bul(komut)
+            if yon is None:
+                if komut == GERI_AL_KOMUTU:
+                    self.geri_al()
+                elif komut == YINELE_KOMUTU:
+                    self.yinele()
+                continue
+            hareket_et(yon[0], yon[1])
+            # Küme yerel değişkende tutulmaz: paylaşılıyorsa ilk yazmada kopyalanır
+            if kazaninca_dur and not self._acik_hedefler:
+                break
+        
+        return AdimSonucu(self.hareket_sayisi != onceki_hareket,
+                          self.itme_sayisi != onceki_itme,
+                          not self._acik_hedefler, self.hareket_sayisi)
+    
+    def oyunu_baslat(self, cizici: Optional[TerminalCizici] = None):
+        """Oyunu başlat ve döngüyü çalıştır
+        
+        Terminalde (TTY) fark tabanlı TerminalCizici kullanılır; her karede
+        yalnızca değişen hücreler yazılır. Girdi de bir terminalse tuşlar
+        Enter beklemeden ham modda okunur. Aksi halde ekran temizlenip
+        harita baştan yazdırılır ve komutlar input() ile alınır.
+        """
         if not self._hedef_var_mi():
             print("⚠️  Uyarı: Haritada hedef (O) bulunamadı!")
             return
         
-        while self.oyun_devam:
+        if cizici is None and os.name != 'nt' and sys.stdout.isatty():
+            cizici = TerminalCizici(self.karakter_sistemi)
+        
+        if cizici is not None and ham_mod_destekleniyor():
+            self._ham_dongu(cizici)
+        else:
+            self._satir_dongusu(cizici)
+        
+        print("\n✅ Oyun bitti!")
+    
+    def _kare_ciz(self, cizici: Optional[TerminalCizici]):
+        """Bir kare çiz (çizici yoksa ekranı temizleyip yeniden yazdır)"""
+        if cizici is not None:
+            cizici.ciz(self._gorunen_harita(), self._ust_bilgi_satirlari(),
+                       self._alt_bilgi_satirlari())
+        else:
             self._ekran_temizle()
             self._harita_goster()
+    
+    def _kazanma_mesaji(self):
+        print("\n🎉 TEBRİKLER! Hedefe ulaştınız!")
+        print(f"📊 Toplam hareket: {self.hareket_sayisi}")
+    
+    def _satir_dongusu(self, cizici: Optional[TerminalCizici]):
+        """input() ile satır satır komut alan oyun döngüsü"""
+        while self.oyun_devam:
+            self._kare_ciz(cizici)
             
             if self._hedefe_ulasildi_mi():
-                print("\n🎉 TEBRİKLER! Hedefe ulaştınız!")
-                print(f"📊 Toplam hareket: {self.hareket_sayisi}")
+                self._kazanma_mesaji()
                 break
             
             komut = self._komut_al()
@@ -245,9 +757,40 @@ class OyunMotoru:
             
             if not self._komut_islem(komut):
                 break
+    
+    def _ham_dongu(self, cizici: TerminalCizici):
+        """Enter beklemeden tuş okuyan oyun döngüsü
         
-        print("\n✅ Oyun bitti!")
-
+        Bir okumada biriken tüm tuşlar (basılı tutma tekrarları dahil) tek
+        adimlar() çağrısıyla uygulanır ve ardından tek kare çizilir.
+        """
+        with HamKlavye() as klavye:
+            while self.oyun_devam:
+                self._kare_ciz(cizici)
+                
+                if self._hedefe_ulasildi_mi():
+                    self._kazanma_mesaji()
+                    break
+                
+                try:
+                    komutlar = klavye.komutlari_oku()
+                except KeyboardInterrupt:
+                    komutlar = ["Q"]
+                
+                cikis = "Q" in komutlar
+                if cikis:
+                    komutlar = komutlar[:komutlar.index("Q")]
+                if IPUCU_KOMUTU in komutlar:
+                    # Görüntü ayarı: hareket dizisine girmez
+                    if komutlar.count(IPUCU_KOMUTU) % 2:
+                        self.ipucu_goster = not self.ipucu_goster
+                    komutlar = [k for k in komutlar if k != IPUCU_KOMUTU]
+                self.adimlar("".join(komutlar))
+                
+                if cikis:
+                    self._kare_ciz(cizici)
+                    print("\n👋 Oyundan çıkılıyor...")
+                    break
 
 def main():
     """Ana fonksiyon - Örnek harita ile oyun başlat"""
@@ -260,6 +803,7 @@ def main():
     print("  S / ↓ : Aşağı")
     print("  A / ← : Sol")
     print("  D / → : Sağ")
+    print("  I     : İpucu (en yakın hedefe yol)")
     print("  Q     : Çıkış")
     print("\n" + "=" * 60)
     input("\nDevam etmek için Enter'a basın...")
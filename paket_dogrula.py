@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Harita Paketi Doğrulayıcı
+Bir harita paketindeki tüm haritaları çok çekirdekte analiz eder ve
+çözülebilirliklerini kontrol eder; sonuçları JSON Lines olarak yazar.
+
+Kullanım:
+    python paket_dogrula.py ornek_haritalar.json --cikti sonuc.jsonl
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from harita_katalogu import HaritaKatalogu
+from xsb_okuyucu import xsb_oku
+
+# Düz metin (XSB) koleksiyon olarak okunan dosya uzantıları
+XSB_UZANTILARI = (".xsb", ".sok", ".txt")
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# Her işçi süreçte bir kez kurulan karakter sistemi
+_ISCI_SISTEMI = None
+# İşçinin her görevin gerçek başlangıcını (görev no, pid, zaman) bildirdiği kuyruk
+_BASLAMA_KUYRUGU = None
+
+
+def paketi_oku(dosya: str) -> Iterator[Tuple[str, str, List[List[str]], Optional[List]]]:
+    """Paketten (anahtar, isim, harita, gizli hedefler) üret
+
+    JSON / .uglp paketleri katalog indeksiyle, .xsb / .sok / .txt
+    koleksiyonları satır satır okunur; bellekte aynı anda tek harita bulunur.
+    """
+    if dosya.lower().endswith(XSB_UZANTILARI):
+        for seviye in xsb_oku(dosya):
+            yield f"seviye_{seviye.sira}", seviye.isim, seviye.harita, seviye.hedefler
+        return
+    katalog = HaritaKatalogu([dosya])
+    for girdi in katalog:
+        bilgi = katalog.bilgi_yukle(girdi)
+        yield girdi.anahtar, girdi.isim, bilgi["harita"], bilgi.get("hedefler")
+
+
+def _isci_baslat(json_dosya: str, bellek_mb: Optional[int], baslama_kuyrugu=None):
+    """İşçi süreç başlangıcı: karakter sistemini kur, bellek sınırını uygula"""
+    global _ISCI_SISTEMI, _BASLAMA_KUYRUGU
+    from game_lab import paylasilan_sistem
+
+    _BASLAMA_KUYRUGU = baslama_kuyrugu
+
+    # Yükleme mesajları JSON Lines çıktısına karışmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        _ISCI_SISTEMI = paylasilan_sistem(json_dosya)
+
+    if bellek_mb:
+        try:
+            import resource
+            sinir = bellek_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (sinir, sinir))
+        except (ImportError, ValueError, OSError):
+            pass  # Windows veya izin yok: yalnızca TT sınırı geçerli
+
+
+def _haritayi_dogrula(anahtar: str, isim: str, harita: List[List[str]],
+                      hedefler: Optional[List], yontem: str, zaman_asimi: float, max_dugum: int,
+                      gorev_no: Optional[int] = None) -> Dict:
+    """Tek bir haritayı analiz et ve çözülebilirliğini kontrol et (işçi süreçte)
+
+    gorev_no verilirse başlangıç, zaman aşımı denetimi için ana sürece
+    bildirilir (kuyrukta bekleyen görevler sayılmaz).
+    """
+    from cozucu import BulmacaCozucu
+    from oyun_motoru import OyunMotoru
+
+    if _BASLAMA_KUYRUGU is not None and gorev_no is not None:
+        _BASLAMA_KUYRUGU.put((gorev_no, os.getpid(), time.time()))
+    baslangic = time.perf_counter()
+    kayit = {
+        "anahtar": anahtar,
+        "isim": isim,
+        "boyut": [max((len(s) for s in harita), default=0), len(harita)],
+    }
+    try:
+        analiz = _ISCI_SISTEMI.harita_analiz_et(harita)
+        kayit["karakter_tipleri"] = analiz["karakter_tipleri"]
+        kayit["oyuncu_konum"] = analiz["oyuncu_konum"]
+
+        motor = OyunMotoru(harita, _ISCI_SISTEMI, hedefler=hedefler)
+        cozucu = BulmacaCozucu(motor)
+        if yontem == "astar":
+            sonuc = cozucu.astar_coz(max_dugum=max_dugum, sure_limiti=zaman_asimi)
+        else:
+            sonuc = cozucu.bfs_coz(max_dugum=max_dugum, sure_limiti=zaman_asimi)
+
+        kayit["cozulebilir"] = sonuc.cozuldu
+        kayit["hamle_sayisi"] = sonuc.hamle_sayisi if sonuc.cozuldu else None
+        kayit["itme_sayisi"] = sonuc.itme_sayisi if sonuc.cozuldu else None
+        kayit["genisletilen"] = sonuc.genisletilen
+        if sonuc.cozuldu is not None:
+            kayit["durum"] = "tamam"
+        elif sonuc.genisletilen >= max_dugum:
+            kayit["durum"] = "dugum_siniri"
+        else:
+            kayit["durum"] = "zaman_asimi"
+    except MemoryError:
+        kayit["durum"] = "bellek_asimi"
+    except Exception as e:
+        kayit["durum"] = "hata"
+        kayit["hata"] = f"{type(e).__name__}: {e}"
+
+    kayit["sure_sn"] = round(time.perf_counter() - baslangic, 6)
+    return kayit
+
+
+def paketi_dogrula(dosyalar: List[str], cikti, isci: Optional[int] = None,
+                   yontem: str = "bfs", zaman_asimi: float = 10.0,
+                   bellek_mb: Optional[int] = None, max_dugum: int = 1_000_000,
+                   json_dosya: str = "karakter_anlamlari.json") -> Dict[str, int]:
+    """Paketlerdeki haritaları süreç havuzunda doğrula, her sonucu bir satır yaz
+
+    Aynı anda işçi sayısının iki katı kadar görev kuyrukta tutulur; haritalar
+    paketten bu hızda okunur. İşçinin bildirdiği başlangıçtan bu yana süresi
+    (zaman_asimi + pay) dolan görevler "zaman_asimi" olarak raporlanır ve
+    işçileri sonlandırılır; havuz yeniden kurulur ve yarım kalan görevler
+    yeni havuza gönderilir. Bir işçi kendiliğinden çökerse o an çalışan
+    görevler "hata" sayılır, henüz başlamamış olanlar yeniden gönderilir.
+    """
+    isci = isci or os.cpu_count() or 1
+    ozet = {"toplam": 0}
+    baglam = multiprocessing.get_context()
+    gorevler = {}  # görev no -> (anahtar, isim, harita, hedefler)
+    bekleyen = {}  # future -> görev no
+    calisma_basi = {}  # görev no -> (işçi pid, başlama zamanı); işçinin bildirdiği
+    denemeler = {}  # görev no -> havuz bozulduğu için yeniden gönderilme sayısı
+    pay = max(1.0, zaman_asimi * 0.5)
+
+    def haritalar():
+        for dosya in dosyalar:
+            yield from paketi_oku(dosya)
+
+    def yaz(kayit: Dict):
+        cikti.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+        cikti.flush()
+        ozet["toplam"] += 1
+        ozet[kayit["durum"]] = ozet.get(kayit["durum"], 0) + 1
+
+    def havuz_kur():
+        # Her havuzun kendi başlama kuyruğu olur; sonlandırılan bir işçinin
+        # yarım bıraktığı kuyruk yeni havuzu etkilemez
+        kuyruk = baglam.Queue()
+        return kuyruk, ProcessPoolExecutor(max_workers=isci, mp_context=baglam,
+                                           initializer=_isci_baslat,
+                                           initargs=(json_dosya, bellek_mb, kuyruk))
+
+    def gonder(no: int):
+        anahtar, isim, harita, hedefler = gorevler[no]
+        f = havuz.submit(_haritayi_dogrula, anahtar, isim, harita, hedefler,
+                         yontem, zaman_asimi, max_dugum, no)
+        bekleyen[f] = no
+
+    def baslamalari_oku():
+        while True:
+            try:
+                no, pid, basladi = baslama_kuyrugu.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                return
+            if no in gorevler:
+                calisma_basi[no] = (pid, basladi)
+
+    def sonuclandir(f, calisanlari_yeniden: bool) -> bool:
+        """Biten görevi yaz; havuzla birlikte düşen görev yeniden denenecekse True"""
+        no = bekleyen.pop(f)
+        if no not in gorevler:
+            return False  # Zaman aşımı olarak zaten raporlandı
+        try:
+            kayit = f.result()
+        except BrokenProcessPool as e:
+            # Başlamamış ya da bizim sonlandırdığımız havuzda kalmış görev
+            # yeniden denenir; çöken havuzda çalışan görev hata sayılır
+            yeniden = calisanlari_yeniden or no not in calisma_basi
+            if yeniden and denemeler.get(no, 0) < 2:
+                denemeler[no] = denemeler.get(no, 0) + 1
+                return True
+            kayit = {"durum": "hata", "hata": f"{type(e).__name__}: {e}"}
+        except Exception as e:  # İşçi süreç çöktü (örn. bellek)
+            kayit = {"durum": "hata", "hata": f"{type(e).__name__}: {e}"}
+        anahtar, isim = gorevler.pop(no)[:2]
+        calisma_basi.pop(no, None)
+        denemeler.pop(no, None)
+        yaz(kayit if "anahtar" in kayit else {"anahtar": anahtar, "isim": isim, **kayit})
+        return False
+
+    def havuzu_yenile(calisanlari_yeniden: bool):
+        """Bozulan havuzu kapat, yarım kalan görevleri yeni havuza gönder"""
+        nonlocal baslama_kuyrugu, havuz
+        havuz.shutdown(wait=True)  # Bozuk havuz kalan işçileri kendisi sonlandırır
+        baslamalari_oku()
+        yeniden = []
+        for f in list(bekleyen):
+            no = bekleyen[f]
+            if sonuclandir(f, calisanlari_yeniden):
+                yeniden.append(no)
+        baslama_kuyrugu.close()
+        calisma_basi.clear()
+        baslama_kuyrugu, havuz = havuz_kur()
+        for no in yeniden:
+            gonder(no)
+
+    baslama_kuyrugu, havuz = havuz_kur()
+    try:
+        kaynak = haritalar()
+        bitti = False
+        sayac = 0
+        while True:
+            while not bitti and len(gorevler) < isci * 2:
+                try:
+                    gorevler[sayac] = next(kaynak)
+                except StopIteration:
+                    bitti = True
+                    break
+                gonder(sayac)
+                sayac += 1
+            if not gorevler:
+                break
+
+            tamamlanan, _ = wait(bekleyen, timeout=pay, return_when=FIRST_COMPLETED)
+            baslamalari_oku()
+            if any(isinstance(f.exception(), BrokenProcessPool) for f in tamamlanan):
+                havuzu_yenile(calisanlari_yeniden=False)  # Bir işçi kendiliğinden çöktü
+                continue
+            for f in tamamlanan:
+                sonuclandir(f, False)
+
+            simdi = time.time()
+            takilanlar = [no for no, (pid, basladi) in calisma_basi.items()
+                          if simdi - basladi > zaman_asimi + pay]
+            for no in takilanlar:
+                pid, basladi = calisma_basi.pop(no)
+                anahtar, isim = gorevler.pop(no)[:2]
+                yaz({"anahtar": anahtar, "isim": isim, "durum": "zaman_asimi",
+                     "sure_sn": round(simdi - basladi, 6)})
+                try:
+                    os.kill(pid, signal.SIGTERM)  # Takılan işçi yerini boşaltsın
+                except OSError:
+                    pass  # İşçi bu arada çıkmış
+            if takilanlar:
+                havuzu_yenile(calisanlari_yeniden=True)
+    finally:
+        havuz.shutdown(wait=True, cancel_futures=True)
+        baslama_kuyrugu.close()
+    return ozet
+
+
+def main():
+    """Komut satırı giriş noktası"""
+    ayristirici = argparse.ArgumentParser(
+        description="Harita paketlerini çok çekirdekte analiz et ve çözülebilirliği kontrol et")
+    ayristirici.add_argument("paketler", nargs="+",
+                             help="ornek_haritalar.json biçiminde, .uglp veya .xsb paket dosyaları")
+    ayristirici.add_argument("-o", "--cikti", help="JSON Lines çıktı dosyası (varsayılan: stdout)")
+    ayristirici.add_argument("-j", "--isci", type=int, default=None,
+                             help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    ayristirici.add_argument("--yontem", choices=("bfs", "astar"), default="bfs",
+                             help="bfs: en az hareket, astar: en az itme")
+    ayristirici.add_argument("--zaman-asimi", type=float, default=10.0,
+                             help="Harita başına süre sınırı (saniye)")
+    ayristirici.add_argument("--bellek-mb", type=int, default=None,
+                             help="İşçi süreç başına bellek sınırı (MB, Unix)")
+    ayristirici.add_argument("--max-dugum", type=int, default=1_000_000,
+                             help="Harita başına en fazla genişletilecek düğüm")
+    args = ayristirici.parse_args()
+
+    cikti = open(args.cikti, 'w', encoding='utf-8') if args.cikti else sys.stdout
+    baslangic = time.perf_counter()
+    try:
+        ozet = paketi_dogrula(args.paketler, cikti, args.isci, args.yontem,
+                              args.zaman_asimi, args.bellek_mb, args.max_dugum)
+    finally:
+        if cikti is not sys.stdout:
+            cikti.close()
+
+    sure = time.perf_counter() - baslangic
+    print(f"📊 {ozet['toplam']} harita {sure:.2f} sn'de doğrulandı: " +
+          ", ".join(f"{k}={v}" for k, v in ozet.items() if k != "toplam"),
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Parçalı Harita
+Bellekten büyük açık dünya haritaları için diskte sabit boyutlu parçalar
+halinde saklanan, parçaları ihtiyaç oldukça yükleyen ve en az kullanılanı
+(LRU) geri yazarak bellekten çıkaran harita arka ucu.
+
+Dizin düzeni:
+    dunya.json      genişlik, yükseklik, parça boyutu, palet, oyuncu, hedefler
+    <px>_<py>.parca palet indeksleri (array 'H'); dosyası olmayan parça
+                    tümüyle dolgu karakteridir (palet[0])
+"""
+
+import json
+import os
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from game_lab import HEDEF, OYUNCU, KarakterAnlamSistemi
+
+META_DOSYASI = "dunya.json"
+_HUCRE_BAYT = array('H').itemsize
+
+
+class ParcaliSatir:
+    """Parçalı haritanın bir satırına liste benzeri görünüm"""
+
+    __slots__ = ("_harita", "_y")
+
+    def __init__(self, harita: "ParcaliHarita", y: int):
+        self._harita = harita
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._harita.genislik
+
+    def _indeks(self, x: int) -> int:
+        genislik = self._harita.genislik
+        if x < 0:
+            x += genislik
+        if x < 0 or x >= genislik:
+            raise IndexError("satır indeksi aralık dışında")
+        return x
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(len(self)))]
+        return self._harita.karakter(self._indeks(x), self._y)
+
+    def __setitem__(self, x: int, karakter: str):
+        self._harita.yaz(self._indeks(x), self._y, karakter)
+
+    def __iter__(self) -> Iterator[str]:
+        karakter = self._harita.karakter
+        y = self._y
+        for x in range(self._harita.genislik):
+            yield karakter(x, y)
+
+    def __eq__(self, diger) -> bool:
+        return list(self) == list(diger)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class ParcaliHarita:
+    """Diskteki parçalardan tembel yüklenen, harita[y][x] ile okunan dünya
+
+    Bellekte en fazla bellek_siniri baytlık parça tutulur; sınır aşılınca en
+    uzun süredir dokunulmayan parça (değiştiyse diske yazılarak) çıkarılır.
+    OyunMotoru bu haritayı kopyalamaz; oyuncu ve hedef konumlarını taramak
+    yerine dunya.json'daki indeksten okur.
+
+    with ParcaliHarita("dunya/", ks) as harita:
+        motor = OyunMotoru(harita, ks)
+        ...
+    """
+
+    def __init__(self, dizin: str, karakter_sistemi: KarakterAnlamSistemi,
+                 bellek_siniri: int = 64 * 1024 * 1024):
+        self.dizin = dizin
+        self.karakter_sistemi = karakter_sistemi
+        self._bayraklar = karakter_sistemi.bayrak_haritasi
+        with open(os.path.join(dizin, META_DOSYASI), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.genislik: int = meta["genislik"]
+        self.yukseklik: int = meta["yukseklik"]
+        self.parca_boyutu: int = meta["parca_boyutu"]
+        self.palet: List[str] = meta["palet"]
+        self._palet_indeksi: Dict[str, int] = {k: i for i, k in enumerate(self.palet)}
+        self.oyuncu: Optional[Tuple[int, int]] = tuple(meta["oyuncu"]) if meta.get("oyuncu") else None
+        self.hedefler: Set[Tuple[int, int]] = {tuple(h) for h in meta.get("hedefler", ())}
+        self._meta_kirli = False
+
+        parca_bayt = self.parca_boyutu * self.parca_boyutu * _HUCRE_BAYT
+        # Oyuncunun çevresindeki 3x3 parça her zaman sığmalı
+        self.max_parca = max(9, bellek_siniri // parca_bayt)
+        self._parcalar: "OrderedDict[Tuple[int, int], array]" = OrderedDict()
+        self._kirli: Set[Tuple[int, int]] = set()
+        self._son_anahtar: Optional[Tuple[int, int]] = None
+        self._son_veri: Optional[array] = None
+        self._son_yakin: Optional[Tuple[int, int]] = None
+        self.yukleme_sayisi = 0
+        self.tahliye_sayisi = 0
+
+    # ------------------------------------------------------------------
+    # Oluşturma
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def olustur(cls, dizin: str, genislik: int, yukseklik: int,
+                karakter_sistemi: KarakterAnlamSistemi, parca_boyutu: int = 64,
+                dolgu: str = " ", **secenekler) -> "ParcaliHarita":
+        """Tümü dolgu karakterinden oluşan yeni bir dünya oluştur (parça dosyası yazılmaz)"""
+        os.makedirs(dizin, exist_ok=True)
+        meta = {"genislik": genislik, "yukseklik": yukseklik,
+                "parca_boyutu": parca_boyutu, "palet": [dolgu],
+                "oyuncu": None, "hedefler": []}
+        with open(os.path.join(dizin, META_DOSYASI), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        return cls(dizin, karakter_sistemi, **secenekler)
+
+    @classmethod
+    def listeden(cls, dizin: str, harita: List[List[str]],
+                 karakter_sistemi: KarakterAnlamSistemi, parca_boyutu: int = 64,
+                 dolgu: str = " ", **secenekler) -> "ParcaliHarita":
+        """Bellekteki bir haritayı parçalara bölerek diske yaz ve aç"""
+        yukseklik = len(harita)
+        genislik = max((len(satir) for satir in harita), default=0)
+        dunya = cls.olustur(dizin, genislik, yukseklik, karakter_sistemi,
+                            parca_boyutu, dolgu, **secenekler)
+        for y, satir in enumerate(harita):
+            for x, karakter in enumerate(satir):
+                if karakter != dolgu:
+                    dunya.yaz(x, y, karakter)
+        dunya.kaydet()
+        return dunya
+
+    # ------------------------------------------------------------------
+    # Parça yönetimi
+    # ------------------------------------------------------------------
+
+    def _parca_yolu(self, anahtar: Tuple[int, int]) -> str:
+        return os.path.join(self.dizin, f"{anahtar[0]}_{anahtar[1]}.parca")
+
+    def _parca(self, anahtar: Tuple[int, int]) -> array:
+        """Parçayı döndür; bellekte değilse diskten yükle (LRU'yu günceller)"""
+        if anahtar == self._son_anahtar:
+            return self._son_veri
+        veri = self._parcalar.get(anahtar)
+        if veri is None:
+            veri = self._parca_yukle(anahtar)
+        else:
+            self._parcalar.move_to_end(anahtar)
+        self._son_anahtar = anahtar
+        self._son_veri = veri
+        return veri
+
+    def _parca_yukle(self, anahtar: Tuple[int, int]) -> array:
+        while len(self._parcalar) >= self.max_parca:
+            self._tahliye_et()
+        hucre = self.parca_boyutu * self.parca_boyutu
+        veri = array('H')
+        yol = self._parca_yolu(anahtar)
+        if os.path.exists(yol):
+            with open(yol, 'rb') as f:
+                veri.fromfile(f, hucre)
+        else:
+            veri = array('H', bytes(hucre * _HUCRE_BAYT))  # Tümü palet[0]
+        self._parcalar[anahtar] = veri
+        self.yukleme_sayisi += 1
+        return veri
+
+    def _parca_yaz(self, anahtar: Tuple[int, int], veri: array):
+        gecici = self._parca_yolu(anahtar) + ".tmp"
+        with open(gecici, 'wb') as f:
+            veri.tofile(f)
+        os.replace(gecici, self._parca_yolu(anahtar))
+
+    def _tahliye_et(self):
+        """En uzun süredir kullanılmayan parçayı (kirliyse yazıp) bellekten çıkar"""
+        anahtar, veri = self._parcalar.popitem(last=False)
+        if anahtar in self._kirli:
+            self._parca_yaz(anahtar, veri)
+            self._kirli.discard(anahtar)
+        if anahtar == self._son_anahtar:
+            self._son_anahtar = self._son_veri = None
+        self.tahliye_sayisi += 1
+
+    def yakini_yukle(self, x: int, y: int):
+        """(x, y) çevresindeki 3x3 parçayı önceden yükle (oyuncu yaklaşırken)
+
+        Aynı parça içinde kalındıkça hiçbir şey yapmaz.
+        """
+        boyut = self.parca_boyutu
+        merkez = (x // boyut, y // boyut)
+        if merkez == self._son_yakin:
+            return
+        self._son_yakin = merkez
+        px_son = (self.genislik - 1) // boyut
+        py_son = (self.yukseklik - 1) // boyut
+        for py in range(max(0, merkez[1] - 1), min(py_son, merkez[1] + 1) + 1):
+            for px in range(max(0, merkez[0] - 1), min(px_son, merkez[0] + 1) + 1):
+                self._parca((px, py))
+        self._parca(merkez)  # En son kullanılan merkez parça olsun
+
+    def bellek_boyutu(self) -> int:
+        """Bellekteki parçaların yaklaşık bayt boyutu"""
+        return len(self._parcalar) * self.parca_boyutu * self.parca_boyutu * _HUCRE_BAYT
+
+    def kaydet(self):
+        """Değişen parçaları ve dunya.json'ı diske yaz"""
+        for anahtar in list(self._kirli):
+            self._parca_yaz(anahtar, self._parcalar[anahtar])
+        self._kirli.clear()
+        if self._meta_kirli:
+            meta = {"genislik": self.genislik, "yukseklik": self.yukseklik,
+                    "parca_boyutu": self.parca_boyutu, "palet": self.palet,
+                    "oyuncu": list(self.oyuncu) if self.oyuncu else None,
+                    "hedefler": sorted(list(h) for h in self.hedefler)}
+            yol = os.path.join(self.dizin, META_DOSYASI)
+            with open(yol + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(yol + ".tmp", yol)
+            self._meta_kirli = False
+
+    def __enter__(self) -> "ParcaliHarita":
+        return self
+
+    def __exit__(self, *hata):
+        self.kaydet()
+
+    # ------------------------------------------------------------------
+    # Hücre erişimi
+    # ------------------------------------------------------------------
+
+    def karakter(self, x: int, y: int) -> str:
+        """(x, y)'deki karakter (sınır kontrolü çağırana aittir)"""
+        boyut = self.parca_boyutu
+        veri = self._parca((x // boyut, y // boyut))
+        return self.palet[veri[(y % boyut) * boyut + (x % boyut)]]
+
+    def yaz(self, x: int, y: int, karakter: str):
+        """(x, y)'ye yaz; parçayı kirli işaretle, oyuncu/hedef indeksini güncelle"""
+        if not (0 <= x < self.genislik and 0 <= y < self.yukseklik):
+            raise IndexError("harita dışında")
+        deger = self._palet_indeksi.get(karakter)
+        if deger is None:
+            deger = self._palet_indeksi[karakter] = len(self.palet)
+            self.palet.append(karakter)
+            self._meta_kirli = True
+        boyut = self.parca_boyutu
+        anahtar = (x // boyut, y // boyut)
+        self._parca(anahtar)[(y % boyut) * boyut + (x % boyut)] = deger
+        self._kirli.add(anahtar)
+
+        bayrak = self._bayraklar.get(karakter, 0)
+        if bayrak & OYUNCU and self.oyuncu != (x, y):
+            self.oyuncu = (x, y)
+            self._meta_kirli = True
+        elif bayrak & HEDEF and (x, y) not in self.hedefler:
+            self.hedefler.add((x, y))
+            self._meta_kirli = True
+
+    def __len__(self) -> int:
+        return self.yukseklik
+
+    def __getitem__(self, y: int) -> ParcaliSatir:
+        if y < 0:
+            y += self.yukseklik
+        if y < 0 or y >= self.yukseklik:
+            raise IndexError("harita indeksi aralık dışında")
+        return ParcaliSatir(self, y)
+
+    def __iter__(self) -> Iterator[ParcaliSatir]:
+        for y in range(self.yukseklik):
+            yield ParcaliSatir(self, y)
+
+    def pencere(self, x0: int, y0: int, genislik: int, yukseklik: int) -> List[List[str]]:
+        """Haritanın bir dikdörtgen bölümünü liste listesi olarak al (çizim için)"""
+        x1 = min(self.genislik, x0 + genislik)
+        y1 = min(self.yukseklik, y0 + yukseklik)
+        karakter = self.karakter
+        return [[karakter(x, y) for x in range(max(0, x0), x1)]
+                for y in range(max(0, y0), y1)]
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Prosedürel Seviye Üretici
+Duvarla dolu bir ızgarada rastgele yürüyen bir kazıcıyla oda/koridor açar,
+nesneleri hedeflerin üzerine koyup (çözülmüş durum) oyunu geriye doğru
+oynar: oyuncu rastgele seçilen nesnelerin yanına yürüyüp onları çeker. Her çekme
+ileri yönde bir itme olduğundan üretilen her seviye yapısı gereği
+çözülebilirdir ve çözümü (geri hamlelerin tersi) arama yapmadan bilinir.
+
+Aynı tohum ve ayarlar her zaman aynı seviyeyi üretir.
+
+Kullanım:
+    python seviye_uretici.py -n 100 --genislik 64 --yukseklik 64 -o uretilen.json
+    python seviye_uretici.py --zorluk zor --tohum 42 --goster
+    python seviye_uretici.py --olc    # 64x64 üretim hızını HEDEF_HIZ ile karşılaştır
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Dict, IO, Iterator, List, NamedTuple, Optional, Tuple
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# Üretilen haritalarda kullanılan karakter_anlamlari.json karakterleri
+DUVAR = "#"       # Blok
+ZEMIN = " "       # Boş
+HEDEF = "O"       # Hedef
+NESNE = "🟥"      # İtilebilir
+OYUNCU = "P"      # Oyuncu
+
+# 64x64 haritalar için beklenen en düşük üretim hızı (seviye/sn, varsayılan zorluk)
+HEDEF_HIZ = 100
+
+# Zorluk ön ayarları (her anahtar seviye_uret'e ayrı ayrı da verilebilir)
+ZORLUKLAR: Dict[str, Dict] = {
+    "kolay": {"nesne_sayisi": 2, "doluluk": 0.45, "cekme_sayisi": 8, "min_itme": 4},
+    "orta": {"nesne_sayisi": 4, "doluluk": 0.40, "cekme_sayisi": 24, "min_itme": 12},
+    "zor": {"nesne_sayisi": 8, "doluluk": 0.35, "cekme_sayisi": 80, "min_itme": 40},
+}
+VARSAYILAN_ZORLUK = "orta"
+
+# Kazıcının düz gitmeye devam etme ve 2x2 oda açma olasılıkları
+_DUZ_GITME = 0.7
+_ODA_ACMA = 0.15
+
+# Bir tohumla en fazla kaç deneme yapılır (min_itme tutmazsa yeniden kazılır)
+_MAX_DENEME = 50
+
+
+class UretilenSeviye(NamedTuple):
+    """Üretilen seviye; harita ve gizli hedefler OyunMotoru'na verilir
+
+    motor = OyunMotoru(seviye.harita, hedefler=seviye.hedefler)
+    motor.adimlar(seviye.cozum)   # -> kazanıldı
+    """
+    tohum: int
+    harita: List[List[str]]
+    hedefler: List[Tuple[int, int]]   # Başlangıçta üzerinde nesne/oyuncu duran hedefler
+    cozum: str                        # OyunMotoru.adimlar ile oynatılabilir WASD dizisi
+    itme_sayisi: int                  # Çözümdeki itme sayısı
+
+
+def _kaz(zemin: bytearray, genislik: int, yukseklik: int, doluluk: float,
+         rastgele: random.Random):
+    """Ortadan başlayıp rastgele yürüyerek iç alanın doluluk oranı kadarını aç
+
+    Tek bir kazıcı kullanıldığı için açılan alan her zaman bağlantılıdır.
+    """
+    ic_alan = (genislik - 2) * (yukseklik - 2)
+    hedef_acik = max(2, int(ic_alan * doluluk))
+    yonler = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    x, y = genislik // 2, yukseklik // 2
+    dx, dy = rastgele.choice(yonler)
+    acik = 0
+    for _ in range(ic_alan * 50):
+        i = y * genislik + x
+        if not zemin[i]:
+            zemin[i] = 1
+            acik += 1
+        if rastgele.random() < _ODA_ACMA and x + 1 < genislik - 1 and y + 1 < yukseklik - 1:
+            for j in (i + 1, i + genislik, i + genislik + 1):
+                if not zemin[j]:
+                    zemin[j] = 1
+                    acik += 1
+        if acik >= hedef_acik:
+            return
+        if rastgele.random() >= _DUZ_GITME:
+            dx, dy = rastgele.choice(yonler)
+        if not (1 <= x + dx < genislik - 1 and 1 <= y + dy < yukseklik - 1):
+            dx, dy = -dx, -dy
+        x += dx
+        y += dy
+
+
+def _yol_bul(zemin: bytearray, nesne: bytearray, bas: int, hedef: int,
+             yonler: Tuple[int, ...]) -> Optional[List[int]]:
+    """Nesnelere dokunmadan bas -> hedef en kısa yürüme yolu (indeks farkları)"""
+    if bas == hedef:
+        return []
+    # Her hücreye hangi yönden (yonler indeksi + 1) gelindiği; 0 = ziyaret edilmedi
+    gelis = bytearray(len(zemin))
+    gelis[bas] = 255
+    kuyruk = [bas]
+    for i in kuyruk:
+        for k, d in enumerate(yonler, 1):
+            j = i + d
+            if zemin[j] and not gelis[j] and not nesne[j]:
+                gelis[j] = k
+                if j == hedef:
+                    yol = []
+                    while j != bas:
+                        d = yonler[gelis[j] - 1]
+                        yol.append(d)
+                        j -= d
+                    yol.reverse()
+                    return yol
+                kuyruk.append(j)
+    return None
+
+
+def _geri_oyna(zemin: bytearray, nesne: bytearray, nesneler: List[int], oyuncu: int,
+               genislik: int, cekme_sayisi: int,
+               rastgele: random.Random) -> Tuple[int, List[str], int]:
+    """Çözülmüş durumdan geriye doğru oyna: rastgele bir nesnenin yanına
+    yürü ve onu birkaç kare çek; cekme_sayisi çekmeye ulaşana dek sürdür
+
+    Oyuncu d yönünde adım atarken arkasındaki nesneyi çektiğinde ileri
+    yönde bu, -d yönünde bir itmedir. Döndürülen hamleler ileri yönde ve
+    ters sıradadır. (oyuncu, hamleler, itme sayısı) döner.
+    """
+    yonler = (1, -1, genislik, -genislik)
+    # Geri adımın indeks farkı -> ileri yöndeki (ters) komut
+    komutlar = {1: "A", -1: "D", genislik: "W", -genislik: "S"}
+    hamleler = []
+    itme = 0
+    for _ in range(cekme_sayisi * 4):
+        if itme >= cekme_sayisi:
+            break
+        sira = rastgele.randrange(len(nesneler))
+        kutu = nesneler[sira]
+        d = rastgele.choice(yonler)
+        # Çekmek için oyuncu kutu + d'de durmalı, kutu + 2d de boş olmalı
+        durus = kutu + d
+        if not zemin[durus] or nesne[durus] or not zemin[durus + d] or nesne[durus + d]:
+            continue
+        yol = _yol_bul(zemin, nesne, oyuncu, durus, yonler)
+        if yol is None:
+            continue
+        hamleler.extend(komutlar[adim] for adim in yol)
+        oyuncu = durus
+        for _ in range(rastgele.randint(1, 4)):
+            sonraki = oyuncu + d
+            if not zemin[sonraki] or nesne[sonraki]:
+                break
+            nesne[kutu] = 0
+            nesne[oyuncu] = 1
+            kutu = oyuncu
+            oyuncu = sonraki
+            hamleler.append(komutlar[d])
+            itme += 1
+        nesneler[sira] = kutu
+    return oyuncu, hamleler, itme
+
+
+def seviye_uret(genislik: int = 64, yukseklik: int = 64, tohum: int = 0,
+                nesne_sayisi: Optional[int] = None, doluluk: Optional[float] = None,
+                cekme_sayisi: Optional[int] = None, min_itme: Optional[int] = None,
+                zorluk: str = VARSAYILAN_ZORLUK) -> UretilenSeviye:
+    """Tek bir çözülebilir seviye üret
+
+    zorluk bir ön ayar seçer (kolay / orta / zor); ayrıca verilen
+    nesne_sayisi, doluluk (açık iç alan oranı), cekme_sayisi (geri
+    oynamada hedeflenen çekme sayısı) ve min_itme (çözümdeki en az itme)
+    ön ayarı ezer.
+    """
+    if genislik < 5 or yukseklik < 5:
+        raise ValueError("Harita en az 5x5 olmalı")
+    ayarlar = dict(ZORLUKLAR[zorluk])
+    for anahtar, deger in (("nesne_sayisi", nesne_sayisi), ("doluluk", doluluk),
+                           ("cekme_sayisi", cekme_sayisi), ("min_itme", min_itme)):
+        if deger is not None:
+            ayarlar[anahtar] = deger
+
+    rastgele = random.Random(tohum)
+    boyut = genislik * yukseklik
+    en_iyi = None
+    for _ in range(_MAX_DENEME):
+        zemin = bytearray(boyut)
+        _kaz(zemin, genislik, yukseklik, ayarlar["doluluk"], rastgele)
+
+        # Hedefler: arkasında çekme için iki açık hücre bulunan zemin hücreleri
+        adaylar = [i for i in range(boyut) if zemin[i] and (
+            (zemin[i + 1] and zemin[i + 2]) or (zemin[i - 1] and zemin[i - 2])
+            or (zemin[i + genislik] and zemin[i + 2 * genislik])
+            or (zemin[i - genislik] and zemin[i - 2 * genislik]))]
+        if len(adaylar) <= ayarlar["nesne_sayisi"]:
+            continue
+        hedefler = rastgele.sample(adaylar, ayarlar["nesne_sayisi"])
+        nesne = bytearray(boyut)
+        for i in hedefler:
+            nesne[i] = 1
+        oyuncu = rastgele.choice([i for i in adaylar if not nesne[i]])
+
+        oyuncu, hamleler, itme = _geri_oyna(zemin, nesne, list(hedefler), oyuncu, genislik,
+                                            ayarlar["cekme_sayisi"], rastgele)
+        # Başlangıçta zaten kazanılmış olmasın (oyuncu da bir hedefi örtebilir)
+        ortulu = sum(1 for i in hedefler if nesne[i] or i == oyuncu)
+        if ortulu == len(hedefler):
+            continue
+        aday = (zemin, nesne, hedefler, oyuncu, hamleler, itme)
+        if en_iyi is None or itme > en_iyi[5]:
+            en_iyi = aday
+        if itme >= ayarlar["min_itme"]:
+            break
+    if en_iyi is None:
+        raise ValueError("Bu ayarlarla seviye üretilemedi (doluluk veya boyut çok küçük)")
+    return _seviye_olustur(tohum, genislik, yukseklik, *en_iyi)
+
+
+def _seviye_olustur(tohum: int, genislik: int, yukseklik: int, zemin: bytearray,
+                    nesne: bytearray, hedefler: List[int], oyuncu: int,
+                    hamleler: List[str], itme: int) -> UretilenSeviye:
+    """Izgarayı OyunMotoru'nun kabul ettiği karakter listelerine çevir"""
+    karolar = (DUVAR, ZEMIN)
+    harita = [[karolar[z] for z in zemin[y * genislik:(y + 1) * genislik]]
+              for y in range(yukseklik)]
+    for i in hedefler:
+        harita[i // genislik][i % genislik] = HEDEF
+    for i, var in enumerate(nesne):
+        if var:
+            harita[i // genislik][i % genislik] = NESNE
+    harita[oyuncu // genislik][oyuncu % genislik] = OYUNCU
+    gizli = sorted((i % genislik, i // genislik) for i in hedefler
+                   if i == oyuncu or nesne[i])
+    return UretilenSeviye(tohum, harita, gizli, "".join(reversed(hamleler)), itme)
+
+
+def seviyeler_uret(adet: int, tohum: int = 0, **ayarlar) -> Iterator[UretilenSeviye]:
+    """tohum, tohum+1, ... tohumlarıyla adet seviye üret"""
+    for n in range(adet):
+        yield seviye_uret(tohum=tohum + n, **ayarlar)
+
+
+def cozumu_dogrula(seviye: UretilenSeviye, karakter_sistemi=None) -> bool:
+    """Seviyenin çözümünü OyunMotoru'nda oynat; kazanılıyorsa True"""
+    from oyun_motoru import OyunMotoru
+    motor = OyunMotoru(seviye.harita, karakter_sistemi, hedefler=seviye.hedefler,
+                       gunluk_siniri=0)
+    return motor.adimlar(seviye.cozum).kazanildi
+
+
+def json_paketine_yaz(seviyeler: Iterator[UretilenSeviye], cikti: IO[str],
+                      cozumlu: bool = False, aciklama: str = "") -> int:
+    """Seviyeleri ornek_haritalar.json biçiminde akıtarak yaz; adedi döndür"""
+    adet = 0
+    cikti.write("{\n")
+    for seviye in seviyeler:
+        girdi = {
+            "isim": f"Üretilen #{seviye.tohum}",
+            "boyut": {"genislik": len(seviye.harita[0]), "yukseklik": len(seviye.harita)},
+            "harita": seviye.harita,
+        }
+        if seviye.hedefler:
+            girdi["hedefler"] = [list(h) for h in seviye.hedefler]
+        if aciklama:
+            girdi["aciklama"] = aciklama
+        if cozumlu:
+            girdi["cozum"] = seviye.cozum
+        if adet:
+            cikti.write(",\n")
+        cikti.write(f'  "uretilen_{seviye.tohum}": ' + json.dumps(girdi, ensure_ascii=False))
+        adet += 1
+    cikti.write("\n}\n")
+    return adet
+
+
+def hiz_olc(sure: float = 3.0, genislik: int = 64, yukseklik: int = 64,
+            **ayarlar) -> float:
+    """Verilen sürede üretilebilen seviye sayısından seviye/sn hesapla"""
+    baslangic = time.perf_counter()
+    adet = 0
+    while time.perf_counter() - baslangic < sure:
+        seviye_uret(genislik, yukseklik, tohum=adet, **ayarlar)
+        adet += 1
+    return adet / (time.perf_counter() - baslangic)
+
+
+def main():
+    """Komut satırı giriş noktası"""
+    ayristirici = argparse.ArgumentParser(description="Çözülebilir seviyeler üret")
+    ayristirici.add_argument("-n", "--adet", type=int, default=1)
+    ayristirici.add_argument("--genislik", type=int, default=64)
+    ayristirici.add_argument("--yukseklik", type=int, default=64)
+    ayristirici.add_argument("--tohum", type=int, default=0, help="İlk seviyenin tohumu")
+    ayristirici.add_argument("--zorluk", choices=sorted(ZORLUKLAR), default=VARSAYILAN_ZORLUK)
+    ayristirici.add_argument("--nesne", type=int, help="Nesne (ve hedef) sayısı")
+    ayristirici.add_argument("--doluluk", type=float, help="Açık iç alan oranı (0-1)")
+    ayristirici.add_argument("--cekme", type=int, help="Geri oynamada hedeflenen çekme sayısı")
+    ayristirici.add_argument("--min-itme", type=int, help="Çözümdeki en az itme")
+    ayristirici.add_argument("-o", "--cikti", help="JSON paket dosyası")
+    ayristirici.add_argument("--cozumlu", action="store_true",
+                             help="Çözümleri pakete 'cozum' alanı olarak yaz")
+    ayristirici.add_argument("--goster", action="store_true", help="Seviyeleri ekrana yazdır")
+    ayristirici.add_argument("--olc", action="store_true",
+                             help=f"Üretim hızını ölç ve hedefle ({HEDEF_HIZ}/sn) karşılaştır")
+    args = ayristirici.parse_args()
+
+    ayarlar = {"genislik": args.genislik, "yukseklik": args.yukseklik, "zorluk": args.zorluk,
+               "nesne_sayisi": args.nesne, "doluluk": args.doluluk,
+               "cekme_sayisi": args.cekme, "min_itme": args.min_itme}
+
+    if args.olc:
+        hiz = hiz_olc(**ayarlar)
+        durum = "✅" if hiz >= HEDEF_HIZ else "❌"
+        print(f"{durum} {args.genislik}x{args.yukseklik}: {hiz:,.1f} seviye/sn "
+              f"(hedef: {HEDEF_HIZ}/sn)")
+        if hiz < HEDEF_HIZ:
+            sys.exit(1)
+        return
+
+    seviyeler = seviyeler_uret(args.adet, args.tohum, **ayarlar)
+    if args.cikti:
+        with open(args.cikti, 'w', encoding='utf-8') as f:
+            adet = json_paketine_yaz(seviyeler, f, args.cozumlu, f"zorluk: {args.zorluk}")
+        print(f"🧱 {adet} seviye üretildi: {args.cikti}")
+        return
+
+    for seviye in seviyeler:
+        print(f"🧱 Üretilen #{seviye.tohum}: {len(seviye.cozum)} hareket, "
+              f"{seviye.itme_sayisi} itme")
+        if args.goster:
+            for satir in seviye.harita:
+                print(" ".join(satir))
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Hareket Kaydı ve Tekrar Oynatma
+Oturumdaki hareketleri yön başına 2 bitle paketleyerek kaydeder; kayıt,
+seviyenin içerik özeti ve motor sürümüyle damgalanır. Kayıtlar ekran ve
+klavye kullanılmadan, motorun tam hızında yeniden oynatılıp son durum
+özetiyle doğrulanır (skor tablosu denetimi, motor değişikliği sonrası
+regresyon testleri).
+
+Dosya düzeni (.uglr, tamsayılar little-endian):
+    "UGLR" | biçim sürümü (1 bayt) | motor sürümü (2 bayt)
+    | hareket sayısı (8 bayt) | seviye özeti (32 bayt) | son durum özeti (32 bayt)
+    | anahtar uzunluğu (2 bayt) | anahtar (UTF-8)
+    | hareketler (bayt başına 4 yön, düşük bitlerden başlayarak)
+
+Kullanım:
+    python tekrar.py kayitlar/harita_1_20250101-120000.uglr
+    python tekrar.py kayit.uglr paket1.json paket2.uglp
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import sys
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from game_lab import KarakterAnlamSistemi
+from kompakt_harita import KompaktHarita
+from oyun_motoru import MOTOR_SURUMU, OyunMotoru
+from parcali_harita import ParcaliHarita
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+SIHIRLI = b"UGLR"
+KAYIT_SURUMU = 1
+_BASLIK = struct.Struct("<4sBHQ32s32sH")
+
+# 2 bitlik yön kodları; kod sırası YON_KOMUTLARI ile aynıdır
+YON_KOMUTLARI = "WSAD"
+_YON_KODLARI = {(0, -1): 0, (0, 1): 1, (-1, 0): 2, (1, 0): 3}
+
+# Bayt -> içindeki dört komut (çözme tek tablo erişimiyle yapılır)
+_BAYT_KOMUTLARI = ["".join(YON_KOMUTLARI[(bayt >> (2 * i)) & 3] for i in range(4))
+                   for bayt in range(256)]
+
+
+class HareketKaydi:
+    """Başarılı hareketlerin yön başına 2 bitlik paketli kaydı
+
+    OyunMotoru.hareket_kaydi'na atanır; motor her başarılı harekette
+    ekle(), her geri almada geri_al() çağırır. Böylece kayıt her zaman
+    başlangıçtan şu anki duruma giden hareket dizisidir.
+    """
+
+    __slots__ = ("_veri", "_uzunluk", "baslangic_ozeti")
+
+    def __init__(self, baslangic_ozeti: bytes = b""):
+        self._veri = bytearray()
+        self._uzunluk = 0
+        self.baslangic_ozeti = baslangic_ozeti  # Kaydın başladığı durumun özeti
+
+    def __len__(self) -> int:
+        return self._uzunluk
+
+    def ekle(self, dx: int, dy: int):
+        """Bir hareket ekle"""
+        kaydir = (self._uzunluk & 3) * 2
+        if kaydir == 0:
+            self._veri.append(_YON_KODLARI[(dx, dy)])
+        else:
+            self._veri[-1] |= _YON_KODLARI[(dx, dy)] << kaydir
+        self._uzunluk += 1
+
+    def geri_al(self):
+        """Son hareketi sil"""
+        if not self._uzunluk:
+            return
+        self._uzunluk -= 1
+        kaydir = (self._uzunluk & 3) * 2
+        if kaydir == 0:
+            self._veri.pop()
+        else:
+            self._veri[-1] &= (1 << kaydir) - 1
+
+    def baytlar(self) -> bytes:
+        """Paketli hareket verisi"""
+        return bytes(self._veri)
+
+    def komutlar(self) -> str:
+        """Kaydı OyunMotoru.adimlar()'ın kabul ettiği "WASD..." dizisine çevir"""
+        return komutlari_coz(self._veri, self._uzunluk)
+
+
+def komutlari_coz(veri: bytes, uzunluk: int) -> str:
+    """Paketli hareket verisini komut dizisine çevir"""
+    return "".join(map(_BAYT_KOMUTLARI.__getitem__, veri))[:uzunluk]
+
+
+def durum_ozeti(motor: OyunMotoru) -> bytes:
+    """Motor durumunun SHA-256 özeti (harita, oyuncu, hedefler, sayaçlar)
+
+    Yeni kurulmuş bir motorda bu, seviyenin içerik özetidir: aynı harita ve
+    gizli hedeflerle kurulan her motor aynı özeti verir.
+    """
+    ozet = hashlib.sha256()
+    for satir in motor.harita:
+        ozet.update("\x00".join(satir).encode('utf-8'))
+        ozet.update(b"\n")
+    ozet.update(repr((motor.oyuncu_x, motor.oyuncu_y, sorted(motor.hedef_konumlari()),
+                      motor.hareket_sayisi, motor.itme_sayisi)).encode('utf-8'))
+    return ozet.digest()
+
+
+class Tekrar(NamedTuple):
+    """Bir oturumun kaydı"""
+    motor_surumu: int
+    seviye_ozeti: bytes   # Başlangıç durumunun özeti
+    durum_ozeti: bytes    # Son durumun özeti
+    anahtar: str          # Seviyenin paketteki anahtarı (bilgi amaçlı)
+    hareket_sayisi: int
+    hareketler: bytes     # 2 bitlik paketli yönler
+
+    def komutlar(self) -> str:
+        return komutlari_coz(self.hareketler, self.hareket_sayisi)
+
+
+class TekrarSonucu(NamedTuple):
+    """Tekrar oynatmanın doğrulama sonucu"""
+    gecerli: bool          # Tüm denetimler tuttu mu?
+    surum_eslesti: bool    # Kayıt bu motor sürümüyle mi alınmış?
+    seviye_eslesti: bool   # Verilen seviye kayıttakiyle aynı mı?
+    hareketler_gecerli: bool  # Kayıttaki her hareket uygulanabildi mi?
+    durum_eslesti: bool    # Son durum özeti tuttu mu?
+    kazanildi: bool
+    hareket_sayisi: int
+    itme_sayisi: int
+
+
+def kayda_basla(motor: OyunMotoru) -> HareketKaydi:
+    """Motorun bundan sonraki hareketlerini kaydetmeye başla"""
+    kayit = HareketKaydi(durum_ozeti(motor))
+    motor.hareket_kaydi = kayit
+    return kayit
+
+
+def kaydi_bitir(motor: OyunMotoru, anahtar: str = "") -> Tekrar:
+    """Kaydı durdur ve son durum özetiyle birlikte döndür"""
+    kayit = motor.hareket_kaydi
+    if kayit is None:
+        raise ValueError("Motor kayıt yapmıyor (önce kayda_basla çağrılmalı)")
+    motor.hareket_kaydi = None
+    return Tekrar(MOTOR_SURUMU, kayit.baslangic_ozeti, durum_ozeti(motor), anahtar,
+                  len(kayit), kayit.baytlar())
+
+
+def oynat(tekrar: Tekrar,
+          harita: Union[List[List[str]], KompaktHarita, ParcaliHarita],
+          hedefler: Optional[Iterable[Tuple[int, int]]] = None,
+          karakter_sistemi: Optional[KarakterAnlamSistemi] = None) -> TekrarSonucu:
+    """Kaydı ekrana ve klavyeye dokunmadan, tek adimlar() çağrısıyla oynat
+
+    Seviye özeti tutmasa bile oynatılır; sonuçta hangi denetimin
+    tuttuğu ayrı ayrı raporlanır.
+    """
+    motor = OyunMotoru(harita, karakter_sistemi, hedefler=hedefler, gunluk_siniri=0)
+    seviye_eslesti = durum_ozeti(motor) == tekrar.seviye_ozeti
+    motor.adimlar(tekrar.komutlar(), kazaninca_dur=False)
+
+    surum_eslesti = tekrar.motor_surumu == MOTOR_SURUMU
+    # Kayıtta yalnızca başarılı hareketler vardır; biri bile başarısızsa sayı tutmaz
+    hareketler_gecerli = motor.hareket_sayisi == tekrar.hareket_sayisi
+    durum_eslesti = durum_ozeti(motor) == tekrar.durum_ozeti
+    return TekrarSonucu(surum_eslesti and seviye_eslesti and hareketler_gecerli and durum_eslesti,
+                        surum_eslesti, seviye_eslesti, hareketler_gecerli, durum_eslesti,
+                        motor.acik_hedef_sayisi() == 0, motor.hareket_sayisi, motor.itme_sayisi)
+
+
+def tekrar_yaz(tekrar: Tekrar, dosya: str):
+    """Kaydı .uglr dosyasına yaz (geçici dosya + os.replace ile)"""
+    anahtar = tekrar.anahtar.encode('utf-8')
+    gecici = f"{dosya}.{os.getpid()}.tmp"
+    try:
+        with open(gecici, 'wb') as f:
+            f.write(_BASLIK.pack(SIHIRLI, KAYIT_SURUMU, tekrar.motor_surumu,
+                                 tekrar.hareket_sayisi, tekrar.seviye_ozeti,
+                                 tekrar.durum_ozeti, len(anahtar)))
+            f.write(anahtar)
+            f.write(tekrar.hareketler)
+        os.replace(gecici, dosya)
+    except OSError:
+        try:
+            os.remove(gecici)
+        except OSError:
+            pass
+        raise
+
+
+def tekrar_oku(dosya: str) -> Tekrar:
+    """.uglr dosyasını oku"""
+    with open(dosya, 'rb') as f:
+        veri = f.read()
+    if len(veri) < _BASLIK.size:
+        raise ValueError(f"{dosya}: hareket kaydı değil")
+    sihirli, surum, motor_surumu, sayi, seviye, durum, anahtar_uzunlugu = \
+        _BASLIK.unpack_from(veri)
+    if sihirli != SIHIRLI:
+        raise ValueError(f"{dosya}: hareket kaydı değil")
+    if surum != KAYIT_SURUMU:
+        raise ValueError(f"{dosya}: desteklenmeyen kayıt sürümü {surum}")
+    i = _BASLIK.size + anahtar_uzunlugu
+    hareketler = veri[i:]
+    if len(hareketler) != (sayi + 3) // 4:
+        raise ValueError(f"{dosya}: hareket verisi eksik ya da fazla")
+    return Tekrar(motor_surumu, seviye, durum,
+                  veri[_BASLIK.size:i].decode('utf-8'), sayi, hareketler)
+
+
+def main():
+    """Kaydı oynat ve doğrula"""
+    from harita_katalogu import HaritaKatalogu
+
+    ayristirici = argparse.ArgumentParser(
+        description="Hareket kaydını ekransız oynat ve son durumunu doğrula")
+    ayristirici.add_argument("kayit", help=".uglr kayıt dosyası")
+    ayristirici.add_argument("paketler", nargs="*",
+                             help="Seviyenin aranacağı harita paketleri (varsayılan: örnek paket)")
+    args = ayristirici.parse_args()
+
+    tekrar = tekrar_oku(args.kayit)
+    katalog = HaritaKatalogu(args.paketler) if args.paketler else HaritaKatalogu()
+    girdi = katalog.bul(tekrar.anahtar)
+    if girdi is None:
+        print(f"❌ Seviye bulunamadı: {tekrar.anahtar}")
+        sys.exit(1)
+    bilgi = katalog.bilgi_yukle(girdi)
+    sonuc = oynat(tekrar, bilgi["harita"], bilgi.get("hedefler"))
+
+    print(f"🎬 {girdi.isim}: {sonuc.hareket_sayisi} hareket, {sonuc.itme_sayisi} itme"
+          f"{' (kazanıldı)' if sonuc.kazanildi else ''}")
+    for ad, tuttu in (("Motor sürümü", sonuc.surum_eslesti),
+                      ("Seviye özeti", sonuc.seviye_eslesti),
+                      ("Hareketler", sonuc.hareketler_gecerli),
+                      ("Son durum özeti", sonuc.durum_eslesti)):
+        print(f"  {'✅' if tuttu else '❌'} {ad}")
+    if not sonuc.gecerli:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Terminal Çizici
+Ön tampon tutan, yalnızca değişen hücreleri ANSI imleç hareketleriyle
+yeniden yazan fark tabanlı terminal çizicisi
+"""
+
+import sys
+import unicodedata
+from typing import Dict, List, Optional, Sequence
+
+from game_lab import KarakterAnlamSistemi
+
+# ANSI kaçış dizileri
+_EKRANI_TEMIZLE = "\x1b[2J\x1b[H"
+_SATIR_SONUNU_SIL = "\x1b[K"
+_ASAGISINI_SIL = "\x1b[J"
+
+
+def _imlec(satir: int, sutun: int) -> str:
+    """İmleci 1 tabanlı (satır, sütun) konumuna taşıyan dizi"""
+    return f"\x1b[{satir};{sutun}H"
+
+
+def gorunur_genislik(metin: str) -> int:
+    """Metnin terminalde kapladığı sütun sayısı
+
+    Geniş/tam genişlikli karakterler 2, birleştirici işaretler ve sıfır
+    genişlikli birleştiriciler 0 sütundur; VS16 (U+FE0F) önündeki
+    karakteri emoji sunumuna (2 sütun) çevirir.
+    """
+    genislik = 0
+    onceki = 0
+    for karakter in metin:
+        if karakter == "\ufe0f":
+            if onceki == 1:
+                genislik += 1
+                onceki = 2
+            continue
+        if karakter in "\u200b\u200c\u200d" or unicodedata.combining(karakter):
+            continue
+        onceki = 2 if unicodedata.east_asian_width(karakter) in ("W", "F") else 1
+        genislik += onceki
+    return genislik
+
+
+class TerminalCizici:
+    """Her karede yalnızca değişen satır/hücreleri tek bir yazma ile çizer
+
+    Harita hücreleri sabit genişlikte sütunlara yerleştirilir; böylece
+    🟥 veya ⬆️ gibi emoji karoları ASCII karolarla hizalı kalır.
+    """
+
+    def __init__(self, karakter_sistemi: KarakterAnlamSistemi, cikti=None):
+        self.cikti = cikti or sys.stdout
+        # Görünür genişlik tablosu: bilinen tüm karakterler için bir kez
+        self._genislikler: Dict[str, int] = {
+            karakter: gorunur_genislik(karakter)
+            for karakter in karakter_sistemi.id_karakterleri
+        }
+        self.hucre_genisligi = max(self._genislikler.values(), default=1)
+        self._dolgular = [" " * n for n in range(self.hucre_genisligi + 1)]
+        self._on_tampon: Optional[List[List[str]]] = None
+        self._ust_tampon: List[str] = []
+        self._alt_tampon: List[str] = []
+
+    def karakter_genisligi(self, karakter: str) -> int:
+        """Karo genişliği (bilinmeyen karakterler ilk görüldüğünde ölçülür)"""
+        genislik = self._genislikler.get(karakter)
+        if genislik is None:
+            genislik = self._genislikler[karakter] = gorunur_genislik(karakter)
+        return genislik
+
+    def _hucre(self, karakter: str) -> str:
+        """Karakteri sabit hücre genişliğine tamamla"""
+        eksik = self.hucre_genisligi - self.karakter_genisligi(karakter)
+        return karakter + self._dolgular[eksik] if eksik > 0 else karakter
+
+    def _satir_metni(self, satir: Sequence[str]) -> str:
+        return " ".join(self._hucre(karakter) for karakter in satir)
+
+    def sifirla(self):
+        """Sonraki karede tüm ekranı yeniden çiz"""
+        self._on_tampon = None
+
+    def kare_olustur(self, harita, ust_satirlar: Sequence[str] = (),
+                     alt_satirlar: Sequence[str] = ()) -> str:
+        """Ön tamponla farkı ANSI dizisi olarak üret ve ön tamponu güncelle
+
+        Düzen: üst bilgi satırları, boş satır, harita, boş satır, alt satırlar.
+        Kare sonunda imleç alt satırların altına konur ve aşağısı silinir.
+        """
+        parcalar = []
+        tam_cizim = self._on_tampon is None or len(self._on_tampon) != len(harita) \
+            or len(ust_satirlar) != len(self._ust_tampon)
+        if tam_cizim:
+            parcalar.append(_EKRANI_TEMIZLE)
+            self._on_tampon = [[] for _ in range(len(harita))]
+            self._ust_tampon = [None] * len(ust_satirlar)
+            self._alt_tampon = []
+
+        # Üst bilgi
+        for i, metin in enumerate(ust_satirlar):
+            if metin != self._ust_tampon[i]:
+                parcalar.append(_imlec(i + 1, 1) + metin + _SATIR_SONUNU_SIL)
+        self._ust_tampon = list(ust_satirlar)
+
+        # Harita: yalnızca değişen satırların değişen hücreleri
+        ilk_satir = len(ust_satirlar) + 2
+        adim = self.hucre_genisligi + 1
+        hucre = self._hucre
+        for y, satir in enumerate(harita):
+            satir = list(satir)
+            onceki = self._on_tampon[y]
+            if satir == onceki:
+                continue
+            if len(satir) != len(onceki):
+                parcalar.append(_imlec(ilk_satir + y, 1) + self._satir_metni(satir)
+                                + _SATIR_SONUNU_SIL)
+            else:
+                x = 0
+                while x < len(satir):
+                    if satir[x] == onceki[x]:
+                        x += 1
+                        continue
+                    # Ardışık değişen hücreleri tek imleç hareketiyle yaz
+                    bas = x
+                    while x < len(satir) and satir[x] != onceki[x]:
+                        x += 1
+                    parcalar.append(_imlec(ilk_satir + y, bas * adim + 1) +
+                                    " ".join(hucre(k) for k in satir[bas:x]))
+            self._on_tampon[y] = satir
+
+        # Alt bilgi
+        alt_baslangic = ilk_satir + len(harita) + 1
+        for i, metin in enumerate(alt_satirlar):
+            if i >= len(self._alt_tampon) or metin != self._alt_tampon[i]:
+                parcalar.append(_imlec(alt_baslangic + i, 1) + metin + _SATIR_SONUNU_SIL)
+        self._alt_tampon = list(alt_satirlar)
+
+        parcalar.append(_imlec(alt_baslangic + len(alt_satirlar), 1) + _ASAGISINI_SIL)
+        return "".join(parcalar)
+
+    def ciz(self, harita, ust_satirlar: Sequence[str] = (),
+            alt_satirlar: Sequence[str] = ()):
+        """Kareyi tek bir tamponlu yazma ile terminale gönder"""
+        self.cikti.write(self.kare_olustur(harita, ust_satirlar, alt_satirlar))
+        self.cikti.flush()
+
+    def metin_olustur(self, harita) -> str:
+        """Haritanın hizalı, kaçış dizisi içermeyen düz metin hali (ekransız)"""
+        return "\n".join(self._satir_metni(satir) for satir in harita)
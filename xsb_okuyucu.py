@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - XSB Seviye Okuyucu
+Klasik düz metin (XSB) itme bulmacası koleksiyonlarını satır satır, sabit
+bellekle okur ve her seviyeyi OyunMotoru'na hazır haritaya çevirir.
+
+    #  duvar          @  oyuncu             $  kutu
+    .  hedef          +  hedefteki oyuncu   *  hedefteki kutu
+    ' ', '-', '_'  zemin
+
+Seviyeler boş satırlarla ayrılır; ';' ile başlayan satırlar yorum,
+"Anahtar: değer" satırları (Title:, Author: ...) seviye bilgisidir.
+Sayı önekli (RLE) satırlar ve '|' satır ayırıcısı da desteklenir.
+
+Kullanım:
+    python xsb_okuyucu.py koleksiyon.xsb -o koleksiyon.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Dict, IO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+# XSB karakteri -> karakter_anlamlari.json karakteri
+XSB_KARAKTERLERI = {
+    "#": "#",    # Blok
+    " ": " ",    # Boş
+    "-": " ",
+    "_": " ",
+    ".": "O",    # Hedef
+    "$": "🟥",   # İtilebilir
+    "*": "🟥",   # Hedefteki itilebilir (hedef gizli)
+    "@": "P",    # Oyuncu
+    "+": "P",    # Hedefteki oyuncu (hedef gizli)
+}
+# Altında haritada görünmeyen bir hedef bulunan XSB karakterleri
+_GIZLI_HEDEFLI = frozenset("*+")
+
+_SATIR_KARAKTERLERI = frozenset(XSB_KARAKTERLERI) | frozenset("0123456789|")
+_BILGI_SATIRI = re.compile(r"^\s*([A-Za-z][\w ]*?)\s*:\s*(.*)$")
+_RLE_PARCASI = re.compile(r"(\d+)(.)")
+
+
+class XsbSeviye(NamedTuple):
+    """Okunan bir seviye: harita ve gizli hedefler OyunMotoru'na verilir
+
+    motor = OyunMotoru(seviye.harita, hedefler=seviye.hedefler)
+    """
+    sira: int
+    isim: str
+    harita: List[List[str]]
+    hedefler: List[Tuple[int, int]]
+    bilgiler: Dict[str, str]
+
+
+def _harita_satiri_mi(satir: str) -> bool:
+    """Satır tahta satırı mı? (yalnızca XSB karakterleri ve en az bir duvar)"""
+    return "#" in satir and all(k in _SATIR_KARAKTERLERI for k in satir)
+
+
+def _rle_ac(satir: str) -> List[str]:
+    """'4#' -> '####' biçimindeki sayı önekli satırları aç; '|' yeni satırdır
+
+    Ardında karakter olmayan (satır sonundaki ya da '|' önündeki) bir sayı
+    ValueError verir.
+    """
+    if not any(k.isdigit() for k in satir):
+        return satir.split("|")
+    acik = _RLE_PARCASI.sub(
+        lambda m: "\0" if m.group(2) == "|" else m.group(2) * int(m.group(1)), satir)
+    if any(k.isdigit() or k == "\0" for k in acik):
+        raise ValueError(f"karakteri olmayan tekrar sayısı: {satir!r}")
+    return acik.split("|")
+
+
+def _seviye_olustur(sira: int, satirlar: List[str], bilgiler: Dict[str, str],
+                    yorumlar: List[str], varsayilan_isim: str,
+                    karakterler: Dict[str, str]) -> XsbSeviye:
+    genislik = max(len(satir) for satir in satirlar)
+    harita = []
+    hedefler = []
+    for y, satir in enumerate(satirlar):
+        harita_satiri = []
+        for x, xsb in enumerate(satir.ljust(genislik)):
+            if xsb not in karakterler:
+                raise ValueError(f"tanımsız XSB karakteri: {xsb!r}")
+            harita_satiri.append(karakterler[xsb])
+            if xsb in _GIZLI_HEDEFLI:
+                hedefler.append((x, y))
+        harita.append(harita_satiri)
+
+    isim = bilgiler.get("Title") or (yorumlar[0] if yorumlar else varsayilan_isim)
+    return XsbSeviye(sira, isim, harita, hedefler, dict(bilgiler))
+
+
+def xsb_oku(kaynak: Union[str, IO[str]],
+            karakterler: Optional[Dict[str, str]] = None) -> Iterator[XsbSeviye]:
+    """XSB koleksiyonundaki seviyeleri sırayla üret (dosya yolu veya metin akışı)
+
+    Bellekte yalnızca o an okunan seviye tutulur; çok büyük koleksiyonlar
+    baştan sona akıtılabilir. karakterler, XSB karakteri -> harita
+    karakteri eşlemesini değiştirmek için verilebilir.
+    """
+    karakterler = {**XSB_KARAKTERLERI, **(karakterler or {})}
+    if isinstance(kaynak, str):
+        ad = os.path.splitext(os.path.basename(kaynak))[0]
+        with open(kaynak, 'r', encoding='utf-8', errors='replace') as f:
+            yield from _akistan_oku(f, ad, karakterler)
+    else:
+        yield from _akistan_oku(kaynak, getattr(kaynak, "name", "xsb"), karakterler)
+
+
+def _akistan_oku(akis: IO[str], ad: str, karakterler: Dict[str, str]) -> Iterator[XsbSeviye]:
+    """Tahta satırlarını biriktir; boş satır ya da yeni tahta seviyeyi kapatır
+
+    Tahtadan hemen sonra (boş satırdan önce) gelen yorum/bilgi satırları o
+    seviyeye, tahtadan önce gelenler ise bir sonraki seviyeye aittir.
+    Bozuk tahtalı seviyeler uyarıyla atlanır (sıra numaraları korunur);
+    koleksiyonun geri kalanı okunmaya devam eder.
+    """
+    sira = 0
+    satirlar: List[str] = []
+    # Tahtadan önceki (başlık) ve sonraki satırlar ayrı tutulur
+    on_bilgiler: Dict[str, str] = {}
+    on_yorumlar: List[str] = []
+    bilgiler: Dict[str, str] = {}
+    yorumlar: List[str] = []
+    hata: Optional[str] = None  # Tahtadaki ilk bozuk satır ("satır N: ...")
+    ilk_satir = 0
+
+    def bitir() -> Optional[XsbSeviye]:
+        nonlocal sira, satirlar, on_bilgiler, on_yorumlar, bilgiler, yorumlar, hata
+        sira += 1
+        seviye = None
+        if hata is None:
+            try:
+                seviye = _seviye_olustur(sira, satirlar, {**on_bilgiler, **bilgiler},
+                                         on_yorumlar + yorumlar, f"{ad} #{sira}", karakterler)
+            except ValueError as e:
+                hata = f"satır {ilk_satir}'de başlayan tahta: {e}"
+        if hata is not None:
+            print(f"⚠️  {ad} #{sira} atlandı ({hata})", file=sys.stderr)
+        satirlar, on_bilgiler, on_yorumlar, bilgiler, yorumlar = [], {}, [], {}, []
+        hata = None
+        return seviye
+
+    for satir_no, ham in enumerate(akis, 1):
+        satir = ham.rstrip("\r\n")
+        if satir.strip() == "":
+            if satirlar:
+                seviye = bitir()
+                if seviye:
+                    yield seviye
+            continue
+        if _harita_satiri_mi(satir.rstrip()):
+            if satirlar and (bilgiler or yorumlar):
+                seviye = bitir()  # Araya boş satır konmamış iki seviye
+                if seviye:
+                    yield seviye
+            if not satirlar:
+                ilk_satir = satir_no
+            try:
+                satirlar.extend(_rle_ac(satir.rstrip()))
+            except ValueError as e:
+                satirlar.append("")  # Seviye açık kalsın; bitir() atlayacak
+                hata = hata or f"satır {satir_no}: {e}"
+            continue
+
+        metin = satir.strip().lstrip(";").strip()
+        if not metin:
+            continue
+        bilgi = _BILGI_SATIRI.match(metin)
+        if bilgi:
+            (bilgiler if satirlar else on_bilgiler)[bilgi.group(1)] = bilgi.group(2)
+        else:
+            (yorumlar if satirlar else on_yorumlar).append(metin)
+
+    if satirlar:
+        seviye = bitir()
+        if seviye:
+            yield seviye
+
+
+def json_paketine_yaz(kaynak: Union[str, IO[str]], cikti: IO[str]) -> int:
+    """Koleksiyonu ornek_haritalar.json biçiminde akıtarak yaz
+
+    Gizli hedefler girdinin "hedefler" alanına [x, y] listesi olarak yazılır.
+    Yazılan seviye sayısını döndürür.
+    """
+    adet = 0
+    cikti.write("{\n")
+    for seviye in xsb_oku(kaynak):
+        girdi = {
+            "isim": seviye.isim,
+            "boyut": {"genislik": len(seviye.harita[0]), "yukseklik": len(seviye.harita)},
+            "harita": seviye.harita,
+        }
+        if seviye.hedefler:
+            girdi["hedefler"] = [list(h) for h in seviye.hedefler]
+        if seviye.bilgiler:
+            girdi["aciklama"] = ", ".join(f"{k}: {v}" for k, v in seviye.bilgiler.items())
+        if adet:
+            cikti.write(",\n")
+        cikti.write(f'  "seviye_{seviye.sira}": ' + json.dumps(girdi, ensure_ascii=False))
+        adet += 1
+    cikti.write("\n}\n")
+    return adet
+
+
+def main():
+    """Komut satırı giriş noktası"""
+    ayristirici = argparse.ArgumentParser(
+        description="XSB (düz metin) seviye koleksiyonunu harita paketine dönüştür")
+    ayristirici.add_argument("kaynak", help="XSB koleksiyon dosyası")
+    ayristirici.add_argument("-o", "--cikti", help="JSON paket dosyası (varsayılan: stdout)")
+    args = ayristirici.parse_args()
+
+    cikti = open(args.cikti, 'w', encoding='utf-8') if args.cikti else sys.stdout
+    try:
+        adet = json_paketine_yaz(args.kaynak, cikti)
+    finally:
+        if cikti is not sys.stdout:
+            cikti.close()
+    print(f"📥 {adet} seviye içe aktarıldı", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
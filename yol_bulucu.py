@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unicode Game Lab - Yol Bulucu
+Hedeflerden (hedef hücreleri, anahtar, enerji ya da tek bir konum) geriye
+doğru ağırlıklı mesafe alanları hesaplar. Bir alan bir kez hesaplandıktan
+sonra haritanın her hücresi için "hedefe kaç adım?" ve "sıradaki en iyi
+hamle ne?" soruları O(1) cevaplanır.
+
+Karo maliyetleri karakter_anlamlari.json'daki "maliyet" alanından okunur
+(yoksa 1): hücreye girmenin bedelidir. Tüm maliyetler 1 ise BFS, değilse
+Dijkstra kullanılır. İtilebilir nesneler engel sayılır (yalnızca yürüme).
+
+Alanlar motorun içerik özeti + hedefle anahtarlanan LRU önbellekte tutulur;
+itme yapmadan yürümek özeti değiştirmediğinden her karede yeniden
+hesaplanmazlar.
+"""
+
+import heapq
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from erisilebilirlik import YURUNEBILIR
+from game_lab import KarakterAnlamSistemi, OYUNCU
+
+# Windows konsolunda UTF-8 desteği için
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+SONSUZ = float("inf")
+
+# JSON'da "maliyet" alanı olmayan yürünebilir karoların maliyeti
+VARSAYILAN_MALIYET = 1
+
+# Önbellekte tutulan en fazla mesafe alanı
+ONBELLEK_KAPASITESI = 32
+
+# Varsayılan hedef: hedef karakterini taşıyan (örtülmemiş) hücreler
+VARSAYILAN_HEDEF = "Hedef"
+
+# (dx, dy) -> hareket komutu
+YON_KOMUTLARI = {(0, -1): "W", (0, 1): "S", (-1, 0): "A", (1, 0): "D"}
+
+# Hedef tanımı: özellik adı ("Hedef", "Anahtar", "Enerji"), tek karakter
+# ("K", "⚡") ya da (x, y) konumu
+HedefTanimi = Union[str, Tuple[int, int]]
+
+
+def maliyet_tablosu(karakter_sistemi: KarakterAnlamSistemi) -> Dict[str, int]:
+    """Yürünebilir karakterlerin giriş maliyetleri (diğerleri tabloda yok)
+
+    Oyuncunun durduğu hücre boş alan sayılır; böylece alan oyuncunun
+    nerede durduğuna bağlı olmaz.
+    """
+    bos_maliyeti = VARSAYILAN_MALIYET
+    tablo: Dict[str, int] = {}
+    for karakter, bayrak in karakter_sistemi.bayrak_haritasi.items():
+        if not bayrak & YURUNEBILIR:
+            continue
+        bilgi = karakter_sistemi.karakter_bul(karakter) or {}
+        tablo[karakter] = max(1, int(bilgi.get("maliyet", VARSAYILAN_MALIYET)))
+        if karakter == " ":
+            bos_maliyeti = tablo[karakter]
+    for karakter, bayrak in karakter_sistemi.bayrak_haritasi.items():
+        if bayrak & OYUNCU:
+            tablo[karakter] = bos_maliyeti
+    return tablo
+
+
+class Ipucu(NamedTuple):
+    """Oyuncu konumundan bir hedefe giden en ucuz yol"""
+    komut: Optional[str]           # Sıradaki hamle (W/A/S/D); hedefteyse ya da yol yoksa None
+    mesafe: float                  # Toplam yol maliyeti (ulaşılamıyorsa SONSUZ)
+    yol: List[Tuple[int, int]]     # Oyuncudan sonraki hücreler, hedef dahil
+
+
+class MesafeAlani:
+    """Hedeflerden geriye hesaplanmış en ucuz yol maliyetleri
+
+    Hücreler kenarlarına duvar eklenmiş ızgarada (y + 1) * genislik + (x + 1)
+    düz indeksleriyle tutulur (KilitlenmeAnalizi ile aynı düzen).
+    mesafeler[i], i'den en yakın hedefe giderken girilen hücrelerin
+    maliyetleri toplamıdır.
+    """
+
+    __slots__ = ("genislik", "yukseklik", "mesafeler", "maliyetler", "yonler")
+
+    def __init__(self, harita, maliyetler: Dict[str, int], hedefler):
+        self.genislik = max((len(satir) for satir in harita), default=0) + 2
+        self.yukseklik = len(harita) + 2
+        g = self.genislik
+        self.yonler = (-g, -1, g, 1)
+
+        # Girilemeyen hücrelerin maliyeti 0
+        maliyet = [0] * (self.genislik * self.yukseklik)
+        for y, satir in enumerate(harita):
+            taban = (y + 1) * g + 1
+            for x, karakter in enumerate(satir):
+                maliyet[taban + x] = maliyetler.get(karakter, 0)
+        self.maliyetler = maliyet
+
+        mesafe = [SONSUZ] * len(maliyet)
+        baslangiclar = [self.indeks(x, y) for x, y in hedefler
+                        if 0 <= y < len(harita) and 0 <= x < len(harita[y])]
+        baslangiclar = [i for i in baslangiclar if maliyet[i]]
+        for i in baslangiclar:
+            mesafe[i] = 0
+        self.mesafeler = mesafe
+
+        if all(m <= 1 for m in maliyet):
+            self._bfs(baslangiclar)
+        else:
+            self._dijkstra(baslangiclar)
+
+    def _bfs(self, baslangiclar: List[int]):
+        """Birim maliyetler: düz BFS"""
+        mesafe, maliyet = self.mesafeler, self.maliyetler
+        kuyruk = list(baslangiclar)
+        for i in kuyruk:
+            sonraki = mesafe[i] + 1
+            for d in self.yonler:
+                j = i + d
+                if maliyet[j] and mesafe[j] == SONSUZ:
+                    mesafe[j] = sonraki
+                    kuyruk.append(j)
+
+    def _dijkstra(self, baslangiclar: List[int]):
+        """Ağırlıklı karolar: j'den i'ye geçmenin bedeli maliyet[i]"""
+        mesafe, maliyet = self.mesafeler, self.maliyetler
+        yigin = [(0, i) for i in baslangiclar]
+        while yigin:
+            m, i = heapq.heappop(yigin)
+            if m > mesafe[i]:
+                continue
+            sonraki = m + maliyet[i]
+            for d in self.yonler:
+                j = i + d
+                if maliyet[j] and sonraki < mesafe[j]:
+                    mesafe[j] = sonraki
+                    heapq.heappush(yigin, (sonraki, j))
+
+    def indeks(self, x: int, y: int) -> int:
+        """Harita koordinatını ızgara indeksine çevir"""
+        return (y + 1) * self.genislik + (x + 1)
+
+    def _icinde_mi(self, x: int, y: int) -> bool:
+        return 0 <= x < self.genislik - 2 and 0 <= y < self.yukseklik - 2
+
+    def mesafe(self, x: int, y: int) -> float:
+        """(x, y)'den en yakın hedefe en ucuz yolun maliyeti (O(1))"""
+        if not self._icinde_mi(x, y):
+            return SONSUZ
+        return self.mesafeler[self.indeks(x, y)]
+
+    def _sonraki(self, i: int) -> Optional[int]:
+        """i'den bir adım sonra girilecek hücre (hedefteyse ya da yol yoksa None)"""
+        mesafe, maliyet = self.mesafeler, self.maliyetler
+        if mesafe[i] in (0, SONSUZ):
+            return None
+        for d in self.yonler:
+            j = i + d
+            if maliyet[j] and mesafe[j] + maliyet[j] == mesafe[i]:
+                return j
+        return None
+
+    def sonraki_adim(self, x: int, y: int) -> Optional[str]:
+        """(x, y)'den hedefe doğru sıradaki hamle (W/A/S/D ya da None)"""
+        if not self._icinde_mi(x, y):
+            return None
+        j = self._sonraki(self.indeks(x, y))
+        if j is None:
+            return None
+        g = self.genislik
+        return YON_KOMUTLARI[(j % g - 1 - x, j // g - 1 - y)]
+
+    def yol(self, x: int, y: int) -> List[Tuple[int, int]]:
+        """(x, y)'den sonra girilecek hücreler, hedef dahil (yol yoksa boş)"""
+        if not self._icinde_mi(x, y):
+            return []
+        g = self.genislik
+        yol = []
+        i = self._sonraki(self.indeks(x, y))
+        while i is not None:
+            yol.append((i % g - 1, i // g - 1))
+            i = self._sonraki(i)
+        return yol
+
+
+class YolBulucu:
+    """OyunMotoru üzerinde önbellekli mesafe alanı servisi
+
+    Anahtar: (motorun içerik özeti, harita boyutu, hedef). İçerik özeti
+    oyuncunun yerini içermez; bir alan ancak bir nesne itildiğinde,
+    toplanabilir bir öğe alındığında ya da hedef örtüldüğünde geçersiz olur.
+    Aynı içerikteki farklı motorlar (ör. yeniden başlatılan oyun) alanları
+    paylaşır.
+    """
+
+    def __init__(self, karakter_sistemi: KarakterAnlamSistemi,
+                 kapasite: int = ONBELLEK_KAPASITESI):
+        self.karakter_sistemi = karakter_sistemi
+        self.kapasite = kapasite
+        self._alanlar: "OrderedDict[tuple, MesafeAlani]" = OrderedDict()
+        self._maliyetler: Dict[str, int] = {}
+        self._tablo_surumu: Optional[Tuple[int, int]] = None
+        self.isabet = 0
+        self.iskalama = 0
+
+    def _maliyetleri_al(self) -> Dict[str, int]:
+        """Maliyet tablosu (karakter sistemi değişince yeniden kurulur)"""
+        sistem = self.karakter_sistemi
+        surum = (sistem.surum, len(sistem.id_karakterleri))
+        if surum != self._tablo_surumu:
+            self._maliyetler = maliyet_tablosu(sistem)
+            self._tablo_surumu = surum
+            self._alanlar.clear()
+        return self._maliyetler
+
+    def _hedef_karakterleri(self, hedef: str) -> set:
+        """Özellik adına uyan karakterler; özellik değilse karakterin kendisi"""
+        karakterler = set(self.karakter_sistemi.ozellik_ile_ara(hedef))
+        return karakterler or {hedef}
+
+    def _hedef_konumlari(self, harita, hedef: HedefTanimi) -> List[Tuple[int, int]]:
+        if isinstance(hedef, tuple):
+            return [hedef]
+        karakterler = self._hedef_karakterleri(hedef)
+        return [(x, y) for y, satir in enumerate(harita)
+                for x, karakter in enumerate(satir) if karakter in karakterler]
+
+    def mesafe_alani(self, motor, hedef: HedefTanimi = VARSAYILAN_HEDEF) -> MesafeAlani:
+        """Motorun güncel haritası için hedefin mesafe alanı (önbellekten)"""
+        maliyetler = self._maliyetleri_al()
+        harita = motor.harita
+        anahtar = (motor.icerik_ozeti(), len(harita), len(harita[0]) if len(harita) else 0,
+                   hedef)
+        alan = self._alanlar.get(anahtar)
+        if alan is not None:
+            self._alanlar.move_to_end(anahtar)
+            self.isabet += 1
+            return alan
+
+        self.iskalama += 1
+        alan = MesafeAlani(harita, maliyetler, self._hedef_konumlari(harita, hedef))
+        self._alanlar[anahtar] = alan
+        if len(self._alanlar) > self.kapasite:
+            self._alanlar.popitem(last=False)
+        return alan
+
+    def ipucu(self, motor, hedef: HedefTanimi = VARSAYILAN_HEDEF) -> Ipucu:
+        """Oyuncunun konumundan hedefe sıradaki hamle, maliyet ve yol"""
+        alan = self.mesafe_alani(motor, hedef)
+        x, y = motor.oyuncu_x, motor.oyuncu_y
+        return Ipucu(alan.sonraki_adim(x, y), alan.mesafe(x, y), alan.yol(x, y))
+
+    def temizle(self):
+        """Önbelleği boşalt"""
+        self._alanlar.clear()
+
+
+# Karakter sistemi başına paylaşılan servisler (sistem silinince düşer)
+_PAYLASILAN_BULUCULAR: "weakref.WeakKeyDictionary[KarakterAnlamSistemi, YolBulucu]" = \
+    weakref.WeakKeyDictionary()
+
+
+def paylasilan_yol_bulucu(karakter_sistemi: KarakterAnlamSistemi) -> YolBulucu:
+    """Aynı karakter sistemini kullanan motorların ortak yol bulucusu"""
+    bulucu = _PAYLASILAN_BULUCULAR.get(karakter_sistemi)
+    if bulucu is None:
+        bulucu = _PAYLASILAN_BULUCULAR[karakter_sistemi] = YolBulucu(karakter_sistemi)
+    return bulucu
+
+
+def main():
+    """Örnek paketteki seviyelerde hedef, anahtar ve enerjiye ipucu göster"""
+    from game_lab import paylasilan_sistem
+    from harita_katalogu import HaritaKatalogu
+    from oyun_motoru import OyunMotoru
+
+    sistem = paylasilan_sistem()
+    bulucu = paylasilan_yol_bulucu(sistem)
+    katalog = HaritaKatalogu()
+    for girdi in katalog:
+        bilgi = katalog.bilgi_yukle(girdi)
+        motor = OyunMotoru(bilgi["harita"], sistem, hedefler=bilgi.get("hedefler"))
+        for hedef in (VARSAYILAN_HEDEF, "Anahtar", "Enerji"):
+            ipucu = bulucu.ipucu(motor, hedef)
+            if ipucu.mesafe == SONSUZ:
+                continue
+            print(f"{girdi.isim:<28} {hedef:<8} → {ipucu.komut or '-'} "
+                  f"(maliyet {ipucu.mesafe:g}, {len(ipucu.yol)} adım)")
+
+if __name__ == "__main__":
+    main()